@@ -3,6 +3,27 @@ from datetime import date, time, datetime
 from typing import Optional
 
 
+def validate_title(title: str) -> None:
+    """タイトルのバリデーション"""
+    if not title or len(title.strip()) == 0:
+        raise ValueError("Title cannot be empty")
+    if len(title) > 255:
+        raise ValueError("Title cannot exceed 255 characters")
+
+
+def parse_time(time_str: Optional[str]) -> Optional[time]:
+    """HH:MM / HH:MM:SS の文字列をtimeオブジェクトに変換（形式・値が不正ならValueError）"""
+    if time_str is None:
+        return None
+    parts = time_str.split(":")
+    try:
+        if len(parts) in (2, 3):
+            return time(*(int(part) for part in parts))
+    except ValueError:
+        pass
+    raise ValueError("Deadline must be in HH:MM or HH:MM:SS format")
+
+
 @dataclass
 class Task:
     """タスクエンティティ（ドメインモデル）"""
@@ -15,10 +36,8 @@ class Task:
     order_index: int
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
+    version: int = 1
 
     def __post_init__(self):
         """バリデーション"""
-        if not self.title or len(self.title.strip()) == 0:
-            raise ValueError("Title cannot be empty")
-        if len(self.title) > 255:
-            raise ValueError("Title cannot exceed 255 characters")
+        validate_title(self.title)
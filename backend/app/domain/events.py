@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+from app.domain.entities import Task
+
+
+# 変更通知の種類
+EVENT_CREATE = "create"
+EVENT_UPDATE = "update"
+EVENT_DELETE = "delete"
+# 日付内の順序値のみの変更（order: [(id, order_index, version), ...]）
+EVENT_REORDER = "reorder"
+# 差分を送らない変更（一括インポート・順序の振り直しなど）。クライアントは日付を再取得する
+EVENT_INVALIDATE = "invalidate"
+
+
+@dataclass(frozen=True)
+class TaskChangeEvent:
+    """コミット済みのタスクの変更（購読中の日付のクライアントに差分として配信する）"""
+    type: str
+    date: date
+    task: Optional[Task] = None
+    task_id: Optional[int] = None
+    order: Optional[Tuple[Tuple[int, int, int], ...]] = None
+
+
+def reorder_event(task_date: date, tasks: Iterable[Task]) -> TaskChangeEvent:
+    """タスクの順序値から並び替えの通知を作成"""
+    return TaskChangeEvent(
+        type=EVENT_REORDER,
+        date=task_date,
+        order=tuple((task.id, task.order_index, task.version) for task in tasks),
+    )
+
+
+class TaskEventPublisher(ABC):
+    """タスクの変更通知の発行先インターフェース（プロセス内のバス・外部ブローカーで差し替え可能）"""
+
+    @abstractmethod
+    def publish(self, events: List[TaskChangeEvent]) -> None:
+        """コミット済みの変更を通知（購読者の処理を待たずに戻る）"""
+        pass
+
+
+def publish_events(publisher: Optional[TaskEventPublisher], events: List[TaskChangeEvent]) -> None:
+    """コミット後の変更を通知（発行先が設定されていなければ何もしない）"""
+    if publisher is not None and events:
+        publisher.publish(events)
@@ -0,0 +1,50 @@
+class TaskNotFoundError(ValueError):
+    """対象のタスクが存在しない"""
+    pass
+
+
+class VersionConflictError(Exception):
+    """楽観的排他制御でバージョンが一致しなかった（他の更新が先に反映された）"""
+
+    def __init__(self, task_id: int, expected_version: int, current_version: int):
+        super().__init__(
+            f"Task with id {task_id} was modified (expected version {expected_version}, "
+            f"current version {current_version})"
+        )
+        self.task_id = task_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+class ChangeCursorExpiredError(Exception):
+    """差分同期のカーソルが圧縮済みの範囲より古い（削除記録が失われているため全件の再取得が必要）"""
+
+    def __init__(self, cursor_seq: int, compacted_seq: int):
+        super().__init__(
+            f"Change cursor {cursor_seq} is older than the compacted horizon {compacted_seq}; "
+            "fetch all tasks again"
+        )
+        self.cursor_seq = cursor_seq
+        self.compacted_seq = compacted_seq
+
+
+class JobNotFoundError(ValueError):
+    """対象のジョブが存在しない"""
+    pass
+
+
+class JobFinishedError(Exception):
+    """終了済みのジョブはキャンセルできない"""
+
+    def __init__(self, job_id: str, status: str):
+        super().__init__(f"Job {job_id} has already finished ({status})")
+        self.job_id = job_id
+        self.status = status
+
+
+class JobCancelledError(Exception):
+    """実行中のジョブにキャンセルが要求された（ジョブの処理を中断する）"""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Job {job_id} was cancelled")
+        self.job_id = job_id
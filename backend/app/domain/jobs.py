@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+# ジョブの状態
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+# 終了した状態（これ以上変わらない）
+JOB_FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+
+@dataclass
+class Job:
+    """バックグラウンドジョブ（インポート・アーカイブなど時間のかかる処理をリクエストの外で実行する）"""
+    id: str
+    type: str
+    status: str
+    params: Dict[str, Any]
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    # 進捗（処理済みの件数, 全体の件数。全体が分からなければNone）
+    progress_done: int
+    progress_total: Optional[int]
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    # 待機中のジョブを実行できる日時（再試行の待ち時間）
+    run_after: datetime
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JOB_FINISHED_STATUSES
@@ -0,0 +1,42 @@
+import os
+from typing import Optional
+
+# 順序付けモード（dense: 0,1,2...の連番 / gap: 間隔を空けた疎な値）
+ORDER_MODE = os.getenv("TASK_ORDER_MODE", "dense")
+
+# gapモードで隣接タスク間に空ける間隔
+ORDER_GAP = 1024
+
+# 隙間がこの値を下回ったらバックグラウンドで振り直す
+MIN_ORDER_GAP = 4
+
+# order_index列（INT）に格納できる範囲
+MIN_ORDER_INDEX = -2**31
+MAX_ORDER_INDEX = 2**31 - 1
+
+
+def order_step(mode: str) -> int:
+    """モードごとの隣接タスク間の間隔"""
+    return ORDER_GAP if mode == "gap" else 1
+
+
+def rank_between(before: Optional[int], after: Optional[int], step: int = ORDER_GAP) -> Optional[int]:
+    """前後の順序値の間に入る順序値を返す（隙間がなければNone）"""
+    if before is None and after is None:
+        return 0
+    if before is None:
+        return after - step
+    if after is None:
+        return before + step
+    if after - before < 2:
+        return None
+    return (before + after) // 2
+
+
+def is_gap_thin(before: Optional[int], rank: int, after: Optional[int]) -> bool:
+    """挿入後の前後の隙間が閾値を下回るか"""
+    if before is not None and rank - before < MIN_ORDER_GAP:
+        return True
+    if after is not None and after - rank < MIN_ORDER_GAP:
+        return True
+    return False
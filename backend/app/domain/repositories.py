@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import date
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from datetime import date, datetime
 from app.domain.entities import Task
+from app.domain.jobs import Job
 
 
 class TaskRepository(ABC):
@@ -12,6 +13,129 @@ class TaskRepository(ABC):
         """日付でタスクを取得"""
         pass
 
+    @abstractmethod
+    def get_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Task]:
+        """期間内のタスクを日付・順序順で取得"""
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Task]:
+        """条件に合う全タスクを(date, order_index, id)順に少しずつ取得"""
+        pass
+
+    @abstractmethod
+    def get_rows_by_date(
+        self, task_date: date, show_completed: bool = True, fingerprint: Optional[Hashable] = None
+    ) -> List[Dict[str, Any]]:
+        """日付でタスクを列の辞書として取得（検証済みのDBの値をそのまま返す読み取り専用経路）
+
+        fingerprintは呼び出し側が直前に読んだ一覧の集計値（ETagの元）。キャッシュする実装は、
+        同じ集計値のときに保存した行だけを返す。
+        """
+        pass
+
+    @abstractmethod
+    def get_rows_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Dict[str, Any]]:
+        """期間内のタスクを列の辞書として取得（読み取り専用経路）"""
+        pass
+
+    @abstractmethod
+    def iter_all_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """条件に合う全タスクを列の辞書として少しずつ取得（読み取り専用経路）"""
+        pass
+
+    @abstractmethod
+    def search_rows(
+        self,
+        terms: List[str],
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """全語を含むタスクを関連度（score）の降順・ID降順に列の辞書として取得
+
+        afterには前ページ最後の(score, id)を渡す（キーセットページング）。
+        """
+        pass
+
+    @abstractmethod
+    def stamp_changes(self) -> int:
+        """未採番の作成・更新・削除に変更カーソルを付け、件数を返す（差分の読み取りの前に呼ぶ）"""
+        pass
+
+    @abstractmethod
+    def get_change_horizon(self) -> Tuple[int, int]:
+        """（コミット済みの最新の変更カーソル, 圧縮済みの変更カーソル）を取得"""
+        pass
+
+    @abstractmethod
+    def get_changes(
+        self,
+        after: Optional[Tuple[int, int]],
+        upto: int,
+        limit: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """(change_seq, id)がafterより後でupto以下の作成・更新・削除を変更カーソル順に取得"""
+        pass
+
+    @abstractmethod
+    def purge_tombstones(self, deleted_before: datetime) -> int:
+        """deleted_beforeより前の削除記録を削除し、件数を返す"""
+        pass
+
+    @abstractmethod
+    def get_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """期間内の日付ごとの集計（date, total, completed, with_deadline）を集計テーブルから取得"""
+        pass
+
+    @abstractmethod
+    def count_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """期間内の日付ごとの集計をタスクから数える"""
+        pass
+
+    @abstractmethod
+    def get_stats_date_bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        """タスクと集計テーブルにある最小・最大の日付"""
+        pass
+
+    @abstractmethod
+    def rebuild_daily_stats(self, start_date: date, end_date: date) -> int:
+        """期間内の集計をタスクから作り直し、作成した行数を返す"""
+        pass
+
+    @abstractmethod
+    def count_archivable(self, before: date) -> Tuple[int, Optional[date], Optional[date]]:
+        """beforeより前の日付の完了済みタスクの（件数, 最初の日付, 最後の日付）を取得"""
+        pass
+
+    @abstractmethod
+    def archive_completed(
+        self, before: date, limit: int, after: Optional[Tuple[date, int]] = None
+    ) -> Tuple[int, Optional[Tuple[date, int]]]:
+        """beforeより前の日付の完了済みタスクを(date, id)がafterより後から最大limit件アーカイブし、
+        （移した件数, 最後に移したタスクの(date, id)）を返す（アーカイブ済みのタスクも読み取りには含まれる）"""
+        pass
+
     @abstractmethod
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """IDでタスクを取得"""
@@ -22,11 +146,23 @@ class TaskRepository(ABC):
         """タスクを作成"""
         pass
 
+    @abstractmethod
+    def append(self, task: Task, step: int) -> Task:
+        """日付の末尾にタスクを作成（order_indexは挿入と同じトランザクション内で採番）"""
+        pass
+
     @abstractmethod
     def update(self, task: Task) -> Task:
         """タスクを更新"""
         pass
 
+    @abstractmethod
+    def patch(
+        self, task_id: int, changes: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Task:
+        """指定した列のみを更新（expected_versionと現在のバージョンが異なればVersionConflictError）"""
+        pass
+
     @abstractmethod
     def delete(self, task_id: int) -> None:
         """タスクを削除"""
@@ -36,3 +172,188 @@ class TaskRepository(ABC):
     def update_order(self, task_id: int, order_index: int) -> Task:
         """タスクの順序を更新"""
         pass
+
+    @abstractmethod
+    def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """複数IDでタスクを一括取得"""
+        pass
+
+    @abstractmethod
+    def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        """日付ごとの最大order_indexを一括取得（タスクがない日付はNone）"""
+        pass
+
+    @abstractmethod
+    def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        """一覧の変更検知用の集計値（件数, 最終更新日時, 日付のリビジョン）を取得"""
+        pass
+
+    @abstractmethod
+    def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """表示位置positionの前後にあるタスクのorder_indexを取得"""
+        pass
+
+    @abstractmethod
+    def rebalance_order(self, task_date: date, step: int) -> None:
+        """現在の並び順を保ったままorder_indexを一定間隔で振り直す"""
+        pass
+
+    @abstractmethod
+    def apply_batch(
+        self,
+        creates: List[Task],
+        updates: List[Task],
+        delete_ids: List[int],
+        delete_dates: Sequence[date] = (),
+    ) -> Tuple[List[Task], List[Task]]:
+        """作成・更新・削除を1トランザクションで一括適用（作成結果, 更新結果）を返す
+
+        delete_datesの日付のタスクは、作成より前に同じトランザクション内で全て削除する（日付の置き換え用）。
+        """
+        pass
+
+    @abstractmethod
+    def insert_many(self, tasks: List[Task]) -> int:
+        """タスクを一括挿入して件数を返す（作成結果は返さない）"""
+        pass
+
+    @abstractmethod
+    def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        """日付内のタスク順序を一括で書き換え（task_idsの並び順でorder_indexを振り直す）"""
+        pass
+
+
+class AsyncTaskRepository(ABC):
+    """非同期タスクリポジトリインターフェース"""
+
+    @abstractmethod
+    async def get_by_date(self, task_date: date, show_completed: bool = True) -> List[Task]:
+        """日付でタスクを取得"""
+        pass
+
+    @abstractmethod
+    async def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        """一覧の変更検知用の集計値（件数, 最終更新日時, 日付のリビジョン）を取得"""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """IDでタスクを取得"""
+        pass
+
+    @abstractmethod
+    async def create(self, task: Task) -> Task:
+        """タスクを作成"""
+        pass
+
+    @abstractmethod
+    async def append(self, task: Task, step: int) -> Task:
+        """日付の末尾にタスクを作成（order_indexは挿入と同じトランザクション内で採番）"""
+        pass
+
+    @abstractmethod
+    async def update(self, task: Task) -> Task:
+        """タスクを更新"""
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: int) -> None:
+        """タスクを削除"""
+        pass
+
+    @abstractmethod
+    async def update_order(self, task_id: int, order_index: int) -> Task:
+        """タスクの順序を更新"""
+        pass
+
+    @abstractmethod
+    async def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        """日付ごとの最大order_indexを一括取得（タスクがない日付はNone）"""
+        pass
+
+    @abstractmethod
+    async def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """表示位置positionの前後にあるタスクのorder_indexを取得"""
+        pass
+
+    @abstractmethod
+    async def rebalance_order(self, task_date: date, step: int) -> None:
+        """現在の並び順を保ったままorder_indexを一定間隔で振り直す"""
+        pass
+
+    @abstractmethod
+    async def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        """日付内のタスク順序を一括で書き換え（task_idsの並び順でorder_indexを振り直す）"""
+        pass
+
+
+class JobRepository(ABC):
+    """バックグラウンドジョブのリポジトリインターフェース（各操作は個別にコミットする）"""
+
+    @abstractmethod
+    def create(self, job_type: str, params: Dict[str, Any], max_attempts: int) -> Job:
+        """待機中のジョブを作成"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """IDでジョブを取得"""
+        pass
+
+    @abstractmethod
+    def list_recent(self, limit: int, status: Optional[str] = None) -> List[Job]:
+        """新しい順にジョブを取得"""
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """実行できる待機中のジョブを1件取得して実行中にする（他のワーカーと同じジョブを取得しない）"""
+        pass
+
+    @abstractmethod
+    def report_progress(self, job_id: str, done: int, total: Optional[int]) -> bool:
+        """進捗を記録し、キャンセルが要求されているかを返す"""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, job_ids: List[str]) -> None:
+        """実行中のジョブの生存時刻を更新"""
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """ジョブを成功で終了"""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str, retry_at: Optional[datetime] = None) -> None:
+        """ジョブを失敗で終了（retry_at指定時はその日時以降に再実行する待機中に戻す）"""
+        pass
+
+    @abstractmethod
+    def mark_cancelled(self, job_id: str) -> None:
+        """実行中に中断したジョブをキャンセル済みにする"""
+        pass
+
+    @abstractmethod
+    def request_cancel(self, job_id: str) -> Optional[Job]:
+        """キャンセルを要求（待機中はその場でキャンセル済み、実行中は中断を要求）。更新後のジョブを返す"""
+        pass
+
+    @abstractmethod
+    def requeue_stale(self, heartbeat_before: datetime) -> int:
+        """生存時刻が途絶えた実行中のジョブを再試行（試行回数が残っていなければ失敗）にして件数を返す"""
+        pass
+
+    @abstractmethod
+    def purge_finished(self, finished_before: datetime) -> int:
+        """終了から時間が経ったジョブを削除して件数を返す"""
+        pass
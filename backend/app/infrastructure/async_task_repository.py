@@ -0,0 +1,297 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from datetime import date, datetime
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities import Task
+from app.domain.ordering import rank_between
+from app.domain.repositories import AsyncTaskRepository
+from app.infrastructure.models import DailyTaskStatsModel, TaskArchiveModel, TaskModel
+from app.infrastructure.task_repository import (
+    DATE_ROWS_STATEMENTS, archived_dates_statement, bump_revisions_statement, list_fingerprint_statement,
+    model_columns, refresh_daily_stats_statements, restore_archived_statements, task_dates_statement,
+    tombstones_statement, visible_tasks,
+)
+
+
+class AsyncSQLAlchemyTaskRepository(AsyncTaskRepository):
+    """SQLAlchemy（AsyncSession）を使用した非同期タスクリポジトリ実装"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _to_entity(self, model: TaskModel) -> Task:
+        """データベースモデルをエンティティに変換"""
+        return Task(
+            id=model.id,
+            date=model.date,
+            title=model.title,
+            memo=model.memo,
+            deadline=model.deadline,
+            completed=model.completed,
+            order_index=model.order_index,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            version=model.version,
+        )
+
+    async def _get_model(self, task_id: int) -> Optional[TaskModel]:
+        """IDでデータベースモデルを取得"""
+        result = await self.db.execute(select(TaskModel).where(TaskModel.id == task_id))
+        return result.scalar_one_or_none()
+
+    async def _bump_revisions(self, task_dates: Iterable[date]) -> None:
+        """書き込む日付のリビジョンを進めてロックする（一覧のETag用。tasksを読み書きする前に呼ぶ）"""
+        task_dates = set(task_dates)
+        if task_dates:
+            await self.db.execute(bump_revisions_statement(self.db.bind.dialect.name, task_dates))
+
+    async def _lock_task_dates(
+        self, task_ids: List[int], task_dates: Iterable[date] = ()
+    ) -> Tuple[Set[date], Set[date]]:
+        """IDのタスクの日付とtask_datesのリビジョンを進めてロック（書き込みの最初に呼ぶ）
+
+        （ロックした日付, IDのタスクのうちアーカイブ済みのものの日付）を返す。
+        """
+        locked_dates = set(task_dates)
+        archived_dates = set()
+        if task_ids:
+            for row in await self.db.execute(task_dates_statement(task_ids)):
+                locked_dates.add(row.date)
+                if row.archived:
+                    archived_dates.add(row.date)
+        await self._bump_revisions(locked_dates)
+        return locked_dates, archived_dates
+
+    async def _refresh_stats(self, task_dates: List[date]) -> None:
+        """変更した日付の集計を数え直す（ダッシュボード用。tasksへの書き込みの後に呼ぶ）"""
+        task_dates = set(task_dates)
+        if not task_dates:
+            return
+        await self.db.flush()
+        for statement in refresh_daily_stats_statements(
+            DailyTaskStatsModel.date.in_(task_dates), lambda model: model.date.in_(task_dates)
+        ):
+            await self.db.execute(statement)
+
+    async def _restore_archived(self, condition) -> None:
+        """条件に合うアーカイブ済みタスクの日付をtasksに戻す（_bump_revisionsの後、書き込みの前に呼ぶ）"""
+        result = await self.db.execute(archived_dates_statement(condition))
+        await self._restore_archived_dates(result.scalars().all())
+
+    async def _restore_archived_dates(self, task_dates: Iterable[date]) -> None:
+        """アーカイブ済みと分かっている日付のタスクをtasksに戻す（日付がなければ何もしない）"""
+        task_dates = set(task_dates)
+        if task_dates:
+            for statement in restore_archived_statements(task_dates):
+                await self.db.execute(statement)
+
+    async def get_by_date(self, task_date: date, show_completed: bool = True) -> List[Task]:
+        """日付でタスクを取得（アーカイブ済みのタスクを含む）"""
+        result = await self.db.execute(DATE_ROWS_STATEMENTS[show_completed], {"task_date": task_date})
+        return [Task(**row) for row in result.mappings()]
+
+    async def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        """一覧の変更検知用の集計値（件数, 最終更新日時, 日付のリビジョン）を1クエリで取得"""
+        result = await self.db.execute(list_fingerprint_statement(task_date, show_completed))
+        count, last_updated, current_revision = result.one()
+        return count, last_updated, current_revision or 0
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """IDでタスクを取得（tasksになければアーカイブから取得）"""
+        task = await self._get_model(task_id)
+        if task:
+            return self._to_entity(task)
+        result = await self.db.execute(
+            select(*model_columns(TaskArchiveModel)).where(TaskArchiveModel.id == task_id)
+        )
+        row = result.mappings().first()
+        return Task(**row) if row else None
+
+    async def create(self, task: Task) -> Task:
+        """タスクを作成"""
+        await self._bump_revisions([task.date])
+        await self._restore_archived(TaskArchiveModel.date == task.date)
+        model = TaskModel(
+            date=task.date,
+            title=task.title,
+            memo=task.memo,
+            deadline=task.deadline,
+            completed=task.completed,
+            order_index=task.order_index,
+        )
+        self.db.add(model)
+        await self._refresh_stats([task.date])
+        await self.db.commit()
+        await self.db.refresh(model)
+        return self._to_entity(model)
+
+    async def append(self, task: Task, step: int) -> Task:
+        """日付の末尾にタスクを作成（最大order_index + stepを挿入と同じトランザクションで採番）"""
+        try:
+            # 日付のリビジョン行のロックで同じ日付への並行作成を直列化する
+            await self._bump_revisions([task.date])
+            await self._restore_archived(TaskArchiveModel.date == task.date)
+            result = await self.db.execute(
+                select(TaskModel.order_index)
+                .where(TaskModel.date == task.date)
+                .order_by(TaskModel.order_index.desc())
+                .limit(1)
+                .with_for_update()
+            )
+            model = TaskModel(
+                date=task.date,
+                title=task.title,
+                memo=task.memo,
+                deadline=task.deadline,
+                completed=task.completed,
+                order_index=rank_between(result.scalar_one_or_none(), None, step),
+            )
+            self.db.add(model)
+            await self._refresh_stats([task.date])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        await self.db.refresh(model)
+        return self._to_entity(model)
+
+    async def update(self, task: Task) -> Task:
+        """タスクを更新"""
+        locked_dates, _ = await self._lock_task_dates([task.id], [task.date])
+        await self._restore_archived(or_(TaskArchiveModel.id == task.id, TaskArchiveModel.date == task.date))
+        model = await self._get_model(task.id)
+        if not model:
+            await self.db.rollback()
+            raise ValueError(f"Task with id {task.id} not found")
+        old_date = model.date
+        model.date = task.date
+        model.title = task.title
+        model.memo = task.memo
+        model.deadline = task.deadline
+        model.completed = task.completed
+        model.order_index = task.order_index
+        model.version = TaskModel.version + 1
+        # ロックの後に日付が移っていた場合（並行した日付の移動）はその日付もロックする
+        await self._bump_revisions({old_date} - locked_dates)
+        await self._refresh_stats([old_date, task.date])
+        await self.db.commit()
+        await self.db.refresh(model)
+        return self._to_entity(model)
+
+    async def delete(self, task_id: int) -> None:
+        """タスクを削除"""
+        locked_dates, archived_dates = await self._lock_task_dates([task_id])
+        await self._restore_archived_dates(archived_dates)
+        task = await self._get_model(task_id)
+        if task:
+            await self._bump_revisions({task.date} - locked_dates)
+            await self.db.execute(tombstones_statement(TaskModel.id == task_id))
+            await self.db.delete(task)
+            await self._refresh_stats([task.date])
+            await self.db.commit()
+        else:
+            await self.db.rollback()
+
+    async def update_order(self, task_id: int, order_index: int) -> Task:
+        """タスクの順序を更新"""
+        locked_dates, archived_dates = await self._lock_task_dates([task_id])
+        await self._restore_archived_dates(archived_dates)
+        task = await self._get_model(task_id)
+        if not task:
+            await self.db.rollback()
+            raise ValueError(f"Task with id {task_id} not found")
+        await self._bump_revisions({task.date} - locked_dates)
+        task.order_index = order_index
+        task.version = TaskModel.version + 1
+        await self.db.commit()
+        await self.db.refresh(task)
+        return self._to_entity(task)
+
+    async def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        """日付ごとの最大order_indexを一括取得（アーカイブ済みのタスクを含む）"""
+        if not task_dates:
+            return {}
+        tasks = visible_tasks(lambda model: model.date.in_(task_dates), ("date", "order_index"))
+        result = await self.db.execute(
+            select(tasks.c.date, func.max(tasks.c.order_index)).group_by(tasks.c.date)
+        )
+        max_indexes: Dict[date, Optional[int]] = {task_date: None for task_date in task_dates}
+        max_indexes.update({task_date: max_index for task_date, max_index in result.all()})
+        return max_indexes
+
+    async def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """表示位置positionの前後にあるタスクのorder_indexを取得（アーカイブ済みのタスクを含む並び順）"""
+        def condition(model):
+            if exclude_id is None:
+                return model.date == task_date
+            return and_(model.date == task_date, model.id != exclude_id)
+
+        tasks = visible_tasks(condition, ("id", "order_index"))
+        stmt = select(tasks.c.order_index).order_by(tasks.c.order_index, tasks.c.id)
+
+        if position <= 0:
+            first = (await self.db.execute(stmt.limit(1))).scalar_one_or_none()
+            return None, first
+
+        rows = (await self.db.execute(stmt.offset(position - 1).limit(2))).scalars().all()
+        if not rows:
+            # 末尾より後ろの位置は末尾への追加として扱う
+            return (await self.get_max_order_indexes([task_date]))[task_date], None
+        return rows[0], rows[1] if len(rows) > 1 else None
+
+    async def _write_order(self, task_date: date, task_ids: List[int], step: int) -> None:
+        """task_idsの並び順でorder_indexを1つのUPDATE文で書き換え（コミットはしない）"""
+        if not task_ids:
+            return
+        await self.db.execute(
+            update(TaskModel)
+            .where(TaskModel.date == task_date, TaskModel.id.in_(task_ids))
+            .values(
+                order_index=case(
+                    {task_id: index * step for index, task_id in enumerate(task_ids)},
+                    value=TaskModel.id,
+                ),
+                version=TaskModel.version + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def rebalance_order(self, task_date: date, step: int) -> None:
+        """現在の並び順を保ったままorder_indexを一定間隔で振り直す"""
+        try:
+            await self._bump_revisions([task_date])
+            await self._restore_archived(TaskArchiveModel.date == task_date)
+            result = await self.db.execute(
+                select(TaskModel.id)
+                .where(TaskModel.date == task_date)
+                .order_by(TaskModel.order_index, TaskModel.id)
+                .with_for_update()
+            )
+            await self._write_order(task_date, list(result.scalars()), step)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+    async def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        """日付内のタスク順序を1つのUPDATE文で書き換え"""
+        try:
+            await self._bump_revisions([task_date])
+            await self._restore_archived(TaskArchiveModel.date == task_date)
+            # 日付内のタスクをロックしてIDの集合を検証
+            result = await self.db.execute(
+                select(TaskModel.id).where(TaskModel.date == task_date).with_for_update()
+            )
+            if set(result.scalars()) != set(task_ids):
+                raise ValueError(f"Task ids do not match the tasks on {task_date}")
+
+            await self._write_order(task_date, task_ids, step)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return await self.get_by_date(task_date)
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# タスク一覧キャッシュの設定（TASK_CACHE_SIZE=0 で無効化）
+TASK_CACHE_SIZE = int(os.getenv("TASK_CACHE_SIZE", "256"))
+TASK_CACHE_TTL = float(os.getenv("TASK_CACHE_TTL", "30"))
+
+
+class CacheBackend(ABC):
+    """キャッシュ保存先インターフェース（共有ストアへの差し替え用）
+
+    書き込みと読み込みの競合で古い値が残らないよう、キーごとに世代番号を持つ。
+    delete で世代を進め、set は読み込み開始時の世代と一致する場合のみ保存する。
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """値を取得（なければNone）"""
+        pass
+
+    @abstractmethod
+    def generation(self, key: Hashable) -> int:
+        """キーの現在の世代番号を取得"""
+        pass
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """世代番号が変わっていなければ値を保存"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """値を削除して世代を進める"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """全ての値を削除"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """ヒット数・ミス数などの統計を取得"""
+        pass
+
+
+class InMemoryLRUCache(CacheBackend):
+    """プロセス内のサイズ上限・TTL付きLRUキャッシュ"""
+
+    def __init__(self, max_size: int = TASK_CACHE_SIZE, ttl: float = TASK_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self, key: Hashable) -> int:
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+# プロセス共有のタスク一覧キャッシュ
+task_list_cache = InMemoryLRUCache()
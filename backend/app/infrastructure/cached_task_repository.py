@@ -0,0 +1,316 @@
+from copy import copy
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from app.domain.entities import Task
+from app.domain.repositories import AsyncTaskRepository, TaskRepository
+from app.infrastructure.cache import CacheBackend
+
+
+def invalidate_task_dates(cache: CacheBackend, task_dates: Iterable[date]) -> None:
+    """指定した日付のタスク一覧キャッシュを無効化"""
+    for task_date in set(task_dates):
+        for show_completed in (True, False):
+            cache.delete((task_date, show_completed))
+            cache.delete(("rows", task_date, show_completed))
+
+
+class CachedTaskRepository(TaskRepository):
+    """日付別タスク一覧をキャッシュするリポジトリデコレータ
+
+    get_by_date / get_rows_by_date の結果を (date, show_completed) 単位でキャッシュし、
+    その日付に触れる書き込み（日付をまたぐ移動を含む）で無効化する。
+    """
+
+    def __init__(self, repository: TaskRepository, cache: CacheBackend):
+        self.repository = repository
+        self.cache = cache
+        # このリポジトリで読み込んだタスクの日付（更新・削除時の旧日付の無効化に使う）
+        self._known_dates: Dict[int, date] = {}
+
+    def _remember(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            self._known_dates[task.id] = task.date
+
+    def _invalidate(self, task_dates: Iterable[date]) -> None:
+        invalidate_task_dates(self.cache, task_dates)
+
+    def _stored_dates(self, task_ids: List[int]) -> List[date]:
+        """更新・削除前の日付を取得（未読み込みのタスクのみ問い合わせる）"""
+        unknown_ids = [task_id for task_id in task_ids if task_id not in self._known_dates]
+        if unknown_ids:
+            self._remember(self.repository.get_by_ids(unknown_ids))
+        return [self._known_dates[task_id] for task_id in task_ids if task_id in self._known_dates]
+
+    def get_by_date(self, task_date: date, show_completed: bool = True) -> List[Task]:
+        """日付でタスクを取得（キャッシュ経由）"""
+        key = (task_date, show_completed)
+        cached = self.cache.get(key)
+        if cached is None:
+            generation = self.cache.generation(key)
+            cached = tuple(self.repository.get_by_date(task_date, show_completed))
+            self.cache.set(key, cached, generation)
+        # 呼び出し側でエンティティを変更してもキャッシュに影響しないようコピーを返す
+        return [copy(task) for task in cached]
+
+    def get_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Task]:
+        return self.repository.get_by_date_range(start_date, end_date, show_completed)
+
+    def iter_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Task]:
+        return self.repository.iter_all(start_date, end_date, completed, batch_size)
+
+    def get_rows_by_date(
+        self, task_date: date, show_completed: bool = True, fingerprint: Optional[Hashable] = None
+    ) -> List[Dict[str, Any]]:
+        """日付でタスクを列の辞書として取得（キャッシュ経由、呼び出し側は変更しない前提）
+
+        行は読み込む前に呼び出し側が得た集計値と組で保存し、集計値が異なれば読み直す。書き込みの
+        コミットから無効化までの間に新しい集計値で古い行を返さない（古い行が新しいETagで返り、
+        以降の304で残り続けるのを防ぐ）。
+        """
+        key = ("rows", task_date, show_completed)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        generation = self.cache.generation(key)
+        rows = self.repository.get_rows_by_date(task_date, show_completed, fingerprint)
+        self.cache.set(key, (fingerprint, rows), generation)
+        return rows
+
+    def get_rows_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Dict[str, Any]]:
+        return self.repository.get_rows_by_date_range(start_date, end_date, show_completed)
+
+    def iter_all_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        return self.repository.iter_all_rows(start_date, end_date, completed, batch_size)
+
+    def search_rows(
+        self,
+        terms: List[str],
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.repository.search_rows(terms, limit, after, start_date, end_date, completed)
+
+    def stamp_changes(self) -> int:
+        # 変更カーソルは一覧に含まれないため、キャッシュは無効化しない
+        return self.repository.stamp_changes()
+
+    def get_change_horizon(self) -> Tuple[int, int]:
+        return self.repository.get_change_horizon()
+
+    def get_changes(
+        self,
+        after: Optional[Tuple[int, int]],
+        upto: int,
+        limit: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.repository.get_changes(after, upto, limit, start_date, end_date)
+
+    def purge_tombstones(self, deleted_before: datetime) -> int:
+        return self.repository.purge_tombstones(deleted_before)
+
+    def get_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        return self.repository.get_daily_stats(start_date, end_date)
+
+    def count_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        return self.repository.count_daily_stats(start_date, end_date)
+
+    def get_stats_date_bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        return self.repository.get_stats_date_bounds()
+
+    def rebuild_daily_stats(self, start_date: date, end_date: date) -> int:
+        return self.repository.rebuild_daily_stats(start_date, end_date)
+
+    def count_archivable(self, before: date) -> Tuple[int, Optional[date], Optional[date]]:
+        return self.repository.count_archivable(before)
+
+    def archive_completed(
+        self, before: date, limit: int, after: Optional[Tuple[date, int]] = None
+    ) -> Tuple[int, Optional[Tuple[date, int]]]:
+        # アーカイブしても読み取り結果は変わらないため、一覧のキャッシュは無効化しない
+        return self.repository.archive_completed(before, limit, after)
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        task = self.repository.get_by_id(task_id)
+        if task:
+            self._remember([task])
+        return task
+
+    def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        tasks = self.repository.get_by_ids(task_ids)
+        self._remember(tasks)
+        return tasks
+
+    def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        return self.repository.get_max_order_indexes(task_dates)
+
+    def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        return self.repository.get_list_fingerprint(task_date, show_completed)
+
+    def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        return self.repository.get_order_neighbors(task_date, position, exclude_id)
+
+    def create(self, task: Task) -> Task:
+        created = self.repository.create(task)
+        self._invalidate([created.date])
+        return created
+
+    def append(self, task: Task, step: int) -> Task:
+        created = self.repository.append(task, step)
+        self._invalidate([created.date])
+        return created
+
+    def update(self, task: Task) -> Task:
+        old_dates = self._stored_dates([task.id])
+        updated = self.repository.update(task)
+        self._invalidate(old_dates + [updated.date])
+        return updated
+
+    def patch(
+        self, task_id: int, changes: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Task:
+        # PATCHでは日付を変更しないため、更新後の日付だけを無効化すればよい
+        patched = self.repository.patch(task_id, changes, expected_version)
+        self._remember([patched])
+        self._invalidate([patched.date])
+        return patched
+
+    def delete(self, task_id: int) -> None:
+        old_dates = self._stored_dates([task_id])
+        self.repository.delete(task_id)
+        self._invalidate(old_dates)
+
+    def update_order(self, task_id: int, order_index: int) -> Task:
+        updated = self.repository.update_order(task_id, order_index)
+        self._invalidate([updated.date])
+        return updated
+
+    def rebalance_order(self, task_date: date, step: int) -> None:
+        self.repository.rebalance_order(task_date, step)
+        self._invalidate([task_date])
+
+    def apply_batch(
+        self,
+        creates: List[Task],
+        updates: List[Task],
+        delete_ids: List[int],
+        delete_dates: Sequence[date] = (),
+    ) -> Tuple[List[Task], List[Task]]:
+        old_dates = self._stored_dates([task.id for task in updates] + delete_ids)
+        created, updated = self.repository.apply_batch(creates, updates, delete_ids, delete_dates)
+        self._invalidate(old_dates + list(delete_dates) + [task.date for task in created + updated])
+        return created, updated
+
+    def insert_many(self, tasks: List[Task]) -> int:
+        count = self.repository.insert_many(tasks)
+        self._invalidate([task.date for task in tasks])
+        return count
+
+    def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        tasks = self.repository.reorder(task_date, task_ids, step)
+        self._invalidate([task_date])
+        return tasks
+
+
+class AsyncCachedTaskRepository(AsyncTaskRepository):
+    """非同期リポジトリの書き込みで同期版と共有の一覧キャッシュを無効化するデコレータ
+
+    非同期版の読み取りはキャッシュを使わないが、同じプロセスの同期版のエンドポイント（PATCH・
+    期間指定・エクスポートなど）はキャッシュから読むため、書き込んだ日付を同じ関数で無効化する。
+    """
+
+    def __init__(self, repository: AsyncTaskRepository, cache: CacheBackend):
+        self.repository = repository
+        self.cache = cache
+        # このリポジトリで読み込んだタスクの日付（削除時の旧日付の無効化に使う）
+        self._known_dates: Dict[int, date] = {}
+
+    def _invalidate(self, task_dates: Iterable[date]) -> None:
+        invalidate_task_dates(self.cache, task_dates)
+
+    async def _stored_dates(self, task_id: int) -> List[date]:
+        """更新・削除前の日付を取得（未読み込みのタスクのみ問い合わせる）"""
+        if task_id not in self._known_dates:
+            await self.get_by_id(task_id)
+        return [self._known_dates[task_id]] if task_id in self._known_dates else []
+
+    async def get_by_date(self, task_date: date, show_completed: bool = True) -> List[Task]:
+        return await self.repository.get_by_date(task_date, show_completed)
+
+    async def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        return await self.repository.get_list_fingerprint(task_date, show_completed)
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        task = await self.repository.get_by_id(task_id)
+        if task:
+            self._known_dates[task.id] = task.date
+        return task
+
+    async def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        return await self.repository.get_max_order_indexes(task_dates)
+
+    async def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        return await self.repository.get_order_neighbors(task_date, position, exclude_id)
+
+    async def create(self, task: Task) -> Task:
+        created = await self.repository.create(task)
+        self._invalidate([created.date])
+        return created
+
+    async def append(self, task: Task, step: int) -> Task:
+        created = await self.repository.append(task, step)
+        self._invalidate([created.date])
+        return created
+
+    async def update(self, task: Task) -> Task:
+        old_dates = await self._stored_dates(task.id)
+        updated = await self.repository.update(task)
+        self._invalidate(old_dates + [updated.date])
+        return updated
+
+    async def delete(self, task_id: int) -> None:
+        old_dates = await self._stored_dates(task_id)
+        await self.repository.delete(task_id)
+        self._invalidate(old_dates)
+
+    async def update_order(self, task_id: int, order_index: int) -> Task:
+        updated = await self.repository.update_order(task_id, order_index)
+        self._invalidate([updated.date])
+        return updated
+
+    async def rebalance_order(self, task_date: date, step: int) -> None:
+        await self.repository.rebalance_order(task_date, step)
+        self._invalidate([task_date])
+
+    async def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        tasks = await self.repository.reorder(task_date, task_ids, step)
+        self._invalidate([task_date])
+        return tasks
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, List, Set, Union
+
+from app.domain.events import TaskChangeEvent, TaskEventPublisher
+
+logger = logging.getLogger(__name__)
+
+# 購読者ごとに溜められる未送信の通知数（超えた購読者には再取得を指示する）
+EVENT_QUEUE_SIZE = int(os.getenv("TASK_EVENT_QUEUE_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class ResyncNotice:
+    """未送信の通知を破棄したことの通知（クライアントは購読中の日付を再取得する）"""
+    dates: FrozenSet[date]
+
+
+QueueItem = Union[TaskChangeEvent, ResyncNotice]
+
+
+class TaskEventSubscription:
+    """1クライアント分の購読（日付の集合と未送信の通知のキュー）
+
+    キューは購読したイベントループ上でのみ操作し、他のスレッドからの通知はcall_soon_threadsafeで渡す。
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, dates: Iterable[date], queue_size: int):
+        self.loop = loop
+        # 発行側のスレッドから参照されるため、変更時は集合ごと差し替える
+        self.dates: FrozenSet[date] = frozenset(dates)
+        self.queue: "asyncio.Queue[QueueItem]" = asyncio.Queue(maxsize=max(queue_size, 1))
+        self.dropped = 0
+
+    def offer(self, events: List[TaskChangeEvent]) -> None:
+        """通知をキューに渡す（任意のスレッドから呼べる。購読者の処理は待たない）"""
+        self.loop.call_soon_threadsafe(self._put, events)
+
+    def _put(self, events: List[TaskChangeEvent]) -> None:
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._overflow()
+                return
+
+    def _overflow(self) -> None:
+        """遅い購読者: 溜まった差分を捨てて再取得の指示1件に置き換える（メモリと発行側を守る）"""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(ResyncNotice(self.dates))
+        logger.info("task event subscriber fell behind; dropped %d events", self.dropped)
+
+    async def get(self) -> QueueItem:
+        return await self.queue.get()
+
+
+class InProcessTaskEventBus(TaskEventPublisher):
+    """プロセス内の変更通知バス
+
+    発行は購読者のキューに積むだけで戻る。複数プロセス・複数ワーカーで通知を共有する場合は、
+    publishで外部ブローカーに送り、受信側でsubscriptionに配るTaskEventPublisherに差し替える。
+    """
+
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscriptions: Set[TaskEventSubscription] = set()
+        self._lock = threading.Lock()
+        self._published = 0
+
+    def subscribe(self, dates: Iterable[date] = ()) -> TaskEventSubscription:
+        """購読を開始（イベントループ上で呼ぶ）"""
+        subscription = TaskEventSubscription(asyncio.get_running_loop(), dates, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TaskEventSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, events: List[TaskChangeEvent]) -> None:
+        """購読中の日付に一致する通知を各購読者のキューに渡す"""
+        if not events:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._published += len(events)
+        for subscription in subscriptions:
+            matched = [event for event in events if event.date in subscription.dates]
+            if not matched:
+                continue
+            try:
+                subscription.offer(matched)
+            except RuntimeError:
+                # イベントループが終了している（切断処理前にサーバーが停止した）
+                self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            published = self._published
+        return {
+            "subscribers": len(subscriptions),
+            "published": published,
+            "dropped": sum(subscription.dropped for subscription in subscriptions),
+        }
+
+
+# アプリ全体で共有するバス
+task_event_bus = InProcessTaskEventBus()
@@ -0,0 +1,208 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.domain.jobs import (
+    JOB_CANCELLED, JOB_FAILED, JOB_FINISHED_STATUSES, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, Job,
+)
+from app.domain.repositories import JobRepository
+from app.infrastructure.models import JobModel
+
+
+def utc_now() -> datetime:
+    """ジョブの日時（タイムゾーンなしのUTC。DBのタイムゾーン設定によらず比較できるようにアプリ側で決める）"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class SQLAlchemyJobRepository(JobRepository):
+    """SQLAlchemyを使用したジョブリポジトリ実装"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _to_entity(self, model: JobModel) -> Job:
+        """データベースモデルをエンティティに変換"""
+        return Job(
+            id=model.id,
+            type=model.type,
+            status=model.status,
+            params=model.params,
+            result=model.result,
+            error=model.error,
+            progress_done=model.progress_done,
+            progress_total=model.progress_total,
+            attempts=model.attempts,
+            max_attempts=model.max_attempts,
+            cancel_requested=model.cancel_requested,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+            run_after=model.run_after,
+        )
+
+    def _update(self, job_id: str, *conditions, **values) -> int:
+        """ジョブの列を更新してコミット（更新した行数を返す）"""
+        try:
+            updated = self.db.execute(
+                update(JobModel).where(JobModel.id == job_id, *conditions).values(**values)
+            ).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return updated
+
+    def create(self, job_type: str, params: Dict[str, Any], max_attempts: int) -> Job:
+        """待機中のジョブを作成"""
+        now = utc_now()
+        model = JobModel(
+            id=uuid.uuid4().hex,
+            type=job_type,
+            status=JOB_QUEUED,
+            params=params,
+            progress_done=0,
+            attempts=0,
+            max_attempts=max_attempts,
+            cancel_requested=False,
+            run_after=now,
+            created_at=now,
+        )
+        self.db.add(model)
+        self.db.commit()
+        return self._to_entity(model)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """IDでジョブを取得"""
+        model = self.db.get(JobModel, job_id, populate_existing=True)
+        return self._to_entity(model) if model else None
+
+    def list_recent(self, limit: int, status: Optional[str] = None) -> List[Job]:
+        """新しい順にジョブを取得"""
+        stmt = select(JobModel)
+        if status is not None:
+            stmt = stmt.where(JobModel.status == status)
+        models = self.db.execute(stmt.order_by(JobModel.created_at.desc()).limit(limit)).scalars()
+        return [self._to_entity(model) for model in models]
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """実行できる待機中のジョブを1件取得して実行中にする
+
+        MySQLは SKIP LOCKED で他のワーカーが取得中の行を読み飛ばす。状態が待機中のままの場合だけ
+        更新するため、SKIP LOCKEDのないDBでも同じジョブを2つのワーカーが実行することはない。
+        """
+        now = utc_now()
+        try:
+            job_id = self.db.execute(
+                select(JobModel.id)
+                .where(JobModel.status == JOB_QUEUED, JobModel.run_after <= now)
+                .order_by(JobModel.run_after, JobModel.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).scalar_one_or_none()
+            if job_id is None:
+                self.db.rollback()
+                return None
+            claimed = self.db.execute(
+                update(JobModel)
+                .where(JobModel.id == job_id, JobModel.status == JOB_QUEUED)
+                .values(
+                    status=JOB_RUNNING,
+                    attempts=JobModel.attempts + 1,
+                    worker_id=worker_id,
+                    heartbeat_at=now,
+                    started_at=now,
+                    error=None,
+                )
+            ).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.get(job_id) if claimed else None
+
+    def report_progress(self, job_id: str, done: int, total: Optional[int]) -> bool:
+        """進捗を記録し、キャンセルが要求されているかを返す"""
+        self._update(job_id, progress_done=done, progress_total=total, heartbeat_at=utc_now())
+        return bool(self.db.execute(
+            select(JobModel.cancel_requested).where(JobModel.id == job_id)
+        ).scalar_one_or_none())
+
+    def heartbeat(self, job_ids: List[str]) -> None:
+        """実行中のジョブの生存時刻を更新"""
+        if not job_ids:
+            return
+        try:
+            self.db.execute(
+                update(JobModel)
+                .where(JobModel.id.in_(job_ids), JobModel.status == JOB_RUNNING)
+                .values(heartbeat_at=utc_now())
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """ジョブを成功で終了"""
+        self._update(job_id, status=JOB_SUCCEEDED, result=result, finished_at=utc_now())
+
+    def fail(self, job_id: str, error: str, retry_at: Optional[datetime] = None) -> None:
+        """ジョブを失敗で終了（retry_at指定時は待機中に戻す。キャンセルが要求されていれば再試行しない）"""
+        if retry_at is not None and self._update(
+            job_id, JobModel.cancel_requested == False,
+            status=JOB_QUEUED, error=error, run_after=retry_at, worker_id=None,
+        ):
+            return
+        self._update(job_id, status=JOB_FAILED, error=error, finished_at=utc_now())
+
+    def mark_cancelled(self, job_id: str) -> None:
+        """実行中に中断したジョブをキャンセル済みにする"""
+        self._update(job_id, status=JOB_CANCELLED, finished_at=utc_now())
+
+    def request_cancel(self, job_id: str) -> Optional[Job]:
+        """キャンセルを要求（待機中はその場でキャンセル済み、実行中はワーカーに中断を要求）"""
+        # 待機中の間にワーカーが取得しても、実行中の中断要求として扱われる
+        self._update(
+            job_id, JobModel.status == JOB_QUEUED,
+            status=JOB_CANCELLED, cancel_requested=True, finished_at=utc_now(),
+        )
+        self._update(job_id, JobModel.status == JOB_RUNNING, cancel_requested=True)
+        return self.get(job_id)
+
+    def requeue_stale(self, heartbeat_before: datetime) -> int:
+        """生存時刻が途絶えた実行中のジョブを再試行（試行回数が残っていなければ失敗）にする"""
+        stale = JobModel.status == JOB_RUNNING, JobModel.heartbeat_at < heartbeat_before
+        error = "Worker stopped while running the job"
+        try:
+            requeued = self.db.execute(
+                update(JobModel)
+                .where(*stale, JobModel.attempts < JobModel.max_attempts, JobModel.cancel_requested == False)
+                .values(status=JOB_QUEUED, error=error, run_after=utc_now(), worker_id=None)
+            ).rowcount
+            failed = self.db.execute(
+                update(JobModel)
+                .where(*stale)
+                .values(status=JOB_FAILED, error=error, finished_at=utc_now())
+            ).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return requeued + failed
+
+    def purge_finished(self, finished_before: datetime) -> int:
+        """終了から時間が経ったジョブを削除"""
+        try:
+            purged = self.db.execute(
+                delete(JobModel).where(
+                    JobModel.status.in_(JOB_FINISHED_STATUSES), JobModel.finished_at < finished_before
+                )
+            ).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return purged
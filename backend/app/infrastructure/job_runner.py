@@ -0,0 +1,245 @@
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.domain.exceptions import JobCancelledError
+from app.domain.jobs import JOB_QUEUED, Job
+from app.infrastructure.job_repository import SQLAlchemyJobRepository, utc_now
+
+logger = logging.getLogger(__name__)
+
+# ジョブを実行する（falseではジョブを登録できるが実行しない）
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() in ("1", "true", "yes")
+# ワーカーの動かし方（always: 起動時から常に待機 / on-demand: ジョブの登録時に開始し、JOB_IDLE_SECONDS秒
+# ジョブがなければ止める）。未指定時はSQLite（デスクトップ版）ではon-demand、それ以外はalways
+JOB_WORKER_MODE = os.getenv("JOB_WORKER_MODE")
+# on-demandでワーカーを止めるまでの待ち時間（秒）
+JOB_IDLE_SECONDS = float(os.getenv("JOB_IDLE_SECONDS", "60"))
+# 同時に実行するジョブの数（ワーカースレッド数）。未指定時はSQLiteでは1（書き込みは1本ずつしか進まず、
+# 1件のジョブが接続を2本使うため）、それ以外は2
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "0")) or None
+# 待機中のジョブを確認する間隔（秒）。同じプロセスで登録したジョブは待たずに開始する
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+# 再試行までの待ち時間（秒）。試行ごとに2倍にする
+JOB_RETRY_BACKOFF_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "5"))
+# 実行中のジョブの生存時刻を更新する間隔（秒）
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+# 生存時刻がこの秒数より古い実行中のジョブは、ワーカーが停止したとみなして再試行する
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "300"))
+# 終了したジョブを残す日数
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "7"))
+
+# ジョブの処理（ジョブ, タスク用のセッション, 進捗の報告）→ 結果
+ExecuteJob = Callable[[Job, Session, Callable[[int, Optional[int]], None]], Dict[str, Any]]
+
+
+def job_worker_options(dialect_name: str) -> Dict[str, Any]:
+    """接続先に応じたワーカー数と停止までの待ち時間（JobRunnerの引数）"""
+    sqlite = dialect_name == "sqlite"
+    mode = JOB_WORKER_MODE or ("on-demand" if sqlite else "always")
+    return {
+        "workers": JOB_WORKERS or (1 if sqlite else 2),
+        "idle_seconds": JOB_IDLE_SECONDS if mode == "on-demand" else None,
+    }
+
+
+class WorkerStoppedError(Exception):
+    """アプリの終了でジョブを中断した（試行回数が残っていれば待機中に戻す）"""
+    pass
+
+
+class JobRunner:
+    """ジョブのワーカー（リクエストとは別のスレッドでjobsテーブルのジョブを取得して実行する）
+
+    ジョブの状態の更新とタスクの処理は別のセッションで行い、進捗の記録がタスクの
+    トランザクションに含まれないようにする。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        execute: ExecuteJob,
+        workers: int = 2,
+        poll_seconds: float = JOB_POLL_SECONDS,
+        idle_seconds: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.execute = execute
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        # 指定時はジョブがこの秒数なければワーカーを止め、次の登録（notify）で開始し直す
+        self.idle_seconds = idle_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._enabled = False
+        self._threads: List[threading.Thread] = []
+        self._active_workers = 0
+        self._maintaining = False
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def notify(self) -> None:
+        """ジョブの登録を通知（待機中のワーカーをすぐに起こし、止めていれば開始する）"""
+        self._wake.set()
+        if self._enabled and self.idle_seconds is not None:
+            self._start_threads()
+
+    def start(self) -> None:
+        """ワーカースレッドと保守用スレッド（生存時刻の更新・停止したジョブの再試行・古いジョブの削除）を開始
+
+        idle_seconds指定時は、待機中のジョブが残っている場合だけ開始し、それ以外は最初の登録まで待つ。
+        """
+        self._stopping.clear()
+        self._enabled = True
+        if self.idle_seconds is None or self._has_queued():
+            self._start_threads()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """ワーカーを停止（実行中のジョブは次の進捗の報告で中断し、試行回数が残っていれば待機中に戻す）"""
+        self._enabled = False
+        self._stopping.set()
+        self._wake.set()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def _has_queued(self) -> bool:
+        """前回の起動から残っている待機中のジョブがあるか（確認できなければ開始して任せる）"""
+        db = self.session_factory()
+        try:
+            return bool(SQLAlchemyJobRepository(db).list_recent(1, JOB_QUEUED))
+        except Exception:
+            logger.exception("Failed to check for queued jobs")
+            return True
+        finally:
+            db.close()
+
+    def _start_threads(self) -> None:
+        """止まっているワーカー・保守用スレッドを開始"""
+        with self._lock:
+            if self._stopping.is_set():
+                return
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            threads = []
+            for index in range(self._active_workers, self.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(f"{self.worker_id}:{index}",), name=f"job-worker-{index}", daemon=True
+                ))
+            self._active_workers = self.workers
+            if not self._maintaining:
+                self._maintaining = True
+                threads.append(threading.Thread(target=self._maintain, name="job-maintenance", daemon=True))
+            self._threads.extend(threads)
+        for thread in threads:
+            thread.start()
+
+    def _work(self, worker_id: str) -> None:
+        idle_since = time.monotonic()
+        while not self._stopping.is_set():
+            try:
+                job = self._claim(worker_id)
+            except Exception:
+                logger.exception("Failed to claim a job")
+                job = None
+            if job is None:
+                if self._wake.wait(self.poll_seconds):
+                    self._wake.clear()
+                elif self._idle(idle_since):
+                    return
+                continue
+            try:
+                self._run(job)
+            except Exception:
+                # 結果を記録できなかったジョブは、生存時刻が途絶えた後に再試行される
+                logger.exception("Failed to record the result of job %s", job.id)
+            idle_since = time.monotonic()
+        with self._lock:
+            self._active_workers -= 1
+
+    def _idle(self, idle_since: float) -> bool:
+        """on-demandでジョブのない時間が続いたワーカーを止める（止める場合はTrue）"""
+        if self.idle_seconds is None or time.monotonic() - idle_since < self.idle_seconds:
+            return False
+        with self._lock:
+            # 判定中に登録されたジョブは、このワーカーが続けて取得する
+            if self._wake.is_set():
+                return False
+            self._active_workers -= 1
+            return True
+
+    def _claim(self, worker_id: str) -> Optional[Job]:
+        db = self.session_factory()
+        try:
+            return SQLAlchemyJobRepository(db).claim(worker_id)
+        finally:
+            db.close()
+
+    def _run(self, job: Job) -> None:
+        """1件のジョブを実行し、結果・失敗・キャンセルを記録する"""
+        with self._lock:
+            self._running.add(job.id)
+        jobs_db = self.session_factory()
+        task_db = self.session_factory()
+        jobs = SQLAlchemyJobRepository(jobs_db)
+
+        def report(done: int, total: Optional[int]) -> None:
+            if jobs.report_progress(job.id, done, total):
+                raise JobCancelledError(job.id)
+            if self._stopping.is_set():
+                raise WorkerStoppedError(f"Worker {self.worker_id} stopped while running the job")
+
+        try:
+            result = self.execute(job, task_db, report)
+        except JobCancelledError:
+            task_db.rollback()
+            jobs.mark_cancelled(job.id)
+        except Exception as e:
+            task_db.rollback()
+            logger.exception("Job %s (%s) failed on attempt %d", job.id, job.type, job.attempts)
+            jobs.fail(job.id, f"{type(e).__name__}: {e}", retry_at=self._retry_at(job, e))
+        else:
+            jobs.complete(job.id, result)
+        finally:
+            task_db.close()
+            jobs_db.close()
+            with self._lock:
+                self._running.discard(job.id)
+
+    def _retry_at(self, job: Job, error: Exception) -> Optional[datetime]:
+        """再試行する日時（入力の誤りなど再実行しても同じ結果になる失敗や、試行回数が残っていなければNone）"""
+        if isinstance(error, ValueError) or job.attempts >= job.max_attempts:
+            return None
+        if isinstance(error, WorkerStoppedError):
+            return utc_now()
+        return utc_now() + timedelta(seconds=JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1))
+
+    def _maintain(self) -> None:
+        while not self._stopping.wait(min(JOB_HEARTBEAT_SECONDS, JOB_STALE_SECONDS / 2)):
+            with self._lock:
+                running = list(self._running)
+                # on-demandで全てのワーカーが止まったら保守も止める
+                if not self._active_workers:
+                    self._maintaining = False
+                    return
+            db = self.session_factory()
+            try:
+                jobs = SQLAlchemyJobRepository(db)
+                jobs.heartbeat(running)
+                now = utc_now()
+                if jobs.requeue_stale(now - timedelta(seconds=JOB_STALE_SECONDS)):
+                    self._wake.set()
+                jobs.purge_finished(now - timedelta(days=JOB_RETENTION_DAYS))
+            except Exception:
+                logger.exception("Job maintenance failed")
+            finally:
+                db.close()
+        with self._lock:
+            self._maintaining = False
@@ -0,0 +1,306 @@
+import asyncio
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.pool import QueuePool
+
+# メトリクス収集の有効化（METRICS_ENABLED=false で無効化）
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# レイテンシのヒストグラムの境界（秒）
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    """テキスト形式のラベル値をエスケープ"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{escape_label_value(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """メトリクスの基底クラス（ラベル値の組ごとに値を持つ）"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return self.header() + list(self.samples())
+
+
+class Counter(Metric):
+    """単調増加するカウンタ"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}"
+
+
+class Gauge(Metric):
+    """増減する値（callbackを渡した場合は出力時に値を取得する）"""
+
+    metric_type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self) -> Iterable[str]:
+        if self.callback is not None:
+            values = list(self.callback().items())
+        else:
+            with self._lock:
+                values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{format_labels(self.labelnames, labels)} {format_value(value)}"
+
+
+class Histogram(Metric):
+    """境界ごとの件数・合計・件数を持つヒストグラム"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # ラベル値ごとに [境界ごとの件数（累積しない）, 合計, 件数]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._values.items()]
+        bucket_labelnames = self.labelnames + ("le",)
+        for labels, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = format_labels(bucket_labelnames, labels + (format_value(bound),))
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {format_value(total)}"
+            yield f"{self.name}_count{label_text} {count}"
+
+
+class MetricsRegistry:
+    """メトリクスをまとめてテキスト形式で出力する"""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route, method and status.", ("method", "route", "status")
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency in seconds.", ("method", "route")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed.", ("method",)
+))
+usecase_duration_seconds = registry.register(Histogram(
+    "usecase_duration_seconds", "Use case execution time in seconds.", ("usecase", "method")
+))
+db_pool_wait_seconds = registry.register(Histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection in seconds.", ("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+))
+
+
+class TimedQueuePool(QueuePool):
+    """接続の取得待ち時間をdb_pool_wait_secondsに記録するQueuePool"""
+
+    pool_label = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_wait_seconds.observe((self.pool_label,), time.perf_counter() - started)
+
+
+def timed_queue_pool(label: str) -> type:
+    """poolラベルを指定したTimedQueuePoolのサブクラス（create_engineのpoolclassに渡す）"""
+    return type(f"TimedQueuePool_{label}", (TimedQueuePool,), {"pool_label": label})
+
+
+def register_pool_metrics(engines: Dict[str, object]) -> None:
+    """エンジンのコネクションプールの使用状況をゲージとして登録（QueuePool系のみ出力）"""
+
+    def collect(method_name: str) -> Callable[[], Dict[LabelValues, float]]:
+        # dispose() でプールが作り直されても追従するよう、出力時にengine.poolを参照する
+        return lambda: {
+            (name,): getattr(engine.pool, method_name)()
+            for name, engine in engines.items()
+            if isinstance(engine.pool, QueuePool)
+        }
+
+    for method_name, documentation in (
+        ("size", "Configured pool size."),
+        ("checkedout", "Connections currently checked out of the pool."),
+        ("checkedin", "Idle connections in the pool."),
+        ("overflow", "Connections opened beyond the pool size (negative while below it)."),
+    ):
+        registry.register(Gauge(f"db_pool_{method_name}", documentation, ("pool",), collect(method_name)))
+
+
+def register_cache_metrics(name: str, stats: Callable[[], Dict[str, int]]) -> None:
+    """キャッシュの統計（CacheBackend.stats）をゲージとして登録"""
+    registry.register(Gauge(
+        "cache_stat", "Cache statistics (size, hits, misses, invalidations, evictions).", ("cache", "stat"),
+        lambda: {(name, stat): value for stat, value in stats().items()},
+    ))
+
+
+def _timed(cls_name: str, method_name: str, func):
+    labels = (cls_name, method_name)
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                usecase_duration_seconds.observe(labels, time.perf_counter() - started)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            usecase_duration_seconds.observe(labels, time.perf_counter() - started)
+    return wrapper
+
+
+def instrument_usecases(*modules) -> None:
+    """モジュール内の *UseCase クラスの execute 系メソッドを計測用にラップ（ユースケース層は変更しない）"""
+    for module in modules:
+        for cls_name, cls in list(vars(module).items()):
+            if not (isinstance(cls, type) and cls_name.endswith("UseCase") and cls.__module__ == module.__name__):
+                continue
+            for method_name, func in list(vars(cls).items()):
+                if method_name.startswith("execute") and callable(func) and not hasattr(func, "__wrapped__"):
+                    setattr(cls, method_name, _timed(cls_name, method_name, func))
+
+
+class MetricsMiddleware:
+    """リクエスト数・レイテンシ・処理中のリクエスト数を記録するASGIミドルウェア
+
+    ルートはパステンプレート（/api/v1/tasks/{task_id}）で集計し、ラベルの種類が増えないようにする。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec((method,))
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            http_request_duration_seconds.observe((method, route_path), time.perf_counter() - started)
+            http_requests_total.inc((method, route_path, str(status_code)))
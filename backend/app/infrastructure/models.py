@@ -1,7 +1,56 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Date, Time, DateTime, Index
+import logging
+
+from sqlalchemy import (
+    BigInteger, Column, Integer, JSON, String, Text, Boolean, Date, Time, DateTime, Index, event, text,
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import FunctionElement
 from app.infrastructure.database import Base
 
+logger = logging.getLogger(__name__)
+
+class db_now(FunctionElement):
+    """DB側の現在日時（作成・更新日時の既定値）
+
+    MySQLなどはCURRENT_TIMESTAMP。SQLiteのCURRENT_TIMESTAMPは秒精度のため、ミリ秒まで含めて
+    SQLAlchemyが書き込む日時と同じ形式（YYYY-MM-DD HH:MM:SS.fff、UTC）の文字列にする。
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(db_now)
+def _compile_db_now(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(db_now, "sqlite")
+def _compile_db_now_sqlite(element, compiler, **kw):
+    return "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+# SQLiteの全文検索用FTS5仮想テーブル（tasksを外部コンテンツとし、トリガーで同期する）
+SQLITE_FTS_TABLE = "tasks_fts"
+
+
+# 変更カーソルの採番行（1行のみ）のID
+CHANGE_SEQUENCE_ID = 1
+
+
+class TaskChangeSequenceModel(Base):
+    """差分同期の変更カーソルの採番（差分の読み取り時に未採番の変更へまとめて付ける。書き込みでは触らない）"""
+    __tablename__ = "task_change_sequence"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    value = Column(BigInteger, nullable=False, default=0)
+    # 圧縮で削除した削除記録の最大カーソル（これより前のカーソルからは差分を取得できない）
+    compacted_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+# 未採番の変更カーソル（tasks・task_tombstonesの書き込み時の値。差分の読み取り時に採番する）
+PENDING_CHANGE_SEQ = -1
+
 
 class TaskModel(Base):
     """タスクデータベースモデル（Infrastructure層）"""
@@ -14,10 +63,158 @@ class TaskModel(Base):
     deadline = Column(Time, nullable=True)
     completed = Column(Boolean, nullable=False, default=False)
     order_index = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=db_now())
+    updated_at = Column(DateTime, nullable=False, server_default=db_now(), onupdate=db_now())
+    # 楽観的排他制御用のバージョン（更新のたびに1つ進める）
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 最後の作成・更新の変更カーソル（差分同期用。書き込みのたびに未採番に戻す）
+    change_seq = Column(
+        BigInteger, nullable=False, default=PENDING_CHANGE_SEQ, onupdate=PENDING_CHANGE_SEQ, server_default="0"
+    )
 
     # インデックス
     __table_args__ = (
         Index("idx_date_order", "date", "order_index"),
+        Index("idx_change_seq", "change_seq", "id"),
+        # 全文検索（日本語のタイトル・メモを分かち書きせずに検索するためngramパーサーを使う）
+        Index(
+            "ft_title_memo", "title", "memo",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+        # SQLiteでも削除・アーカイブしたIDを再利用しない（アーカイブから戻す行とIDが衝突しないようにする）
+        {"sqlite_autoincrement": True},
+    )
+
+
+class TaskArchiveModel(Base):
+    """アーカイブしたタスク（古い完了済みのタスクをtasksから移す。列はtasksと同じ）
+
+    読み取りはtasksと合わせて行い、書き込みの前にその日付の行をtasksに戻す。
+    """
+    __tablename__ = "tasks_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    date = Column(Date, nullable=False)
+    title = Column(String(255), nullable=False)
+    memo = Column(Text, nullable=True)
+    deadline = Column(Time, nullable=True)
+    completed = Column(Boolean, nullable=False)
+    order_index = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    version = Column(Integer, nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    archived_at = Column(DateTime, nullable=False, server_default=db_now())
+
+    __table_args__ = (
+        Index("idx_archive_date_order", "date", "order_index"),
+        Index("idx_archive_change_seq", "change_seq", "id"),
+    )
+
+
+class TaskDateRevisionModel(Base):
+    """日付ごとの変更リビジョン（一覧のETag算出用）"""
+    __tablename__ = "task_date_revisions"
+
+    date = Column(Date, primary_key=True)
+    revision = Column(Integer, nullable=False, default=0)
+
+
+class DailyTaskStatsModel(Base):
+    """日付ごとのタスクの集計（ダッシュボード用。タスクの書き込みと同じトランザクションで数え直す）
+
+    タスクのない日付の行は持たない。
+    """
+    __tablename__ = "daily_task_stats"
+
+    date = Column(Date, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    with_deadline = Column(Integer, nullable=False, default=0)
+
+
+class TaskTombstoneModel(Base):
+    """削除したタスクの記録（差分同期でクライアントに削除を伝える。古いものは圧縮で削除する）"""
+    __tablename__ = "task_tombstones"
+
+    # SQLiteは削除したIDを再利用しうるため、タスクIDは主キーにしない
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    date = Column(Date, nullable=False)
+    change_seq = Column(BigInteger, nullable=False, default=PENDING_CHANGE_SEQ)
+    deleted_at = Column(DateTime, nullable=False, server_default=db_now())
+
+    __table_args__ = (
+        Index("idx_tombstone_change_seq", "change_seq", "task_id"),
+        Index("idx_tombstone_deleted_at", "deleted_at"),
     )
+
+
+class JobModel(Base):
+    """バックグラウンドジョブ（日時はアプリ側のUTCで記録する）"""
+    __tablename__ = "jobs"
+
+    id = Column(String(32), primary_key=True)
+    type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    params = Column(JSON, nullable=False)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    progress_done = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    # 実行中のワーカー（ホスト名:プロセスID:番号）と生存時刻
+    worker_id = Column(String(100), nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    run_after = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 待機中のジョブを実行できる順に取得する
+        Index("idx_job_status_run_after", "status", "run_after"),
+        Index("idx_job_created_at", "created_at"),
+    )
+
+
+SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5("
+    "title, memo, content='tasks', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, memo) VALUES (new.id, new.title, new.memo); END",
+    f"CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, memo) "
+    "VALUES ('delete', old.id, old.title, old.memo); END",
+    # 順序・完了フラグだけの更新では索引を書き換えない
+    f"CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, memo ON tasks BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, memo) "
+    "VALUES ('delete', old.id, old.title, old.memo); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, memo) VALUES (new.id, new.title, new.memo); END",
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_sqlite_fts(target, connection, **kw):
+    """SQLiteでは全文検索用のFTS5テーブルとトリガーを作成し、既存のタスクから索引を構築する
+
+    create_allのたびに呼ばれるため、既存のデータベースにも後から追加される。
+    trigramトークナイザーがない古いSQLiteでは作成せず、検索はLIKEで行う。
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SQLITE_FTS_TABLE},
+    ).first()
+    if exists:
+        return
+    try:
+        with connection.begin_nested():
+            for statement in SQLITE_FTS_DDL:
+                connection.execute(text(statement))
+            connection.execute(text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"))
+    except Exception as e:
+        logger.warning("could not create FTS5 table; search falls back to LIKE: %s", e)
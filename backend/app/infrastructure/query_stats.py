@@ -0,0 +1,153 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Set, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# この時間（ミリ秒）以上かかった文をパラメータ付きでログに出す（0で無効）
+SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+# 1リクエスト内で同じ形の文がこの回数を超えたらN+1の疑いとして警告する（0で無効）
+NPLUS1_THRESHOLD = int(os.getenv("SQL_NPLUS1_THRESHOLD", "10"))
+# デバッグモード（レスポンスヘッダーにクエリ数・DB時間を付ける）
+DEBUG_HEADERS = os.getenv("APP_DEBUG", "false").lower() in ("1", "true", "yes")
+
+# ログに出すパラメータの最大文字数（executemanyで巨大にならないよう切り詰める）
+MAX_PARAMS_LENGTH = 500
+
+# IN (?, ?, ?) のようなプレースホルダの並びを1つにまとめる（件数違いを同じ形とみなす）
+PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL文の形（パラメータの個数に依存しない）"""
+    return PLACEHOLDER_LIST.sub("(?)", statement)
+
+
+@dataclass
+class RequestQueryStats:
+    """1リクエスト内で発行したSQL文の集計"""
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    warned_shapes: Set[str] = field(default_factory=set)
+    # allow_repeated_statementsの入れ子の深さ（0より大きい間の文はN+1の判定に数えない）
+    repeats_allowed: int = 0
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        if NPLUS1_THRESHOLD <= 0 or self.repeats_allowed:
+            return
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] > NPLUS1_THRESHOLD and shape not in self.warned_shapes:
+            self.warned_shapes.add(shape)
+            logger.warning(
+                "possible N+1: same statement executed more than %d times in one request: %s",
+                NPLUS1_THRESHOLD, shape,
+            )
+
+
+# 現在のリクエストの集計（リクエスト外ではNone）。スレッドプールにもコンテキストごと引き継がれる
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def allow_repeated_statements() -> Iterator[None]:
+    """ブロック内で発行した文をN+1の判定から除く（件数・DB時間には数える）
+
+    キーセットページングのエクスポートやバッチごとのインポートのように、同じ形の文を意図して
+    ページ・バッチの数だけ繰り返す処理を囲む。集計はリクエストごとの1つのオブジェクトのため、
+    スレッドプールで実行される処理にも効く。
+    """
+    stats = current_query_stats.get()
+    if stats is None:
+        yield
+        return
+    stats.repeats_allowed += 1
+    try:
+        yield
+    finally:
+        stats.repeats_allowed -= 1
+
+
+T = TypeVar("T")
+
+
+def iter_allowing_repeats(iterable: Iterable[T]) -> Iterator[T]:
+    """反復中に発行した文をN+1の判定から除くイテレータ（ストリーミングレスポンスの本文用）"""
+    with allow_repeated_statements():
+        yield from iterable
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if SLOW_QUERY_MS > 0 and elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning(
+            "slow query (%.1f ms): %s parameters=%s",
+            elapsed * 1000, statement, repr(parameters)[:MAX_PARAMS_LENGTH],
+        )
+
+
+def _handle_error(exception_context):
+    # 失敗した文はafter_cursor_executeが呼ばれないため開始時刻を捨てる
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """エンジンにクエリ計測のイベントフックを登録（非同期エンジンはsync_engineを渡す）"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """リクエストごとにSQL文の数・DB時間を集計するASGIミドルウェア
+
+    APP_DEBUG=true のときは X-DB-Query-Count / X-DB-Query-Time-Ms / Server-Timing ヘッダーを付ける。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_wrapper(message):
+            if DEBUG_HEADERS and message["type"] == "http.response.start":
+                duration_ms = stats.total_seconds * 1000
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-db-query-count", str(stats.count).encode()),
+                    (b"x-db-query-time-ms", f"{duration_ms:.2f}".encode()),
+                    (b"server-timing", f"db;desc=\"{stats.count} queries\";dur={duration_ms:.2f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
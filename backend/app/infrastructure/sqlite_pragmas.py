@@ -0,0 +1,48 @@
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 組み込みSQLite（デスクトップ版の単一ユーザー向け）の設定。接続ごとにPRAGMAで適用する
+# ジャーナルモード（WALでは読み取りが書き込みを待たない）
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+# WALではNORMALでもアプリのクラッシュでは失われない（電源断で直近のコミットが失われうる）
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+# メモリマップで読むデータベースファイルの最大サイズ（バイト）
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# 接続ごとのページキャッシュ（負の値はKiB単位）
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-16000"))
+# 書き込みロックの取得を待つ時間（ミリ秒）
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def sqlite_pragmas(memory: bool = False):
+    """接続時に実行するPRAGMA文（インメモリDBではジャーナル・mmapの設定を省く）"""
+    statements = [
+        f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size = {SQLITE_CACHE_SIZE}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if not memory:
+        statements = [
+            f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}",
+            f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}",
+            f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}",
+        ] + statements
+    return statements
+
+
+def install_sqlite_pragmas(engine: Engine) -> None:
+    """SQLiteのエンジンで、新しい接続を開くたびにPRAGMAを適用する"""
+    if engine.dialect.name != "sqlite":
+        return
+    statements = sqlite_pragmas(memory=engine.url.database in (None, "", ":memory:"))
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from sqlalchemy import MetaData, select
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# スキーマ確認結果のキャッシュファイル（DBごとにスキーマのバージョンを保存）
+SCHEMA_CACHE_FILE = os.getenv(
+    "SCHEMA_CACHE_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "task-app", "schema-cache.json"),
+)
+# 起動時にバックグラウンドで開いておく接続数（テーブル確認のため最低1本は開く）
+POOL_WARMUP_CONNECTIONS = int(os.getenv("POOL_WARMUP_CONNECTIONS", "2"))
+# 起動時にDBへ接続できない場合に再試行する時間（秒）
+STARTUP_RETRY_SECONDS = float(os.getenv("STARTUP_RETRY_SECONDS", "60"))
+# 起動時間の内訳を出力する
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() in ("1", "true", "yes")
+
+
+class StartupState:
+    """起動処理の進捗（/ready で参照する）と各段階の所要時間"""
+
+    def __init__(self):
+        self.schema_ready = False
+        self.warmup_done = False
+        self.error: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        # プロセス開始時刻（time.perf_counter）。設定されていれば準備完了までの合計を記録する
+        self.started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """段階の所要時間を記録"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.timings[name] = time.perf_counter() - started
+
+    @property
+    def ready(self) -> bool:
+        return self.schema_ready and self.warmup_done and self.error is None
+
+    def report(self) -> str:
+        lines = ["startup profile:"]
+        with self._lock:
+            timings = list(self.timings.items())
+        for name, seconds in timings:
+            lines.append(f"  {name:<24} {seconds * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+
+startup_state = StartupState()
+
+
+def schema_version(metadata: MetaData) -> str:
+    """テーブル・列・インデックスの定義から算出したスキーマのバージョン"""
+    parts: List[str] = []
+    for table in sorted(metadata.tables.values(), key=lambda table: table.name):
+        parts.append(table.name)
+        parts.extend(f"{column.name}:{column.type}:{column.nullable}" for column in table.columns)
+        parts.extend(sorted(index.name or "" for index in table.indexes))
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def database_key(engine: Engine) -> Optional[str]:
+    """キャッシュのキー（パスワードを除いた接続先）。インメモリSQLiteはキャッシュしないためNone"""
+    url = engine.url
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return None
+    return hashlib.sha1(url.render_as_string(hide_password=True).encode()).hexdigest()
+
+
+def _load_cache() -> Dict[str, str]:
+    try:
+        with open(SCHEMA_CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(key: str, version: Optional[str]) -> None:
+    cache = _load_cache()
+    if version is None:
+        cache.pop(key, None)
+    else:
+        cache[key] = version
+    try:
+        os.makedirs(os.path.dirname(SCHEMA_CACHE_FILE), exist_ok=True)
+        with open(SCHEMA_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning("could not write schema cache %s: %s", SCHEMA_CACHE_FILE, e)
+
+
+def schema_is_cached(engine: Engine, metadata: MetaData) -> bool:
+    """同じスキーマのバージョンで確認済みか（DBには問い合わせない）"""
+    key = database_key(engine)
+    if key is None:
+        return False
+    url = engine.url
+    if url.get_backend_name() == "sqlite" and not os.path.exists(url.database):
+        # ファイルが削除されていれば作り直す
+        return False
+    return _load_cache().get(key) == schema_version(metadata)
+
+
+def ensure_schema(engine: Engine, metadata: MetaData) -> bool:
+    """スキーマを作成（同じバージョンで確認済みならDBに問い合わせない）。作成・確認を行った場合True"""
+    if schema_is_cached(engine, metadata):
+        return False
+    metadata.create_all(bind=engine)
+    key = database_key(engine)
+    if key is not None:
+        _save_cache(key, schema_version(metadata))
+    return True
+
+
+def warm_up(engine: Engine, metadata: MetaData, connections: int = POOL_WARMUP_CONNECTIONS) -> None:
+    """接続を開いてプールに戻す。あわせてテーブルの存在を確認し、DBが作り直されていればスキーマを作成する"""
+    from app.infrastructure.models import TaskModel
+
+    opened = []
+    try:
+        for _ in range(max(connections, 1)):
+            opened.append(engine.connect())
+        try:
+            opened[0].execute(select(TaskModel.id).limit(0))
+        except Exception:
+            # キャッシュ後にDBがリセットされた場合
+            opened[0].rollback()
+            logger.warning("tasks table not found; recreating schema")
+            key = database_key(engine)
+            if key is not None:
+                _save_cache(key, None)
+            ensure_schema(engine, metadata)
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def start_background_startup(engine: Engine, metadata: MetaData) -> threading.Thread:
+    """スキーマ作成（未完了の場合）とプールのウォームアップをバックグラウンドスレッドで実行
+
+    DBに接続できない間（MySQLコンテナの起動待ちなど）はSTARTUP_RETRY_SECONDSまで再試行する。
+    """
+
+    def run():
+        deadline = time.monotonic() + STARTUP_RETRY_SECONDS
+        while True:
+            try:
+                if not startup_state.schema_ready:
+                    with startup_state.phase("schema check"):
+                        ensure_schema(engine, metadata)
+                    startup_state.schema_ready = True
+                with startup_state.phase("pool warm-up"):
+                    warm_up(engine, metadata)
+                startup_state.error = None
+                startup_state.warmup_done = True
+                if startup_state.started_at is not None:
+                    startup_state.timings["total until ready"] = time.perf_counter() - startup_state.started_at
+                break
+            except Exception as e:
+                startup_state.error = f"{type(e).__name__}: {e}"
+                if time.monotonic() >= deadline:
+                    logger.error("database startup failed: %s", startup_state.error)
+                    break
+                time.sleep(1)
+        if STARTUP_PROFILE:
+            print(startup_state.report(), flush=True)
+
+    thread = threading.Thread(target=run, name="db-startup", daemon=True)
+    thread.start()
+    return thread
@@ -1,9 +1,298 @@
-from typing import List, Optional
-from datetime import date, time
+import heapq
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from datetime import date, datetime, time
+from weakref import WeakKeyDictionary
+from sqlalchemy import (
+    and_, bindparam, case, column, delete, func, insert, inspect, literal, literal_column, or_, select,
+    table, text, true, tuple_, union_all, update,
+)
 from sqlalchemy.orm import Session
 from app.domain.entities import Task
+from app.domain.exceptions import TaskNotFoundError, VersionConflictError
+from app.domain.ordering import rank_between
 from app.domain.repositories import TaskRepository
-from app.infrastructure.models import TaskModel
+from app.infrastructure.models import (
+    CHANGE_SEQUENCE_ID, PENDING_CHANGE_SEQ, SQLITE_FTS_TABLE, DailyTaskStatsModel, TaskArchiveModel,
+    TaskChangeSequenceModel, TaskDateRevisionModel, TaskModel, TaskTombstoneModel,
+)
+
+
+# 読み取り専用経路で取得する列（レスポンスのフィールドと同じ）
+TASK_COLUMNS = (
+    TaskModel.id,
+    TaskModel.date,
+    TaskModel.title,
+    TaskModel.memo,
+    TaskModel.deadline,
+    TaskModel.completed,
+    TaskModel.order_index,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+    TaskModel.version,
+)
+
+# 列名（tasksとtasks_archiveで共通）
+TASK_COLUMN_NAMES = tuple(task_column.key for task_column in TASK_COLUMNS)
+
+# tasksとtasks_archiveの両方に使う条件（モデルを受け取って条件式を返す）
+TaskCondition = Callable[[Any], Any]
+
+
+# 全文索引で検索できる最短の語の長さ（MySQLはngram_token_sizeの既定値、SQLiteはtrigram）。
+# これより短い語と全文索引のないDBではLIKEで絞り込む
+FULLTEXT_MIN_TERM_LENGTH = {"mysql": 2, "sqlite": 3}
+
+# SQLiteのデータベースごとのFTS5テーブルの有無（エンジン単位で一度だけ確認する）
+_sqlite_fts_available: "WeakKeyDictionary[Any, bool]" = WeakKeyDictionary()
+
+
+def escape_like(term: str) -> str:
+    """LIKEのワイルドカードをエスケープ（エスケープ文字は \\）"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _increment_statement(dialect_name: str, model, rows: List[Dict[str, Any]], key: str, column: str):
+    """主キーkeyの行のcolumnを1つ進める（行がなければ作成する）UPSERT文を生成"""
+    incremented = getattr(model, column) + 1
+    # 方言モジュールは使うものだけを読み込む（起動時間短縮のため）
+    if dialect_name in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(model).values(rows)
+        return stmt.on_duplicate_key_update({column: incremented})
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(model).values(rows)
+    return stmt.on_conflict_do_update(index_elements=[key], set_={column: incremented})
+
+
+def task_filter(
+    start_date: Optional[date] = None, end_date: Optional[date] = None, completed: Optional[bool] = None
+) -> TaskCondition:
+    """期間・完了状態の条件（tasks・tasks_archiveのどちらにも使える）"""
+    def condition(model):
+        clauses = []
+        if start_date is not None:
+            clauses.append(model.date >= start_date)
+        if end_date is not None:
+            clauses.append(model.date <= end_date)
+        if completed is not None:
+            clauses.append(model.completed == completed)
+        return and_(true(), *clauses)
+    return condition
+
+
+def model_columns(model, names: Iterable[str] = TASK_COLUMN_NAMES) -> List[Any]:
+    """モデル（TaskModel / TaskArchiveModel）の列を名前の順に取得"""
+    return [getattr(model, name) for name in names]
+
+
+def visible_tasks(condition: TaskCondition, names: Iterable[str] = TASK_COLUMN_NAMES):
+    """tasksとtasks_archiveで条件に合う行のUNION ALL（サブクエリ）
+
+    アーカイブした日付の読み取りもこれを通すため、呼び出し側はアーカイブを意識しない。
+    アーカイブ側は日付インデックスの範囲走査のみで、アーカイブしていない日付では0件で終わる。
+    行数の多い期間の並べ替え・ページングには使わない（ordered_rows_statementでテーブルごとに読んでマージする）。
+    """
+    names = list(names)
+    return union_all(*(
+        select(*model_columns(model, names)).where(condition(model)) for model in (TaskModel, TaskArchiveModel)
+    )).subquery()
+
+
+def ordered_rows_statement(model, condition: TaskCondition):
+    """1つのテーブル（tasks / tasks_archive）から条件に合う行を日付・順序・ID順に取得する文"""
+    return select(*model_columns(model)).where(condition(model)).order_by(model.date, model.order_index, model.id)
+
+
+def row_sort_key(row: Dict[str, Any]) -> Tuple[date, int, int]:
+    """tasksとtasks_archiveの行をマージするときの並び順（日付, 順序, ID）"""
+    return row["date"], row["order_index"], row["id"]
+
+
+def _date_rows_statement(show_completed: bool):
+    """日付のタスク（アーカイブを含む）を並び順に取得する文（日付はバインド変数task_date）"""
+    def condition(model):
+        on_date = model.date == bindparam("task_date")
+        return on_date if show_completed else and_(on_date, model.completed == False)
+
+    tasks = visible_tasks(condition)
+    return select(tasks).order_by(tasks.c.order_index, tasks.c.id)
+
+
+# 日付の一覧の文（最も頻繁に読むため、組み立てたUNION ALLの文をshow_completedごとに使い回す）
+DATE_ROWS_STATEMENTS = {show_completed: _date_rows_statement(show_completed) for show_completed in (True, False)}
+
+
+def archived_dates_statement(condition):
+    """条件に合うアーカイブ済みタスクの日付を取得するSELECT文を生成"""
+    return select(TaskArchiveModel.date).where(condition).distinct()
+
+
+def restore_archived_statements(task_dates: Iterable[date]):
+    """日付のアーカイブ済みタスクをすべてtasksに戻す（INSERT ... SELECT, DELETE）文を生成
+
+    change_seqは指定せず未採番に戻す（差分同期で再送される）。
+    """
+    task_dates = list(task_dates)
+    return (
+        insert(TaskModel).from_select(
+            list(TASK_COLUMN_NAMES),
+            select(*model_columns(TaskArchiveModel)).where(TaskArchiveModel.date.in_(task_dates)),
+        ),
+        delete(TaskArchiveModel).where(TaskArchiveModel.date.in_(task_dates)),
+    )
+
+
+def restore_archived(db: Session, condition) -> None:
+    """条件に合うアーカイブ済みタスクの日付をtasksに戻す（bump_date_revisionsの後、書き込みの前に実行）
+
+    書き込むタスクだけでなく同じ日付の行をまとめて戻し、日付内の並び順の書き換えがtasksだけで完結するようにする。
+    """
+    restore_archived_dates(db, db.execute(archived_dates_statement(condition)).scalars().all())
+
+
+def restore_archived_dates(db: Session, task_dates: Iterable[date]) -> None:
+    """アーカイブ済みと分かっている日付のタスクをtasksに戻す（日付がなければ何もしない）"""
+    task_dates = set(task_dates)
+    if task_dates:
+        for statement in restore_archived_statements(task_dates):
+            db.execute(statement)
+
+
+def task_dates_statement(task_ids: Iterable[int]):
+    """IDのタスクの（日付, アーカイブ済みか）を取得するSELECT文を生成（書き込み前にロック・復元する日付を決める）
+
+    主キーでの検索2回のUNION ALLで、アーカイブ済みかどうかの確認を別の文にしない。
+    """
+    task_ids = list(task_ids)
+    return union_all(*(
+        select(model.date, literal(model is TaskArchiveModel).label("archived")).where(model.id.in_(task_ids))
+        for model in (TaskModel, TaskArchiveModel)
+    ))
+
+
+def bump_revisions_statement(dialect_name: str, task_dates: Iterable[date]):
+    """日付ごとの変更リビジョンを1つ進めるUPSERT文を生成（行は日付順。ロックの順序をそろえてデッドロックを避ける）"""
+    rows = [{"date": task_date, "revision": 1} for task_date in sorted(set(task_dates))]
+    return _increment_statement(dialect_name, TaskDateRevisionModel, rows, "date", "revision")
+
+
+def bump_date_revisions(db: Session, task_dates: Iterable[date]) -> None:
+    """書き込む日付のリビジョンを進める（呼び出し側のトランザクションで、tasksを読み書きする前に実行）
+
+    リビジョン行の行ロックはコミットまで保持されるため、同じ日付への書き込み・アーカイブからの復元・
+    集計の数え直しはこのロックで直列化される。日付が異なる書き込み同士は待ち合わせない。
+    """
+    task_dates = set(task_dates)
+    if task_dates:
+        db.execute(bump_revisions_statement(db.get_bind().dialect.name, task_dates))
+
+
+def next_change_seq_statement(dialect_name: str):
+    """変更カーソルを1つ進めるUPSERT文を生成"""
+    rows = [{"id": CHANGE_SEQUENCE_ID, "value": 1}]
+    return _increment_statement(dialect_name, TaskChangeSequenceModel, rows, "id", "value")
+
+
+# 1トランザクションで採番する変更の最大件数（表ごと）
+STAMP_BATCH_SIZE = 10000
+
+# 変更カーソルを採番する表（いずれも主キーid・列change_seqを持つ）
+CHANGE_MODELS = (TaskModel, TaskArchiveModel, TaskTombstoneModel)
+
+
+def pending_changes_statement(model, limit: int):
+    """未採番の変更の主キーを取得する文（他の書き込みがロック中の行は飛ばし、その書き込みを待たない）"""
+    return (
+        select(model.id)
+        .where(model.change_seq == PENDING_CHANGE_SEQ)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def stamp_changes_statement(model, row_ids: List[int], change_seq):
+    """未採番の変更に変更カーソルを付けるUPDATE文を生成（updated_atは変えない）"""
+    model_table = model.__table__
+    values = {"change_seq": change_seq}
+    if "updated_at" in model_table.c:
+        values["updated_at"] = model_table.c.updated_at
+    return update(model_table).where(model_table.c.id.in_(row_ids)).values(**values)
+
+
+def tombstones_statement(condition):
+    """条件に合うタスクの削除記録を作成するINSERT ... SELECT文を生成（タスクの削除前に実行する）"""
+    return insert(TaskTombstoneModel).from_select(
+        ["task_id", "date"], select(TaskModel.id, TaskModel.date).where(condition)
+    )
+
+
+def record_tombstones(db: Session, condition) -> None:
+    """削除するタスクの記録を残す（呼び出し側のトランザクション内、タスクの削除の前に実行）"""
+    db.execute(tombstones_statement(condition))
+
+
+# 日付ごとの集計（daily_task_statsの列と同じ順序）
+DAILY_STATS_COLUMNS = ("date", "total", "completed", "with_deadline")
+
+
+def daily_stats_select(condition: TaskCondition):
+    """条件に合うタスク（アーカイブを含む）を日付ごとに集計するSELECT文を生成（各テーブルの日付インデックスの範囲走査）"""
+    tasks = visible_tasks(condition, ("date", "id", "completed", "deadline"))
+    return (
+        select(
+            tasks.c.date,
+            func.count(tasks.c.id),
+            func.count(case((tasks.c.completed == True, 1))),
+            func.count(tasks.c.deadline),
+        )
+        .group_by(tasks.c.date)
+    )
+
+
+def refresh_daily_stats_statements(stats_condition, task_condition: TaskCondition):
+    """日付の集計をtasksから数え直す（DELETE, INSERT ... SELECT）文を生成
+
+    MySQL(InnoDB)のINSERT ... SELECTは読み取り元の行をロックして最新のコミット済みの値を読むため、
+    トランザクション開始時のスナップショットに依存しない。
+    """
+    return (
+        delete(DailyTaskStatsModel).where(stats_condition),
+        insert(DailyTaskStatsModel).from_select(list(DAILY_STATS_COLUMNS), daily_stats_select(task_condition)),
+    )
+
+
+def refresh_daily_stats(db: Session, task_dates: Iterable[date]) -> None:
+    """変更した日付の集計を数え直す（呼び出し側のトランザクション内、tasksへの書き込みの後で実行）
+
+    未flushのORMの変更は先にflushする。
+    """
+    task_dates = set(task_dates)
+    if not task_dates:
+        return
+    db.flush()
+    for statement in refresh_daily_stats_statements(
+        DailyTaskStatsModel.date.in_(task_dates), lambda model: model.date.in_(task_dates)
+    ):
+        db.execute(statement)
+
+
+def list_fingerprint_statement(task_date: date, show_completed: bool):
+    """一覧の変更検知用の集計値（件数, 最終更新日時, 日付のリビジョン）を求める文（同期・非同期で共通）"""
+    revision = (
+        select(TaskDateRevisionModel.revision)
+        .where(TaskDateRevisionModel.date == task_date)
+        .scalar_subquery()
+    )
+    stmt = select(func.count(TaskModel.id), func.max(TaskModel.updated_at), revision).where(
+        TaskModel.date == task_date
+    )
+    if not show_completed:
+        stmt = stmt.where(TaskModel.completed == False)
+    return stmt
 
 
 class SQLAlchemyTaskRepository(TaskRepository):
@@ -24,6 +313,7 @@ class SQLAlchemyTaskRepository(TaskRepository):
             order_index=model.order_index,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            version=model.version,
         )
 
     def _to_model(self, entity: Task) -> TaskModel:
@@ -48,25 +338,448 @@ class SQLAlchemyTaskRepository(TaskRepository):
                 model.deadline = entity.deadline
                 model.completed = entity.completed
                 model.order_index = entity.order_index
+                model.version = TaskModel.version + 1
             return model
 
     def get_by_date(self, task_date: date, show_completed: bool = True) -> List[Task]:
-        """日付でタスクを取得"""
-        query = self.db.query(TaskModel).filter(TaskModel.date == task_date)
-        if not show_completed:
-            query = query.filter(TaskModel.completed == False)
-        tasks = query.order_by(TaskModel.order_index).all()
-        return [self._to_entity(task) for task in tasks]
+        """日付でタスクを取得（アーカイブ済みのタスクを含む）"""
+        return [Task(**row) for row in self.get_rows_by_date(task_date, show_completed)]
+
+    def get_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Task]:
+        """期間内のタスクを取得（アーカイブ済みのタスクを含む）"""
+        return [Task(**row) for row in self.get_rows_by_date_range(start_date, end_date, show_completed)]
+
+    def iter_all(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Task]:
+        """条件に合う全タスクをキーセットページングで取得（メモリ使用量はページ分のみ）"""
+        for row in self.iter_all_rows(start_date, end_date, completed, batch_size):
+            yield Task(**row)
+
+    def get_rows_by_date(
+        self, task_date: date, show_completed: bool = True, fingerprint: Optional[Hashable] = None
+    ) -> List[Dict[str, Any]]:
+        """日付でタスクを列の辞書として取得（ORMモデル・エンティティを経由しない読み取り専用経路）
+
+        tasksとtasks_archiveをUNION ALLした1文で読む。
+        """
+        rows = self.db.execute(DATE_ROWS_STATEMENTS[show_completed], {"task_date": task_date}).mappings()
+        return [dict(row) for row in rows]
+
+    def get_rows_by_date_range(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> List[Dict[str, Any]]:
+        """期間内のタスクを列の辞書として取得（読み取り専用経路、アーカイブ済みのタスクを含む）
+
+        UNION ALLの派生テーブルを並べ替えるとMySQLでは和集合全体を一時表に書き出してソートするため、
+        テーブルごとに日付インデックスの順で読み、アプリ側でマージする。
+        """
+        condition = task_filter(start_date, end_date, None if show_completed else False)
+        per_table = [
+            self.db.execute(ordered_rows_statement(model, condition)).mappings().all()
+            for model in (TaskModel, TaskArchiveModel)
+        ]
+        return [dict(row) for row in heapq.merge(*per_table, key=row_sort_key)]
+
+    def iter_all_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """条件に合う全タスク（アーカイブ済みを含む）を列の辞書としてキーセットページングで取得
+
+        キーセットの条件とLIMITをUNION ALLの外側に付けると、MySQLではページごとに和集合全体を
+        一時表に書き出してソートする（1ページがO(全行)になる）。tasksとtasks_archiveをそれぞれ
+        インデックスの順にページングし、アプリ側でマージする。
+        """
+        condition = task_filter(start_date, end_date, completed)
+        yield from heapq.merge(
+            *(self._iter_table_rows(model, condition, batch_size) for model in (TaskModel, TaskArchiveModel)),
+            key=row_sort_key,
+        )
+
+    def _iter_table_rows(self, model, condition: TaskCondition, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """1つのテーブルの条件に合う行をキーセットページングで取得"""
+        stmt = ordered_rows_statement(model, condition)
+        sort_key = tuple_(model.date, model.order_index, model.id)
+
+        last_key = None
+        while True:
+            page_stmt = stmt if last_key is None else stmt.where(sort_key > tuple_(*last_key))
+            page = self.db.execute(page_stmt.limit(batch_size)).mappings().all()
+            for row in page:
+                yield dict(row)
+            if len(page) < batch_size:
+                return
+            last_key = row_sort_key(page[-1])
+
+    def _fulltext_min_length(self) -> Optional[int]:
+        """全文索引で検索できる最短の語の長さ（全文索引がなければNone）"""
+        bind = self.db.get_bind()
+        dialect_name = bind.dialect.name
+        if dialect_name == "sqlite":
+            available = _sqlite_fts_available.get(bind)
+            if available is None:
+                available = self.db.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": SQLITE_FTS_TABLE},
+                ).first() is not None
+                _sqlite_fts_available[bind] = available
+            if not available:
+                return None
+        return FULLTEXT_MIN_TERM_LENGTH.get(dialect_name)
+
+    def search_rows(
+        self,
+        terms: List[str],
+        limit: int,
+        after: Optional[Tuple[float, int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """全語を含むタスクを関連度順に列の辞書として取得
+
+        MySQLはFULLTEXT(ngram)のMATCH ... AGAINST（BOOLEAN MODE）、SQLiteはFTS5のMATCHとbm25で順位付けする。
+        全文索引で扱えない短い語はLIKEで絞り込むだけで、順位には影響しない。
+        全語が短い（または全文索引がない）場合は索引を使えないLIKEの走査になる。このときは関連度を付けず
+        （scoreは0）、キーセット（ID降順）とLIMITをtasksに直接付けて主キーの逆順に走査し、1ページ分が
+        見つかった時点で止める（一致が少ない語ほど多くの行を読む。期間を指定すると走査する行を絞れる）。
+        """
+        min_length = self._fulltext_min_length()
+        indexed = [term for term in terms if min_length is not None and len(term) >= min_length]
+        scanned = [term for term in terms if term not in indexed]
+        dialect_name = self.db.get_bind().dialect.name
+
+        filters = [
+            or_(TaskModel.title.like(pattern, escape="\\"), TaskModel.memo.like(pattern, escape="\\"))
+            for pattern in (f"%{escape_like(term)}%" for term in scanned)
+        ]
+        if start_date is not None:
+            filters.append(TaskModel.date >= start_date)
+        if end_date is not None:
+            filters.append(TaskModel.date <= end_date)
+        if completed is not None:
+            filters.append(TaskModel.completed == completed)
+
+        if not indexed:
+            stmt = select(*TASK_COLUMNS, literal(0.0).label("score")).where(*filters)
+            if after is not None:
+                stmt = stmt.where(TaskModel.id < after[1])
+            stmt = stmt.order_by(TaskModel.id.desc()).limit(limit)
+            return [dict(row) for row in self.db.execute(stmt).mappings()]
+
+        if dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import match
+
+            # 各語を必須のフレーズとして渡す（演算子として解釈させない）
+            against = " ".join('+"' + term.replace('"', "") + '"' for term in indexed)
+            score = match(TaskModel.title, TaskModel.memo, against=against).in_boolean_mode()
+            stmt = select(*TASK_COLUMNS, score.label("score")).where(score > 0)
+        else:
+            fts = table(SQLITE_FTS_TABLE, column("rowid"))
+            fts_ref = literal_column(SQLITE_FTS_TABLE)
+            expression = " ".join('"' + term.replace('"', '""') + '"' for term in indexed)
+            # bm25は小さいほど関連度が高いため符号を反転する
+            stmt = (
+                select(*TASK_COLUMNS, (-func.bm25(fts_ref)).label("score"))
+                .select_from(fts)
+                .join(TaskModel, TaskModel.id == fts.c.rowid)
+                .where(fts_ref.op("MATCH")(expression))
+            )
+
+        ranked = stmt.where(*filters).subquery()
+        page_stmt = select(ranked)
+        if after is not None:
+            last_score, last_id = after
+            page_stmt = page_stmt.where(or_(
+                ranked.c.score < last_score,
+                and_(ranked.c.score == last_score, ranked.c.id < last_id),
+            ))
+        page_stmt = page_stmt.order_by(ranked.c.score.desc(), ranked.c.id.desc()).limit(limit)
+        return [dict(row) for row in self.db.execute(page_stmt).mappings()]
+
+    def stamp_changes(self, batch_size: int = STAMP_BATCH_SIZE) -> int:
+        """未採番の作成・更新・削除に変更カーソルを付ける（採番した行数を返す）
+
+        採番行をロックするのはこの処理だけで、タスクの書き込みは採番行を待たない。採番行の行ロックは
+        コミットまで保持されるため採番はカーソルの順にコミットされ、差分同期で後から小さいカーソルの変更が
+        現れることはない。未採番の変更がなければ書き込みトランザクションを開始しない。
+        """
+        if not any(
+            self.db.execute(select(model.id).where(model.change_seq == PENDING_CHANGE_SEQ).limit(1)).first()
+            for model in CHANGE_MODELS
+        ):
+            self.db.rollback()
+            return 0
+        change_seq = (
+            select(TaskChangeSequenceModel.value)
+            .where(TaskChangeSequenceModel.id == CHANGE_SEQUENCE_ID)
+            .scalar_subquery()
+        )
+        stamped = 0
+        while True:
+            try:
+                self.db.execute(next_change_seq_statement(self.db.get_bind().dialect.name))
+                has_more = False
+                for model in CHANGE_MODELS:
+                    row_ids = self.db.execute(pending_changes_statement(model, batch_size)).scalars().all()
+                    if row_ids:
+                        self.db.execute(stamp_changes_statement(model, row_ids, change_seq))
+                        stamped += len(row_ids)
+                        has_more = has_more or len(row_ids) == batch_size
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            if not has_more:
+                return stamped
+
+    def get_change_horizon(self) -> Tuple[int, int]:
+        """（コミット済みの最新の変更カーソル, 圧縮済みの変更カーソル）を取得"""
+        row = self.db.execute(
+            select(TaskChangeSequenceModel.value, TaskChangeSequenceModel.compacted_seq)
+            .where(TaskChangeSequenceModel.id == CHANGE_SEQUENCE_ID)
+        ).first()
+        return (row.value, row.compacted_seq) if row else (0, 0)
+
+    def get_changes(
+        self,
+        after: Optional[Tuple[int, int]],
+        upto: int,
+        limit: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """(change_seq, id)がafterより後でupto以下の変更を順に取得
+
+        作成・更新は {"op": "upsert", ...タスクの列}、削除は {"op": "delete", "id", "date"} で、
+        いずれもchange_seqを含む。tasks・tasks_archive・task_tombstonesをそれぞれchange_seqのインデックスで
+        範囲走査してマージする。afterがNone（初回同期）の場合は現存するタスクのみを返す。
+        未採番の変更は含めない（採番後に次の差分として返す）。
+        """
+        # アーカイブは移動時のchange_seqを保つため、アーカイブへの移動は変更として返さない
+        changes = []
+        for model in (TaskModel, TaskArchiveModel):
+            task_stmt = (
+                select(*model_columns(model, TASK_COLUMN_NAMES + ("change_seq",)))
+                .where(model.change_seq.between(0, upto), task_filter(start_date, end_date)(model))
+            )
+            if after is not None:
+                task_stmt = task_stmt.where(tuple_(model.change_seq, model.id) > tuple_(*after))
+            changes += [
+                {"op": "upsert", **row}
+                for row in self.db.execute(task_stmt.order_by(model.change_seq, model.id).limit(limit)).mappings()
+            ]
+
+        tombstone_key = tuple_(TaskTombstoneModel.change_seq, TaskTombstoneModel.task_id)
+        tombstone_stmt = select(
+            TaskTombstoneModel.task_id, TaskTombstoneModel.date, TaskTombstoneModel.change_seq
+        ).where(TaskTombstoneModel.change_seq.between(0, upto))
+        if after is not None:
+            tombstone_stmt = tombstone_stmt.where(tombstone_key > tuple_(*after))
+            if start_date is not None:
+                tombstone_stmt = tombstone_stmt.where(TaskTombstoneModel.date >= start_date)
+            if end_date is not None:
+                tombstone_stmt = tombstone_stmt.where(TaskTombstoneModel.date <= end_date)
+            changes += [
+                {"op": "delete", "id": row.task_id, "date": row.date, "change_seq": row.change_seq}
+                for row in self.db.execute(
+                    tombstone_stmt.order_by(TaskTombstoneModel.change_seq, TaskTombstoneModel.task_id)
+                    .limit(limit)
+                )
+            ]
+        changes.sort(key=lambda change: (change["change_seq"], change["id"]))
+        return changes[:limit]
+
+    def purge_tombstones(self, deleted_before: datetime) -> int:
+        """deleted_beforeより前の削除記録を削除し、圧縮済みの変更カーソルを進める（削除件数を返す）"""
+        try:
+            # 未採番の削除記録はまだ差分で返していないため残す
+            horizon = self.db.execute(
+                select(func.max(TaskTombstoneModel.change_seq))
+                .where(TaskTombstoneModel.deleted_at < deleted_before, TaskTombstoneModel.change_seq >= 0)
+            ).scalar()
+            if horizon is None:
+                self.db.rollback()
+                return 0
+            # 圧縮後の境界より前の変更が残らないよう、削除日時ではなくカーソルで範囲を決める
+            purged = self.db.execute(
+                delete(TaskTombstoneModel).where(TaskTombstoneModel.change_seq.between(0, horizon))
+            ).rowcount
+            # 残っている削除記録はいずれも前回の圧縮済みカーソルより後のため、horizonは単調に増える
+            self.db.execute(
+                update(TaskChangeSequenceModel)
+                .where(TaskChangeSequenceModel.id == CHANGE_SEQUENCE_ID)
+                .values(compacted_seq=horizon)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return purged
+
+    def get_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """期間内の日付ごとの集計をdaily_task_statsから取得（タスクのない日付は含まない）"""
+        rows = self.db.execute(
+            select(DailyTaskStatsModel)
+            .where(DailyTaskStatsModel.date >= start_date, DailyTaskStatsModel.date <= end_date)
+            .order_by(DailyTaskStatsModel.date)
+        ).scalars()
+        return [{name: getattr(row, name) for name in DAILY_STATS_COLUMNS} for row in rows]
+
+    def count_daily_stats(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """期間内の日付ごとの集計をtasks（アーカイブを含む）から数える（集計テーブルの検証用）"""
+        stmt = daily_stats_select(task_filter(start_date, end_date))
+        rows = self.db.execute(stmt.order_by(stmt.selected_columns[0]))
+        return [dict(zip(DAILY_STATS_COLUMNS, row)) for row in rows]
+
+    def get_stats_date_bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        """tasks・tasks_archive・daily_task_statsにある最小・最大の日付（いずれも空ならNone）"""
+        dates = [
+            value
+            for model in (TaskModel, TaskArchiveModel, DailyTaskStatsModel)
+            for value in self.db.execute(select(func.min(model.date), func.max(model.date))).one()
+            if value is not None
+        ]
+        return (min(dates), max(dates)) if dates else (None, None)
+
+    def rebuild_daily_stats(self, start_date: date, end_date: date) -> int:
+        """期間内の集計をtasksから作り直す（1トランザクション。作成した行数を返す）"""
+        try:
+            # 期間内の日付のリビジョン行をロックし、その日付への書き込みと直列化する
+            # （作り直し中の変更が集計から漏れないようにする。期間外の日付への書き込みは待たせない）
+            self.db.execute(
+                select(TaskDateRevisionModel.date)
+                .where(TaskDateRevisionModel.date >= start_date, TaskDateRevisionModel.date <= end_date)
+                .with_for_update()
+            )
+            statements = refresh_daily_stats_statements(
+                and_(DailyTaskStatsModel.date >= start_date, DailyTaskStatsModel.date <= end_date),
+                task_filter(start_date, end_date),
+            )
+            self.db.execute(statements[0])
+            inserted = self.db.execute(statements[1]).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return inserted
+
+    def _check_archivable(self) -> None:
+        """アーカイブしたIDが新しいタスクに再利用されないことを確認（AUTOINCREMENTのない既存のSQLiteは不可）"""
+        if self.db.get_bind().dialect.name != "sqlite":
+            return
+        ddl = self.db.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks'")
+        ).scalar()
+        if ddl and "AUTOINCREMENT" not in ddl.upper():
+            raise ValueError(
+                "The tasks table was created without AUTOINCREMENT and may reuse archived ids; "
+                "recreate the database before archiving"
+            )
+
+    def count_archivable(self, before: date) -> Tuple[int, Optional[date], Optional[date]]:
+        """beforeより前の日付の完了済みタスクの（件数, 最初の日付, 最後の日付）"""
+        self._check_archivable()
+        row = self.db.execute(
+            select(func.count(TaskModel.id), func.min(TaskModel.date), func.max(TaskModel.date))
+            .where(TaskModel.completed == True, TaskModel.date < before)
+        ).one()
+        return row[0], row[1], row[2]
+
+    def archive_completed(
+        self, before: date, limit: int, after: Optional[Tuple[date, int]] = None
+    ) -> Tuple[int, Optional[Tuple[date, int]]]:
+        """beforeより前の日付の完了済みタスクを(date, id)順に最大limit件アーカイブへ移す（1トランザクション）
+
+        afterには前回の戻り値（最後に移したタスクの(date, id)）を渡し、残っている未完了のタスクを
+        読み直さずに続きから処理する。（移した件数, 最後に移したタスクの(date, id)）を返す。
+        """
+        self._check_archivable()
+        try:
+            stmt = select(TaskModel.id, TaskModel.date).where(TaskModel.completed == True, TaskModel.date < before)
+            if after is not None:
+                stmt = stmt.where(tuple_(TaskModel.date, TaskModel.id) > tuple_(*after))
+            candidates = self.db.execute(stmt.order_by(TaskModel.date, TaskModel.id).limit(limit)).all()
+            if not candidates:
+                self.db.rollback()
+                return 0, after
+            # 移す日付のリビジョン行をロックしてから行をロックし直す（その日付への書き込み・復元と直列化する）
+            task_dates = {row.date for row in candidates}
+            bump_date_revisions(self.db, task_dates)
+            rows = self.db.execute(
+                stmt.where(TaskModel.id.in_([row.id for row in candidates]), TaskModel.date.in_(task_dates))
+                .order_by(TaskModel.date, TaskModel.id)
+                .with_for_update()
+            ).all()
+            task_ids = [row.id for row in rows]
+            # change_seqはそのまま移す（差分同期では変更として扱わない）
+            names = list(TASK_COLUMN_NAMES) + ["change_seq"]
+            self.db.execute(
+                insert(TaskArchiveModel).from_select(
+                    names, select(*model_columns(TaskModel, names)).where(TaskModel.id.in_(task_ids))
+                )
+            )
+            self.db.execute(
+                delete(TaskModel).where(TaskModel.id.in_(task_ids)).execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        # ロックまでの間に未完了に戻った行は飛ばし、次のバッチは候補の続きから読む
+        return len(rows), (candidates[-1].date, candidates[-1].id)
+
+    def _lock_task_dates(
+        self, task_ids: List[int], task_dates: Iterable[date] = ()
+    ) -> Tuple[Set[date], Set[date]]:
+        """IDのタスクの日付とtask_datesのリビジョンを進めてロック（書き込みの最初に呼ぶ）
+
+        （ロックした日付, IDのタスクのうちアーカイブ済みのものの日付）を返す。
+        """
+        locked_dates = set(task_dates)
+        archived_dates = set()
+        if task_ids:
+            for row in self.db.execute(task_dates_statement(task_ids)):
+                locked_dates.add(row.date)
+                if row.archived:
+                    archived_dates.add(row.date)
+        bump_date_revisions(self.db, locked_dates)
+        return locked_dates, archived_dates
+
+    def _lock_moved_dates(self, locked_dates: Set[date], task_dates: Iterable[date]) -> None:
+        """ロックの後に読んだ行の日付のうち、まだロックしていないもの（並行して日付が移った行）をロック"""
+        bump_date_revisions(self.db, set(task_dates) - locked_dates)
+
+    def _get_archived_rows(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """アーカイブ済みのタスクを列の辞書として取得"""
+        stmt = select(*model_columns(TaskArchiveModel)).where(TaskArchiveModel.id.in_(task_ids))
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
-        """IDでタスクを取得"""
+        """IDでタスクを取得（tasksになければアーカイブから取得）"""
         task = self.db.query(TaskModel).filter(TaskModel.id == task_id).first()
-        return self._to_entity(task) if task else None
+        if task:
+            return self._to_entity(task)
+        rows = self._get_archived_rows([task_id])
+        return Task(**rows[0]) if rows else None
 
     def create(self, task: Task) -> Task:
         """タスクを作成"""
+        bump_date_revisions(self.db, [task.date])
+        restore_archived(self.db, TaskArchiveModel.date == task.date)
         model = self._to_model(task)
         self.db.add(model)
+        refresh_daily_stats(self.db, [task.date])
         self.db.commit()
         self.db.refresh(model)
         entity = self._to_entity(model)
@@ -75,9 +788,42 @@ class SQLAlchemyTaskRepository(TaskRepository):
         entity.updated_at = model.updated_at
         return entity
 
+    def _last_order_index(self, task_date: date) -> Optional[int]:
+        """日付内の最大order_indexをロック付きで取得（idx_date_orderの末尾1件のみ読む）"""
+        return self.db.execute(
+            select(TaskModel.order_index)
+            .where(TaskModel.date == task_date)
+            .order_by(TaskModel.order_index.desc())
+            .limit(1)
+            .with_for_update()
+        ).scalar_one_or_none()
+
+    def append(self, task: Task, step: int) -> Task:
+        """日付の末尾にタスクを作成（最大order_index + stepを挿入と同じトランザクションで採番）"""
+        try:
+            # 日付のリビジョン行のロックで同じ日付への並行作成を直列化する
+            bump_date_revisions(self.db, [task.date])
+            restore_archived(self.db, TaskArchiveModel.date == task.date)
+            task.order_index = rank_between(self._last_order_index(task.date), None, step)
+            model = self._to_model(task)
+            self.db.add(model)
+            refresh_daily_stats(self.db, [task.date])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(model)
+        return self._to_entity(model)
+
     def update(self, task: Task) -> Task:
         """タスクを更新"""
+        locked_dates, _ = self._lock_task_dates([task.id], [task.date])
+        restore_archived(self.db, or_(TaskArchiveModel.id == task.id, TaskArchiveModel.date == task.date))
         model = self._to_model(task)
+        # 日付が変わる場合は移動元の日付のリビジョン・集計も更新する
+        task_dates = [model.date, *inspect(model).attrs.date.history.deleted]
+        self._lock_moved_dates(locked_dates, task_dates)
+        refresh_daily_stats(self.db, task_dates)
         self.db.commit()
         self.db.refresh(model)
         entity = self._to_entity(model)
@@ -85,19 +831,309 @@ class SQLAlchemyTaskRepository(TaskRepository):
         entity.updated_at = model.updated_at
         return entity
 
+    def patch(
+        self, task_id: int, changes: Dict[str, Any], expected_version: Optional[int] = None
+    ) -> Task:
+        """変更された列のみを1つのUPDATE文で書き換え（expected_version指定時はバージョン一致が条件）
+
+        UPDATEの前に主キーで日付を読み（アーカイブ済みかも同じ文で確認）、日付のリビジョン行をロックする。
+        集計は完了状態・期限を変えたときだけ数え直す。
+        """
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(**changes, version=TaskModel.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(TaskModel.version == expected_version)
+
+        try:
+            locked_dates, archived_dates = self._lock_task_dates([task_id])
+            if not locked_dates:
+                raise TaskNotFoundError(f"Task with id {task_id} not found")
+            restore_archived_dates(self.db, archived_dates)
+            if self.db.get_bind().dialect.update_returning:
+                # RETURNING対応DB（SQLite 3.35+ / MariaDB / PostgreSQL）は更新後の行を同じ文で受け取る
+                row = self.db.execute(stmt.returning(*TASK_COLUMNS)).mappings().first()
+            elif self.db.execute(stmt).rowcount:
+                row = self.db.execute(select(*TASK_COLUMNS).where(TaskModel.id == task_id)).mappings().first()
+            else:
+                row = None
+
+            if row is None:
+                # 0行更新: 存在しないのかバージョン不一致なのかを判別
+                current_version = self.db.execute(
+                    select(TaskModel.version).where(TaskModel.id == task_id)
+                ).scalar_one_or_none()
+                if current_version is None:
+                    raise TaskNotFoundError(f"Task with id {task_id} not found")
+                raise VersionConflictError(task_id, expected_version, current_version)
+
+            self._lock_moved_dates(locked_dates, [row["date"]])
+            if "completed" in changes or "deadline" in changes:
+                refresh_daily_stats(self.db, [row["date"]])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return Task(**row)
+
     def delete(self, task_id: int) -> None:
         """タスクを削除"""
+        locked_dates, archived_dates = self._lock_task_dates([task_id])
+        restore_archived_dates(self.db, archived_dates)
         task = self.db.query(TaskModel).filter(TaskModel.id == task_id).first()
         if task:
+            self._lock_moved_dates(locked_dates, [task.date])
+            record_tombstones(self.db, TaskModel.id == task_id)
             self.db.delete(task)
+            refresh_daily_stats(self.db, [task.date])
             self.db.commit()
+        else:
+            self.db.rollback()
 
     def update_order(self, task_id: int, order_index: int) -> Task:
         """タスクの順序を更新"""
+        locked_dates, archived_dates = self._lock_task_dates([task_id])
+        restore_archived_dates(self.db, archived_dates)
         task = self.db.query(TaskModel).filter(TaskModel.id == task_id).first()
         if not task:
+            self.db.rollback()
             raise ValueError(f"Task with id {task_id} not found")
+        self._lock_moved_dates(locked_dates, [task.date])
         task.order_index = order_index
+        task.version = TaskModel.version + 1
         self.db.commit()
         self.db.refresh(task)
         return self._to_entity(task)
+
+    def get_by_ids(self, task_ids: List[int]) -> List[Task]:
+        """複数IDでタスクを一括取得（tasksにないIDはアーカイブから取得）"""
+        if not task_ids:
+            return []
+        tasks = [
+            self._to_entity(task) for task in self.db.query(TaskModel).filter(TaskModel.id.in_(task_ids)).all()
+        ]
+        missing_ids = set(task_ids) - {task.id for task in tasks}
+        if missing_ids:
+            tasks += [Task(**row) for row in self._get_archived_rows(list(missing_ids))]
+        return tasks
+
+    def get_max_order_indexes(self, task_dates: List[date]) -> Dict[date, Optional[int]]:
+        """日付ごとの最大order_indexを一括取得（アーカイブ済みのタスクを含む）"""
+        if not task_dates:
+            return {}
+        tasks = visible_tasks(lambda model: model.date.in_(task_dates), ("date", "order_index"))
+        rows = self.db.execute(
+            select(tasks.c.date, func.max(tasks.c.order_index)).group_by(tasks.c.date)
+        ).all()
+        max_indexes: Dict[date, Optional[int]] = {task_date: None for task_date in task_dates}
+        max_indexes.update({task_date: max_index for task_date, max_index in rows})
+        return max_indexes
+
+    def get_list_fingerprint(
+        self, task_date: date, show_completed: bool = True
+    ) -> Tuple[int, Optional[datetime], int]:
+        """一覧の変更検知用の集計値（件数, 最終更新日時, 日付のリビジョン）を1クエリで取得"""
+        count, last_updated, current_revision = self.db.execute(
+            list_fingerprint_statement(task_date, show_completed)
+        ).one()
+        return count, last_updated, current_revision or 0
+
+    def get_order_neighbors(
+        self, task_date: date, position: int, exclude_id: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """表示位置positionの前後にあるタスクのorder_indexを取得（アーカイブ済みのタスクを含む並び順）"""
+        def condition(model):
+            if exclude_id is None:
+                return model.date == task_date
+            return and_(model.date == task_date, model.id != exclude_id)
+
+        tasks = visible_tasks(condition, ("id", "order_index"))
+        stmt = select(tasks.c.order_index).order_by(tasks.c.order_index, tasks.c.id)
+
+        if position <= 0:
+            return None, self.db.execute(stmt.limit(1)).scalar_one_or_none()
+
+        rows = self.db.execute(stmt.offset(position - 1).limit(2)).scalars().all()
+        if not rows:
+            # 末尾より後ろの位置は末尾への追加として扱う
+            return self.get_max_order_indexes([task_date])[task_date], None
+        return rows[0], rows[1] if len(rows) > 1 else None
+
+    def rebalance_order(self, task_date: date, step: int) -> None:
+        """現在の並び順を保ったままorder_indexを一定間隔で振り直す"""
+        try:
+            bump_date_revisions(self.db, [task_date])
+            restore_archived(self.db, TaskArchiveModel.date == task_date)
+            task_ids = [
+                row.id
+                for row in self.db.query(TaskModel.id)
+                .filter(TaskModel.date == task_date)
+                .order_by(TaskModel.order_index, TaskModel.id)
+                .with_for_update()
+                .all()
+            ]
+            self._write_order(task_date, task_ids, step)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def apply_batch(
+        self,
+        creates: List[Task],
+        updates: List[Task],
+        delete_ids: List[int],
+        delete_dates: Sequence[date] = (),
+    ) -> Tuple[List[Task], List[Task]]:
+        """作成・更新・削除を1トランザクションで一括適用（delete_datesの日付は作成より前に全て削除）"""
+        try:
+            target_ids = [task.id for task in updates] + delete_ids
+            locked_dates, _ = self._lock_task_dates(target_ids, [task.date for task in creates] + list(delete_dates))
+            restore_archived(self.db, or_(
+                TaskArchiveModel.id.in_(target_ids),
+                TaskArchiveModel.date.in_({task.date for task in creates} | set(delete_dates)),
+            ))
+            if delete_dates:
+                # 読み込み済みのIDではなく日付で消す（キャッシュの古い一覧や並行した作成の取り残しを防ぐ）
+                record_tombstones(self.db, TaskModel.date.in_(delete_dates))
+                self.db.execute(
+                    delete(TaskModel)
+                    .where(TaskModel.date.in_(delete_dates))
+                    .execution_options(synchronize_session=False)
+                )
+            # 作成はまとめてflush（ID順序を保証できるDBではINSERTが複数行1文にまとめられる）
+            created_models = [self._to_model(task) for task in creates]
+            self.db.add_all(created_models)
+            self.db.flush()
+            created_ids = [model.id for model in created_models]
+            touched_dates = [task.date for task in creates] + list(delete_dates)
+
+            # 更新・削除対象の変更前の日付
+            if target_ids:
+                touched_dates += [
+                    row.date
+                    for row in self.db.query(TaskModel.date)
+                    .filter(TaskModel.id.in_(target_ids))
+                    .distinct()
+                ]
+
+            # 更新は主キー指定のexecutemany UPDATE（バージョンはSQL側で進める）
+            if updates:
+                self.db.execute(
+                    update(TaskModel.__table__)
+                    .where(TaskModel.id == bindparam("task_id"))
+                    .values(
+                        title=bindparam("new_title"),
+                        memo=bindparam("new_memo"),
+                        deadline=bindparam("new_deadline"),
+                        completed=bindparam("new_completed"),
+                        order_index=bindparam("new_order_index"),
+                        version=TaskModel.version + 1,
+                    ),
+                    [
+                        {
+                            "task_id": task.id,
+                            "new_title": task.title,
+                            "new_memo": task.memo,
+                            "new_deadline": task.deadline,
+                            "new_completed": task.completed,
+                            "new_order_index": task.order_index,
+                        }
+                        for task in updates
+                    ],
+                )
+
+            if delete_ids:
+                record_tombstones(self.db, TaskModel.id.in_(delete_ids))
+                self.db.execute(
+                    delete(TaskModel)
+                    .where(TaskModel.id.in_(delete_ids))
+                    .execution_options(synchronize_session=False)
+                )
+
+            self._lock_moved_dates(locked_dates, touched_dates)
+            refresh_daily_stats(self.db, touched_dates)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # 作成・更新後の行（タイムスタンプ含む）を1クエリで再取得
+        updated_ids = [task.id for task in updates]
+        tasks_by_id = {task.id: task for task in self.get_by_ids(created_ids + updated_ids)}
+        return (
+            [tasks_by_id[task_id] for task_id in created_ids],
+            [tasks_by_id[task_id] for task_id in updated_ids],
+        )
+
+    def insert_many(self, tasks: List[Task]) -> int:
+        """タスクをexecutemanyのINSERT 1文で一括挿入（RETURNINGもrefreshもしない）"""
+        if not tasks:
+            return 0
+        try:
+            task_dates = {task.date for task in tasks}
+            bump_date_revisions(self.db, task_dates)
+            restore_archived(self.db, TaskArchiveModel.date.in_(task_dates))
+            self.db.execute(
+                insert(TaskModel),
+                [
+                    {
+                        "date": task.date,
+                        "title": task.title,
+                        "memo": task.memo,
+                        "deadline": task.deadline,
+                        "completed": task.completed,
+                        "order_index": task.order_index,
+                    }
+                    for task in tasks
+                ],
+            )
+            refresh_daily_stats(self.db, task_dates)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(tasks)
+
+    def _write_order(self, task_date: date, task_ids: List[int], step: int) -> None:
+        """task_idsの並び順でorder_indexを1つのUPDATE文で書き換え（コミットはしない）"""
+        if not task_ids:
+            return
+        self.db.execute(
+            update(TaskModel)
+            .where(TaskModel.date == task_date, TaskModel.id.in_(task_ids))
+            .values(
+                order_index=case(
+                    {task_id: index * step for index, task_id in enumerate(task_ids)},
+                    value=TaskModel.id,
+                ),
+                version=TaskModel.version + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def reorder(self, task_date: date, task_ids: List[int], step: int = 1) -> List[Task]:
+        """日付内のタスク順序を1つのUPDATE文で書き換え"""
+        try:
+            bump_date_revisions(self.db, [task_date])
+            restore_archived(self.db, TaskArchiveModel.date == task_date)
+            # 日付内のタスクをロックしてIDの集合を検証
+            current_ids = {
+                row.id
+                for row in self.db.query(TaskModel.id)
+                .filter(TaskModel.date == task_date)
+                .with_for_update()
+                .all()
+            }
+            if current_ids != set(task_ids):
+                raise ValueError(f"Task ids do not match the tasks on {task_date}")
+
+            self._write_order(task_date, task_ids, step)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.get_by_date(task_date)
@@ -1,16 +1,64 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from app.infrastructure.database import engine
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.infrastructure.cache import task_list_cache
+from app.infrastructure.database import USE_ASYNC, async_engine, engine, replica_engine
+from app.infrastructure.event_bus import task_event_bus
+from app.infrastructure.job_runner import JOBS_ENABLED
+from app.infrastructure.metrics import (
+    METRICS_ENABLED,
+    Gauge,
+    MetricsMiddleware,
+    instrument_usecases,
+    register_cache_metrics,
+    register_pool_metrics,
+    registry,
+)
+from app.infrastructure.query_stats import QueryStatsMiddleware
+from app.infrastructure.startup import ensure_schema, schema_is_cached, start_background_startup, startup_state
+from app.presentation.session_routing import PRIMARY_PIN_HEADER, PrimaryPinMiddleware
 from app.infrastructure.models import TaskModel
 from app.infrastructure.database import Base
 
-# データベーステーブル作成
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動・終了処理
+
+    同じスキーマのバージョンで確認済みのDBならテーブル作成を省略して即座に受付を開始し、
+    実在の確認とコネクションプールのウォームアップはバックグラウンドで行う。
+    """
+    with startup_state.phase("schema check (startup)"):
+        if schema_is_cached(engine, Base.metadata):
+            startup_state.schema_ready = True
+        else:
+            try:
+                await run_in_threadpool(ensure_schema, engine, Base.metadata)
+                startup_state.schema_ready = True
+            except Exception as e:
+                # DBの起動待ちなど。バックグラウンドで再試行し、/ready は503を返す
+                startup_state.error = f"{type(e).__name__}: {e}"
+    start_background_startup(engine, Base.metadata)
+    if JOBS_ENABLED:
+        await run_in_threadpool(job_runner.start)
+    yield
+    # 実行中のジョブは中断して待機中に戻す（エンジンを閉じる前に止める）
+    await run_in_threadpool(job_runner.stop)
+    engine.dispose()
+    if replica_engine is not engine:
+        replica_engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+
 
 app = FastAPI(
     title="Task Management API",
     description="日々のタスク管理API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS設定（Electronアプリからのアクセスを許可）
@@ -20,11 +68,44 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 読み取りをプライマリに固定する期限をレンダラーのスクリプトから読めるようにする
+    expose_headers=[PRIMARY_PIN_HEADER],
 )
 
-# ルーター登録
-from app.presentation import controllers
+# 書き込み直後の読み取りをプライマリに固定（REPLICA_DATABASE_URL設定時のみ）
+app.add_middleware(PrimaryPinMiddleware)
+
+# リクエストごとのSQL集計（APP_DEBUG=true でレスポンスヘッダーに出力）
+app.add_middleware(QueryStatsMiddleware)
+
+# メトリクス（/metrics でPrometheusのテキスト形式を出力）
+if METRICS_ENABLED:
+    from app.usecases import async_task_usecases, task_usecases
+
+    app.add_middleware(MetricsMiddleware)
+    instrument_usecases(task_usecases, async_task_usecases)
+    engines = {"primary": engine}
+    if replica_engine is not engine:
+        engines["replica"] = replica_engine
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    register_pool_metrics(engines)
+    register_cache_metrics("task_list", task_list_cache.stats)
+    registry.register(Gauge(
+        "task_event_stat", "Change feed statistics (subscribers, published, dropped).", ("stat",),
+        lambda: {(stat,): value for stat, value in task_event_bus.stats().items()},
+    ))
+
+# ルーター登録（非同期スタック有効時は同じパスの非同期エンドポイントを優先）
+if USE_ASYNC:
+    from app.presentation import async_controllers
+    app.include_router(async_controllers.router)
+
+from app.presentation import controllers, event_controllers, job_controllers
+from app.presentation.job_controllers import job_runner
 app.include_router(controllers.router)
+app.include_router(event_controllers.router)
+app.include_router(job_controllers.router)
 
 
 @app.get("/")
@@ -35,3 +116,25 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+def readiness_check():
+    """スキーマ作成とプールのウォームアップが完了していれば200、未完了なら503"""
+    if startup_state.ready:
+        return {"status": "ready"}
+    return JSONResponse(
+        status_code=503,
+        content={
+            "status": "starting",
+            "schema_ready": startup_state.schema_ready,
+            "warmup_done": startup_state.warmup_done,
+            "error": startup_state.error,
+        },
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """Prometheusのテキスト形式でメトリクスを出力"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,197 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Optional
+
+from app.infrastructure.database import AsyncSessionLocal, get_async_db
+from app.domain.repositories import AsyncTaskRepository
+from app.infrastructure.async_task_repository import AsyncSQLAlchemyTaskRepository
+from app.infrastructure.cache import TASK_CACHE_SIZE, task_list_cache
+from app.infrastructure.cached_task_repository import AsyncCachedTaskRepository
+from app.infrastructure.event_bus import task_event_bus
+from app.usecases.async_task_usecases import (
+    AsyncGetTasksUseCase,
+    AsyncGetTaskListFingerprintUseCase,
+    AsyncGetTaskUseCase,
+    AsyncCreateTaskUseCase,
+    AsyncUpdateTaskUseCase,
+    AsyncDeleteTaskUseCase,
+    AsyncUpdateTaskOrderUseCase,
+    AsyncRebalanceTaskOrderUseCase,
+    AsyncReorderTasksUseCase,
+)
+from app.domain.entities import parse_time
+from app.presentation.controllers import etag_matches, make_etag, task_to_response, version_etag
+from app.presentation.schemas import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskListResponse,
+    TaskOrderUpdate,
+    TaskReorder,
+)
+
+
+# 同期版controllers.routerより先に登録し、同じパスのエンドポイントを置き換える。
+# task_idはint変換子で受け、/range などの同期版のみのパスに一致しないようにする。
+router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
+
+
+def build_repository(db: AsyncSession) -> AsyncTaskRepository:
+    """非同期リポジトリを組み立て（キャッシュ有効時は書き込みで同期版の一覧キャッシュを無効化する）"""
+    repository = AsyncSQLAlchemyTaskRepository(db)
+    if TASK_CACHE_SIZE > 0:
+        return AsyncCachedTaskRepository(repository, task_list_cache)
+    return repository
+
+
+def get_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncTaskRepository:
+    """非同期リポジトリを取得"""
+    return build_repository(db)
+
+
+async def rebalance_task_order(task_date: date) -> None:
+    """バックグラウンドでタスク順序を振り直す（リクエストとは別セッション）"""
+    async with AsyncSessionLocal() as db:
+        await AsyncRebalanceTaskOrderUseCase(
+            build_repository(db), events=task_event_bus
+        ).execute(task_date)
+
+
+def schedule_rebalance(background_tasks: BackgroundTasks):
+    """順序値の隙間が少なくなった日付の振り直しをレスポンス後に予約"""
+    return lambda task_date: background_tasks.add_task(rebalance_task_order, task_date)
+
+
+@router.get("", response_model=TaskListResponse)
+async def get_tasks(
+    response: Response,
+    task_date: date = Query(..., alias="date"),
+    show_completed: bool = Query(True, alias="show_completed"),
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """日付別タスク一覧取得（同期版と同じ集計値のETagが一致すれば行を取得せず304を返す）"""
+    fingerprint = await AsyncGetTaskListFingerprintUseCase(repository).execute(task_date, show_completed)
+    etag = make_etag(task_date, show_completed, *fingerprint)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    usecase = AsyncGetTasksUseCase(repository)
+    tasks = await usecase.execute(task_date, show_completed)
+    response.headers["ETag"] = etag
+    return TaskListResponse(tasks=[task_to_response(task) for task in tasks])
+
+
+@router.get("/{task_id:int}", response_model=TaskResponse)
+async def get_task(
+    task_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """タスク詳細取得（バージョンのETagが一致すれば304を返す）"""
+    usecase = AsyncGetTaskUseCase(repository)
+    task = await usecase.execute(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    etag = version_etag(task.version)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return task_to_response(task)
+
+
+@router.post("", response_model=TaskResponse, status_code=201)
+async def create_task(
+    task: TaskCreate,
+    background_tasks: BackgroundTasks,
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """タスク作成"""
+    usecase = AsyncCreateTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
+    created_task = await usecase.execute(
+        date=task.date,
+        title=task.title,
+        memo=task.memo,
+        deadline=parse_time(task.deadline),
+        completed=task.completed,
+        order_index=task.order_index,
+    )
+    return task_to_response(created_task)
+
+
+@router.put("/order", response_model=TaskListResponse)
+async def reorder_tasks(
+    reorder: TaskReorder,
+    task_date: date = Query(..., alias="date"),
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """日付内タスク一括並び替え"""
+    usecase = AsyncReorderTasksUseCase(repository, events=task_event_bus)
+    try:
+        tasks = await usecase.execute(task_date, reorder.task_ids)
+        return TaskListResponse(tasks=[task_to_response(task) for task in tasks])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.put("/{task_id:int}", response_model=TaskResponse)
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    background_tasks: BackgroundTasks,
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """タスク更新"""
+    usecase = AsyncUpdateTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
+    deadline_time = parse_time(task_update.deadline) if task_update.deadline else None
+
+    try:
+        updated_task = await usecase.execute(
+            task_id=task_id,
+            title=task_update.title,
+            memo=task_update.memo,
+            deadline=deadline_time,
+            completed=task_update.completed,
+            order_index=task_update.order_index,
+        )
+        return task_to_response(updated_task)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.delete("/{task_id:int}")
+async def delete_task(
+    task_id: int,
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """タスク削除"""
+    usecase = AsyncDeleteTaskUseCase(repository, events=task_event_bus)
+    try:
+        await usecase.execute(task_id)
+        return {"message": "Task deleted successfully"}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.put("/{task_id:int}/order", response_model=TaskResponse)
+async def update_task_order(
+    task_id: int,
+    order_update: TaskOrderUpdate,
+    background_tasks: BackgroundTasks,
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    """タスク順序更新（gapモードではorder_indexを表示位置として扱う）"""
+    usecase = AsyncUpdateTaskOrderUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
+    try:
+        updated_task = await usecase.execute(task_id, order_update.order_index)
+        return task_to_response(updated_task)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -1,46 +1,143 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from starlette.background import BackgroundTask
+from typing import AsyncIterator, Iterable, Iterator, Optional, Tuple
 from datetime import date, time
+import base64
+import binascii
+import codecs
+import csv
+import hashlib
+import io
+import orjson
 
-from app.infrastructure.database import get_db
+from app.infrastructure.database import SessionLocal, engine, get_db
+from app.domain.repositories import TaskRepository
+from app.infrastructure.cache import TASK_CACHE_SIZE, task_list_cache
+from app.infrastructure.cached_task_repository import CachedTaskRepository
+from app.infrastructure.event_bus import task_event_bus
+from app.infrastructure.query_stats import allow_repeated_statements, iter_allowing_repeats
 from app.infrastructure.task_repository import SQLAlchemyTaskRepository
 from app.usecases.task_usecases import (
     GetTasksUseCase,
+    GetTaskListFingerprintUseCase,
+    GetTasksByDateRangeUseCase,
+    SearchTasksUseCase,
+    GetTaskChangesUseCase,
+    GetTaskStatsUseCase,
+    ExportTasksUseCase,
+    ImportTasksUseCase,
     GetTaskUseCase,
     CreateTaskUseCase,
     UpdateTaskUseCase,
+    PatchTaskUseCase,
     DeleteTaskUseCase,
     UpdateTaskOrderUseCase,
+    RebalanceTaskOrderUseCase,
+    ReorderTasksUseCase,
+    BatchTaskUseCase,
+    CreateDummyTasksUseCase,
+    TaskOperation,
 )
 from app.presentation.schemas import (
     TaskCreate,
     TaskUpdate,
     TaskResponse,
     TaskListResponse,
+    TaskRangeResponse,
+    TaskSearchResponse,
+    TaskChangesResponse,
+    TaskStatsResponse,
     TaskOrderUpdate,
+    TaskReorder,
+    TaskBatchRequest,
+    TaskBatchResult,
+    TaskBatchResponse,
+    TaskImportError,
+    TaskImportResponse,
 )
-from app.domain.entities import Task
+from app.presentation.session_routing import get_read_db, open_read_session
+from app.domain.entities import Task, parse_time
+from app.domain.exceptions import ChangeCursorExpiredError, TaskNotFoundError, VersionConflictError
 
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 
 
-def get_repository(db: Session = Depends(get_db)) -> SQLAlchemyTaskRepository:
+def build_repository(db: Session) -> TaskRepository:
+    """リポジトリを組み立て（キャッシュ有効時は日付別一覧キャッシュで包む）"""
+    repository = SQLAlchemyTaskRepository(db)
+    if TASK_CACHE_SIZE > 0:
+        return CachedTaskRepository(repository, task_list_cache)
+    return repository
+
+
+def get_repository(db: Session = Depends(get_db)) -> TaskRepository:
     """リポジトリを取得"""
+    return build_repository(db)
+
+
+def build_read_repository(db: Session) -> TaskRepository:
+    """読み取り用リポジトリを組み立て
+
+    レプリカから読んだ結果はキャッシュしない（遅延した値で無効化後のキャッシュを埋め直さないため）。
+    """
+    if db.get_bind() is engine:
+        return build_repository(db)
     return SQLAlchemyTaskRepository(db)
 
 
-def parse_time(time_str: Optional[str]) -> Optional[time]:
-    """文字列をtimeオブジェクトに変換"""
-    if time_str is None:
+def get_read_repository(db: Session = Depends(get_read_db)) -> TaskRepository:
+    """読み取り専用エンドポイント用のリポジトリを取得（レプリカ設定時はレプリカ）"""
+    return build_read_repository(db)
+
+
+def rebalance_task_order(task_date: date) -> None:
+    """バックグラウンドでタスク順序を振り直す（リクエストとは別セッション）"""
+    db = SessionLocal()
+    try:
+        RebalanceTaskOrderUseCase(build_repository(db), events=task_event_bus).execute(task_date)
+    finally:
+        db.close()
+
+
+def schedule_rebalance(background_tasks: BackgroundTasks):
+    """順序値の隙間が少なくなった日付の振り直しをレスポンス後に予約"""
+    return lambda task_date: background_tasks.add_task(rebalance_task_order, task_date)
+
+
+def make_etag(*parts) -> str:
+    """値の組から強いETagを生成"""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-MatchヘッダーがETagに一致するか（弱い比較）"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+def version_etag(version: int) -> str:
+    """タスクのバージョンから詳細・PATCH用のETagを生成（更新のたびにバージョンが進む）"""
+    return f'"{version}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """If-MatchヘッダーのETagから期待するバージョンを取得（未指定・*はNone）"""
+    if if_match is None or if_match.strip() == "*":
         return None
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return time(int(parts[0]), int(parts[1]))
-    elif len(parts) == 3:
-        return time(int(parts[0]), int(parts[1]), int(parts[2]))
-    return None
+    tag = if_match.strip()
+    # If-Matchは強い比較のため弱いETagは受け付けない
+    if len(tag) < 3 or not (tag.startswith('"') and tag.endswith('"')) or not tag[1:-1].isdigit():
+        raise HTTPException(status_code=400, detail="If-Match must be a single strong ETag")
+    return int(tag[1:-1])
 
 
 def task_to_response(task: Task) -> TaskResponse:
@@ -55,6 +152,7 @@ def task_to_response(task: Task) -> TaskResponse:
         order_index=task.order_index,
         created_at=task.created_at,
         updated_at=task.updated_at,
+        version=task.version,
     )
 
 
@@ -62,34 +160,248 @@ def task_to_response(task: Task) -> TaskResponse:
 def get_tasks(
     task_date: date = Query(..., alias="date"),
     show_completed: bool = Query(True, alias="show_completed"),
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    if_none_match: Optional[str] = Header(None),
+    repository: TaskRepository = Depends(get_read_repository),
 ):
-    """日付別タスク一覧取得"""
+    """日付別タスク一覧取得（集計値のETagが一致すれば行を取得せず304を返す）"""
+    fingerprint = GetTaskListFingerprintUseCase(repository).execute(task_date, show_completed)
+    etag = make_etag(task_date, show_completed, *fingerprint)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # DBの値は検証済みのため、列の辞書をそのままorjsonで書き出す（キャッシュはETagと同じ集計値の行を返す）
     usecase = GetTasksUseCase(repository)
-    tasks = usecase.execute(task_date, show_completed)
-    return TaskListResponse(tasks=[task_to_response(task) for task in tasks])
+    rows = usecase.execute_rows(task_date, show_completed, fingerprint)
+    return ORJSONResponse({"tasks": rows}, headers={"ETag": etag})
+
+
+@router.get("/range", response_model=TaskRangeResponse)
+def get_tasks_by_range(
+    start: date = Query(...),
+    end: date = Query(...),
+    show_completed: bool = Query(True, alias="show_completed"),
+    repository: TaskRepository = Depends(get_read_repository),
+):
+    """期間指定タスク一覧取得（週・月表示用、/{task_id}より先に定義する）"""
+    usecase = GetTasksByDateRangeUseCase(repository)
+    try:
+        rows_by_date = usecase.execute_rows(start, end, show_completed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({
+        "days": [{"date": task_date, "tasks": rows} for task_date, rows in rows_by_date.items()]
+    })
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+def get_task_stats(
+    start: date = Query(...),
+    end: date = Query(...),
+    group: str = Query("day", pattern="^(day|week|month)$"),
+    repository: TaskRepository = Depends(get_read_repository),
+):
+    """日・週・月ごとの件数と完了率（集計テーブルのみを読む。/{task_id}より先に定義する）"""
+    usecase = GetTaskStatsUseCase(repository)
+    try:
+        stats = usecase.execute(start, end, group)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(stats)
+
+
+def encode_search_cursor(score: float, task_id: int) -> str:
+    """検索結果の最後の行から次のページのカーソルを生成"""
+    return base64.urlsafe_b64encode(orjson.dumps([score, task_id])).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """カーソルを(score, id)に戻す（不正な値は400）"""
+    if cursor is None:
+        return None
+    try:
+        score, task_id = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(score), int(task_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/search", response_model=TaskSearchResponse)
+def search_tasks(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1),
+    cursor: Optional[str] = Query(None),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    completed: Optional[bool] = Query(None),
+    repository: TaskRepository = Depends(get_read_repository),
+):
+    """タイトル・メモの全文検索（関連度順、cursorで次のページを取得。/{task_id}より先に定義する）"""
+    after = decode_search_cursor(cursor)
+    usecase = SearchTasksUseCase(repository)
+    try:
+        rows, has_more = usecase.execute_rows(q, limit, after, start, end, completed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    next_cursor = encode_search_cursor(rows[-1]["score"], rows[-1]["id"]) if has_more else None
+    return ORJSONResponse({"tasks": rows, "next_cursor": next_cursor})
+
+
+EXPORT_FIELDS = [
+    "id", "date", "title", "memo", "deadline", "completed", "order_index", "created_at", "updated_at",
+    "version",
+]
+
+# エクスポートで1回に書き出す行数
+EXPORT_CHUNK_SIZE = 500
+
+
+def to_csv_value(value):
+    """CSVに書き出す値（日付・時刻はISO形式）"""
+    return value.isoformat() if isinstance(value, (date, time)) else value
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    """タスクの行をNDJSONとして一定行数ずつ書き出す"""
+    lines = []
+    for row in rows:
+        lines.append(orjson.dumps(row))
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def iter_csv(rows: Iterable[dict]) -> Iterator[str]:
+    """タスクの行をCSV（ヘッダー行付き）として一定行数ずつ書き出す"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow({name: to_csv_value(value) for name, value in row.items()})
+        count += 1
+        if count >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    yield buffer.getvalue()
+
+
+@router.get("/export")
+def export_tasks(
+    request: Request,
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    completed: Optional[bool] = Query(None),
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+):
+    """全タスクのストリーミングエクスポート（/{task_id}より先に定義する）"""
+    # ストリーミング中も使うため、リクエストのセッションとは別に開いてレスポンス後に閉じる
+    db = open_read_session(request)
+    try:
+        rows = ExportTasksUseCase(SQLAlchemyTaskRepository(db)).execute_rows(start, end, completed)
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if export_format == "csv":
+        body, media_type = iter_csv(rows), "text/csv; charset=utf-8"
+    else:
+        body, media_type = iter_ndjson(rows), "application/x-ndjson"
+    # ページごとに同じ形のSELECTを繰り返すため、N+1の判定から除く
+    return StreamingResponse(
+        iter_allowing_repeats(body),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+        background=BackgroundTask(db.close),
+    )
+
+
+def encode_change_cursor(cursor: Tuple[int, int]) -> str:
+    """変更カーソル(change_seq, id)を文字列に変換"""
+    return f"{cursor[0]}.{cursor[1]}"
+
+
+def decode_change_cursor(cursor: Optional[str]) -> Optional[Tuple[int, int]]:
+    """文字列を変更カーソル(change_seq, id)に戻す（不正な値は400）"""
+    if cursor is None:
+        return None
+    try:
+        seq, task_id = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if seq < 0 or task_id < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return seq, task_id
+
+
+def change_to_response(change: dict) -> dict:
+    """リポジトリの変更の行をレスポンスの形に変換"""
+    if change["op"] == "delete":
+        return {"op": "delete", "id": change["id"], "date": change["date"]}
+    return {"op": "upsert", "task": {name: change[name] for name in EXPORT_FIELDS}}
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+def get_task_changes(
+    since: Optional[str] = Query(None),
+    limit: int = Query(500, ge=1),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    repository: TaskRepository = Depends(get_read_repository),
+    primary: TaskRepository = Depends(get_repository),
+):
+    """差分同期（sinceのカーソル以降に作成・更新・削除されたタスク。/{task_id}より先に定義する）
+
+    sinceを省略すると現存する全タスクを返す。カーソルが削除記録の保持期間より古い場合は410を返すため、
+    クライアントは全件を取得し直す。
+    """
+    after = decode_change_cursor(since)
+    usecase = GetTaskChangesUseCase(repository, primary)
+    try:
+        changes, next_cursor, has_more = usecase.execute_rows(after, limit, start, end)
+    except ChangeCursorExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({
+        "changes": [change_to_response(change) for change in changes],
+        "next_cursor": encode_change_cursor(next_cursor),
+        "has_more": has_more,
+    })
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
     task_id: int,
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    repository: TaskRepository = Depends(get_read_repository),
 ):
-    """タスク詳細取得"""
+    """タスク詳細取得（バージョンのETagが一致すれば304を返す）"""
     usecase = GetTaskUseCase(repository)
     task = usecase.execute(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    etag = version_etag(task.version)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return task_to_response(task)
 
 
 @router.post("", response_model=TaskResponse, status_code=201)
 def create_task(
     task: TaskCreate,
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    background_tasks: BackgroundTasks,
+    repository: TaskRepository = Depends(get_repository),
 ):
     """タスク作成"""
-    usecase = CreateTaskUseCase(repository)
+    usecase = CreateTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
     deadline_time = parse_time(task.deadline)
     created_task = usecase.execute(
         date=task.date,
@@ -102,14 +414,174 @@ def create_task(
     return task_to_response(created_task)
 
 
+@router.post("/batch", response_model=TaskBatchResponse)
+def batch_tasks(
+    batch: TaskBatchRequest,
+    background_tasks: BackgroundTasks,
+    repository: TaskRepository = Depends(get_repository),
+):
+    """タスク一括作成・更新・削除（1トランザクション）"""
+    usecase = BatchTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
+    operations = [
+        TaskOperation(
+            op=operation.op,
+            task_id=operation.task_id,
+            date=operation.date,
+            title=operation.title,
+            memo=operation.memo,
+            deadline=operation.deadline,
+            completed=operation.completed,
+            order_index=operation.order_index,
+        )
+        for operation in batch.operations
+    ]
+    results = usecase.execute(operations)
+    return TaskBatchResponse(results=[
+        TaskBatchResult(
+            index=result.index,
+            op=result.op,
+            success=result.success,
+            task_id=result.task_id,
+            task=task_to_response(result.task) if result.task else None,
+            error=result.error,
+        )
+        for result in results
+    ])
+
+
+# インポートで1回に挿入する行数
+IMPORT_BATCH_SIZE = 1000
+# CSVの1レコードの最大文字数（引用符が閉じないまま続く入力を打ち切る）
+MAX_IMPORT_RECORD_LENGTH = 1024 * 1024
+
+ImportRecord = Tuple[int, Optional[dict], Optional[str]]
+
+
+async def iter_body_lines(request: Request) -> AsyncIterator[str]:
+    """リクエストボディを受信しながら1行ずつ（改行付きで）返す"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def parse_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[ImportRecord]:
+    """NDJSONの各行を（行番号, 値, エラー）として返す"""
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = orjson.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("Row must be a JSON object")
+        except ValueError as e:
+            yield row_number, None, str(e)
+            continue
+        yield row_number, row, None
+
+
+async def parse_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[ImportRecord]:
+    """ヘッダー行付きCSVの各レコードを（行番号, 値, エラー）として返す"""
+    header = None
+    pending = ""
+    quotes = 0
+    row_number = 0
+    async for line in lines:
+        pending += line
+        quotes += line.count('"')
+        # 引用符が閉じていなければ、値の中の改行として次の行とつなげる
+        if quotes % 2:
+            if len(pending) > MAX_IMPORT_RECORD_LENGTH:
+                # 閉じない引用符以降は値の区切りが分からないため、次の行から読み直す
+                row_number += 1
+                yield row_number, None, f"Record exceeds {MAX_IMPORT_RECORD_LENGTH} characters (unterminated quoted field?)"
+                pending = ""
+                quotes = 0
+            continue
+        record = next(csv.reader([pending]), [])
+        pending = ""
+        quotes = 0
+        if not any(field.strip() for field in record):
+            continue
+        if header is None:
+            header = [name.strip() for name in record]
+            continue
+        row_number += 1
+        yield row_number, dict(zip(header, record)), None
+    if pending.strip():
+        yield row_number + 1, None, "Unterminated quoted field"
+
+
+@router.post("/import", response_model=TaskImportResponse)
+async def import_tasks(
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    repository: TaskRepository = Depends(get_repository),
+):
+    """NDJSON/CSVからのタスク一括インポート（ボディを逐次解析し、バッチごとに挿入）"""
+    if import_format is None:
+        import_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    parse = parse_csv_records if import_format == "csv" else parse_ndjson_records
+
+    usecase = ImportTasksUseCase(repository, events=task_event_bus)
+    batch = []
+    # バッチごとに同じ形の文を繰り返すため、N+1の判定から除く
+    with allow_repeated_statements():
+        async for row_number, row, error in parse(iter_body_lines(request)):
+            if error is not None:
+                usecase.record_error(row_number, error)
+                continue
+            batch.append((row_number, row))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await run_in_threadpool(usecase.import_batch, batch)
+                batch = []
+        if batch:
+            await run_in_threadpool(usecase.import_batch, batch)
+
+    summary = usecase.summary
+    return TaskImportResponse(
+        imported=summary.imported,
+        failed=summary.failed,
+        errors=[TaskImportError(row=error.row, error=error.error) for error in summary.errors],
+    )
+
+
+@router.put("/order", response_model=TaskListResponse)
+def reorder_tasks(
+    reorder: TaskReorder,
+    task_date: date = Query(..., alias="date"),
+    repository: TaskRepository = Depends(get_repository),
+):
+    """日付内タスク一括並び替え（/{task_id}より先に定義する）"""
+    usecase = ReorderTasksUseCase(repository, events=task_event_bus)
+    try:
+        tasks = usecase.execute(task_date, reorder.task_ids)
+        return TaskListResponse(tasks=[task_to_response(task) for task in tasks])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.put("/{task_id}", response_model=TaskResponse)
 def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    background_tasks: BackgroundTasks,
+    repository: TaskRepository = Depends(get_repository),
 ):
     """タスク更新"""
-    usecase = UpdateTaskUseCase(repository)
+    usecase = UpdateTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
     deadline_time = parse_time(task_update.deadline) if task_update.deadline else None
     
     try:
@@ -126,13 +598,48 @@ def update_task(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.patch("/{task_id}", response_model=TaskResponse)
+def patch_task(
+    task_id: int,
+    task_patch: TaskUpdate,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    if_match: Optional[str] = Header(None),
+    repository: TaskRepository = Depends(get_repository),
+):
+    """タスク部分更新（送られた項目のみを1文で更新し、If-Matchのバージョンが古ければ409）"""
+    expected_version = parse_if_match(if_match)
+    changes = task_patch.model_dump(exclude_unset=True)
+
+    usecase = PatchTaskUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
+    try:
+        if "deadline" in changes:
+            # Noneはクリア、不正な形式は400（Noneに読み替えて消さない）
+            changes["deadline"] = parse_time(changes["deadline"])
+        patched_task = usecase.execute(task_id, changes, expected_version)
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except VersionConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+            headers={"ETag": version_etag(e.current_version)},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = version_etag(patched_task.version)
+    return task_to_response(patched_task)
+
+
 @router.delete("/{task_id}")
 def delete_task(
     task_id: int,
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    repository: TaskRepository = Depends(get_repository),
 ):
     """タスク削除"""
-    usecase = DeleteTaskUseCase(repository)
+    usecase = DeleteTaskUseCase(repository, events=task_event_bus)
     try:
         usecase.execute(task_id)
         return {"message": "Task deleted successfully"}
@@ -144,10 +651,13 @@ def delete_task(
 def update_task_order(
     task_id: int,
     order_update: TaskOrderUpdate,
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    background_tasks: BackgroundTasks,
+    repository: TaskRepository = Depends(get_repository),
 ):
-    """タスク順序更新"""
-    usecase = UpdateTaskOrderUseCase(repository)
+    """タスク順序更新（gapモードではorder_indexを表示位置として扱う）"""
+    usecase = UpdateTaskOrderUseCase(
+        repository, on_gap_thin=schedule_rebalance(background_tasks), events=task_event_bus
+    )
     try:
         updated_task = usecase.execute(task_id, order_update.order_index)
         return task_to_response(updated_task)
@@ -158,53 +668,11 @@ def update_task_order(
 @router.post("/dummy-data", status_code=201)
 def create_dummy_data(
     task_date: date = Query(..., alias="date"),
-    repository: SQLAlchemyTaskRepository = Depends(get_repository),
+    repository: TaskRepository = Depends(get_repository),
 ):
-    """ダミーデータ作成（テスト用）"""
-    import random
-    from app.infrastructure.models import TaskModel
-    from app.infrastructure.database import SessionLocal
-    
-    # 既存のタスクを削除（同じ日付のもの）
-    db = SessionLocal()
-    try:
-        db.query(TaskModel).filter(TaskModel.date == task_date).delete()
-        db.commit()
-        
-        # ダミータスクのタイトル
-        task_titles = [
-            "プロジェクト計画を立てる",
-            "会議資料を作成する",
-            "コードレビューを行う",
-            "テストケースを書く",
-            "ドキュメントを更新する",
-            "バグ修正を行う",
-            "機能追加を実装する",
-            "パフォーマンス最適化",
-        ]
-        
-        created_tasks = []
-        
-        # 5-8個のタスクを作成
-        num_tasks = random.randint(5, 8)
-        for i in range(num_tasks):
-            task_model = TaskModel(
-                date=task_date,
-                title=task_titles[i % len(task_titles)],
-                memo=None,
-                deadline=None,
-                completed=random.choice([True, False]),
-                order_index=i
-            )
-            db.add(task_model)
-            db.flush()
-            created_tasks.append(task_model)
-        
-        db.commit()
-        
-        return {
-            "message": f"Dummy data created for {task_date}",
-            "count": len(created_tasks)
-        }
-    finally:
-        db.close()
+    """ダミーデータ作成（テスト用。件数が多い場合は /api/v1/jobs/dummy-data でジョブとして実行できる）"""
+    count = CreateDummyTasksUseCase(repository, events=task_event_bus).execute(task_date)
+    return {
+        "message": f"Dummy data created for {task_date}",
+        "count": count
+    }
@@ -0,0 +1,95 @@
+import asyncio
+from datetime import date
+from typing import FrozenSet, Iterable, Optional
+
+import orjson
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+
+from app.infrastructure.event_bus import QueueItem, ResyncNotice, TaskEventSubscription, task_event_bus
+from app.presentation.controllers import task_to_response
+
+
+router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
+
+# 1接続で購読できる日付の最大数（月表示＋前後の週を想定）
+MAX_SUBSCRIBED_DATES = 62
+
+
+def parse_dates(values: Iterable[str]) -> FrozenSet[date]:
+    """購読する日付（YYYY-MM-DD）を検証して集合に変換"""
+    dates = frozenset(date.fromisoformat(value) for value in values)
+    if len(dates) > MAX_SUBSCRIBED_DATES:
+        raise ValueError(f"Cannot subscribe to more than {MAX_SUBSCRIBED_DATES} dates")
+    return dates
+
+
+def encode_event(item: QueueItem) -> bytes:
+    """通知をクライアントに送る差分（JSON）に変換"""
+    if isinstance(item, ResyncNotice):
+        return orjson.dumps({"type": "resync", "dates": sorted(item.dates)})
+    payload = {"type": item.type, "date": item.date}
+    if item.task is not None:
+        payload["task"] = task_to_response(item.task).model_dump()
+    if item.task_id is not None:
+        payload["task_id"] = item.task_id
+    if item.order is not None:
+        payload["order"] = item.order
+    return orjson.dumps(payload)
+
+
+@router.websocket("/events")
+async def task_events(websocket: WebSocket, dates: Optional[str] = Query(None)):
+    """タスクの変更通知（購読中の日付の作成・更新・削除・並び替えの差分を送る）
+
+    クライアントは {"dates": ["YYYY-MM-DD", ...]} を送って購読する日付を置き換える。
+    接続時の ?dates=YYYY-MM-DD,YYYY-MM-DD でも指定できる。
+    """
+    await websocket.accept()
+    subscription: TaskEventSubscription = task_event_bus.subscribe()
+    # 受信側の応答と通知の送信が同時に書き込まないようにする
+    send_lock = asyncio.Lock()
+
+    async def send(data: bytes) -> None:
+        async with send_lock:
+            await websocket.send_text(data.decode())
+
+    async def update_subscription(values: Iterable[str]) -> None:
+        try:
+            subscription.dates = parse_dates(values)
+        except (TypeError, ValueError) as e:
+            await send(orjson.dumps({"type": "error", "detail": str(e)}))
+            return
+        await send(orjson.dumps({"type": "subscribed", "dates": sorted(subscription.dates)}))
+
+    async def receive_loop() -> None:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                values = orjson.loads(message)["dates"]
+                if not isinstance(values, list):
+                    raise TypeError
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                await send(orjson.dumps({"type": "error", "detail": 'Expected {"dates": ["YYYY-MM-DD", ...]}'}))
+                continue
+            await update_subscription(values)
+
+    async def send_loop() -> None:
+        while True:
+            await send(encode_event(await subscription.get()))
+
+    try:
+        if dates:
+            await update_subscription(dates.split(","))
+        tasks = [asyncio.create_task(receive_loop()), asyncio.create_task(send_loop())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            # 切断以外の例外はそのまま送出する
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+    except WebSocketDisconnect:
+        pass
+    finally:
+        task_event_bus.unsubscribe(subscription)
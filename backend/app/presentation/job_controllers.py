@@ -0,0 +1,166 @@
+import os
+import tempfile
+import uuid
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.domain.exceptions import JobFinishedError, JobNotFoundError
+from app.domain.jobs import Job
+from app.domain.repositories import JobRepository
+from app.infrastructure.database import SessionLocal, engine, get_db
+from app.infrastructure.event_bus import task_event_bus
+from app.infrastructure.job_repository import SQLAlchemyJobRepository
+from app.infrastructure.job_runner import JobRunner, job_worker_options
+from app.usecases.job_usecases import (
+    JOB_ARCHIVE,
+    JOB_DUMMY_DATA,
+    JOB_IMPORT,
+    JOB_REBUILD_STATS,
+    CancelJobUseCase,
+    GetJobUseCase,
+    JobContext,
+    ListJobsUseCase,
+    SubmitJobUseCase,
+    run_job,
+)
+from app.presentation.controllers import build_repository
+from app.presentation.schemas import (
+    ArchiveJobRequest,
+    JobListResponse,
+    JobProgress,
+    JobResponse,
+    RebuildStatsJobRequest,
+)
+
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+# インポートのジョブでアップロードされたファイルの置き場所（ワーカーと同じホストから読める場所）
+JOB_DATA_DIR = os.getenv("JOB_DATA_DIR", os.path.join(tempfile.gettempdir(), "task-app-jobs"))
+
+
+def execute_job(job: Job, db: Session, report: Callable[[int, Optional[int]], None]) -> Dict[str, Any]:
+    """ワーカーから呼ばれるジョブの処理（リクエストと同じリポジトリ・変更の通知を使う）"""
+    return run_job(job, JobContext(build_repository(db), report, task_event_bus))
+
+
+job_runner = JobRunner(SessionLocal, execute_job, **job_worker_options(engine.dialect.name))
+
+
+def get_job_repository(db: Session = Depends(get_db)) -> JobRepository:
+    """ジョブリポジトリを取得"""
+    return SQLAlchemyJobRepository(db)
+
+
+def job_to_response(job: Job) -> JobResponse:
+    """エンティティをレスポンスに変換"""
+    return JobResponse(
+        id=job.id,
+        type=job.type,
+        status=job.status,
+        params=job.params,
+        progress=JobProgress(done=job.progress_done, total=job.progress_total),
+        result=job.result,
+        error=job.error,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        cancel_requested=job.cancel_requested,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def submit_job(repository: JobRepository, job_type: str, params: Dict[str, Any]) -> JobResponse:
+    """ジョブを登録してワーカーを起こす"""
+    usecase = SubmitJobUseCase(repository, notify=job_runner.notify)
+    try:
+        return job_to_response(usecase.execute(job_type, params))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/import", response_model=JobResponse, status_code=202)
+async def submit_import_job(
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """NDJSON/CSVのインポートをジョブとして登録（ボディをファイルに保存し、ワーカーで取り込む）"""
+    if import_format is None:
+        import_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    os.makedirs(JOB_DATA_DIR, exist_ok=True)
+    path = os.path.join(JOB_DATA_DIR, f"import-{uuid.uuid4().hex}.{import_format}")
+    try:
+        with open(path, "wb") as f:
+            async for chunk in request.stream():
+                f.write(chunk)
+        return submit_job(repository, JOB_IMPORT, {"path": path, "format": import_format})
+    except BaseException:
+        # 登録できなかったファイルは残さない
+        os.remove(path)
+        raise
+
+
+@router.post("/archive", response_model=JobResponse, status_code=202)
+def submit_archive_job(
+    archive: ArchiveJobRequest,
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """古い完了済みタスクのアーカイブをジョブとして登録（未指定の値はARCHIVE_*の設定を使う）"""
+    return submit_job(repository, JOB_ARCHIVE, archive.model_dump(exclude_none=True))
+
+
+@router.post("/rebuild-stats", response_model=JobResponse, status_code=202)
+def submit_rebuild_stats_job(
+    rebuild: RebuildStatsJobRequest,
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """日付ごとの集計の作り直しをジョブとして登録"""
+    return submit_job(repository, JOB_REBUILD_STATS, rebuild.model_dump(mode="json"))
+
+
+@router.post("/dummy-data", response_model=JobResponse, status_code=202)
+def submit_dummy_data_job(
+    task_date: date = Query(..., alias="date"),
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """ダミーデータ作成をジョブとして登録（テスト用）"""
+    return submit_job(repository, JOB_DUMMY_DATA, {"date": task_date.isoformat()})
+
+
+@router.get("", response_model=JobListResponse)
+def list_jobs(
+    limit: int = Query(20),
+    status: Optional[str] = Query(None, pattern="^(queued|running|succeeded|failed|cancelled)$"),
+    repository: JobRepository = Depends(get_job_repository),
+):
+    """ジョブ一覧取得（新しい順）"""
+    try:
+        jobs = ListJobsUseCase(repository).execute(limit, status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JobListResponse(jobs=[job_to_response(job) for job in jobs])
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str, repository: JobRepository = Depends(get_job_repository)):
+    """ジョブの状態・進捗・結果を取得"""
+    try:
+        return job_to_response(GetJobUseCase(repository).execute(job_id))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(job_id: str, repository: JobRepository = Depends(get_job_repository)):
+    """ジョブのキャンセル（実行中のジョブは次の進捗の報告で中断する）"""
+    try:
+        return job_to_response(CancelJobUseCase(repository).execute(job_id))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except JobFinishedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -1,6 +1,9 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import date, time, datetime
+from datetime import date as DateType
+
+from app.domain.entities import parse_time
 
 
 class TaskBase(BaseModel):
@@ -12,22 +15,15 @@ class TaskBase(BaseModel):
 
     @validator("deadline")
     def validate_deadline(cls, v):
-        if v is not None:
-            try:
-                parts = v.split(":")
-                if len(parts) not in [2, 3]:
-                    raise ValueError("Deadline must be in HH:MM or HH:MM:SS format")
-                hour = int(parts[0])
-                minute = int(parts[1])
-                if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-                    raise ValueError("Invalid time values")
-            except (ValueError, IndexError):
-                raise ValueError("Deadline must be in HH:MM or HH:MM:SS format")
+        # 時・分・秒の範囲まで検証（保存時の変換と同じ関数を使う）
+        parse_time(v)
         return v
 
 
 class TaskCreate(TaskBase):
     date: date
+    # 未指定の場合は日付の末尾に追加する
+    order_index: Optional[int] = None
 
 
 class TaskUpdate(BaseModel):
@@ -39,17 +35,8 @@ class TaskUpdate(BaseModel):
 
     @validator("deadline")
     def validate_deadline(cls, v):
-        if v is not None:
-            try:
-                parts = v.split(":")
-                if len(parts) not in [2, 3]:
-                    raise ValueError("Deadline must be in HH:MM or HH:MM:SS format")
-                hour = int(parts[0])
-                minute = int(parts[1])
-                if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-                    raise ValueError("Invalid time values")
-            except (ValueError, IndexError):
-                raise ValueError("Deadline must be in HH:MM or HH:MM:SS format")
+        # 時・分・秒の範囲まで検証（保存時の変換と同じ関数を使う）
+        parse_time(v)
         return v
 
 
@@ -57,11 +44,16 @@ class TaskOrderUpdate(BaseModel):
     order_index: int
 
 
+class TaskReorder(BaseModel):
+    task_ids: List[int]
+
+
 class TaskResponse(TaskBase):
     id: int
     date: date
     created_at: datetime
     updated_at: datetime
+    version: int = 1
 
     class Config:
         from_attributes = True
@@ -69,3 +61,135 @@ class TaskResponse(TaskBase):
 
 class TaskListResponse(BaseModel):
     tasks: List[TaskResponse]
+
+
+class TaskDayResponse(BaseModel):
+    date: date
+    tasks: List[TaskResponse]
+
+
+class TaskRangeResponse(BaseModel):
+    days: List[TaskDayResponse]
+
+
+class TaskSearchResult(TaskResponse):
+    # 関連度（大きいほど一致度が高い。DBの種類によって尺度は異なる）
+    score: float
+
+
+class TaskSearchResponse(BaseModel):
+    tasks: List[TaskSearchResult]
+    # 次のページのカーソル（最後のページではNone）
+    next_cursor: Optional[str] = None
+
+
+class TaskChange(BaseModel):
+    # upsert: 作成・更新（taskに変更後のタスク）、delete: 削除（id・dateのみ）
+    op: Literal["upsert", "delete"]
+    task: Optional[TaskResponse] = None
+    id: Optional[int] = None
+    # フィールド名dateが型名を隠すため別名で指定
+    date: Optional[DateType] = None
+
+
+class TaskChangesResponse(BaseModel):
+    changes: List[TaskChange]
+    # 次回の同期で渡すカーソル（has_moreがtrueの間はすぐに続きを取得する）
+    next_cursor: str
+    has_more: bool
+
+
+class TaskStatsCounts(BaseModel):
+    total: int
+    completed: int
+    with_deadline: int
+    # 完了率（completed / total。タスクがなければNone）
+    completion_rate: Optional[float] = None
+
+
+class TaskStatsPeriod(TaskStatsCounts):
+    start: DateType
+    end: DateType
+
+
+class TaskStatsResponse(BaseModel):
+    start: DateType
+    end: DateType
+    group: Literal["day", "week", "month"]
+    periods: List[TaskStatsPeriod]
+    summary: TaskStatsCounts
+
+
+class TaskBatchOperation(TaskUpdate):
+    op: Literal["create", "update", "delete"]
+    task_id: Optional[int] = None
+    # フィールド名dateが型名を隠すため別名で指定
+    date: Optional[DateType] = None
+
+
+class TaskBatchRequest(BaseModel):
+    operations: List[TaskBatchOperation] = Field(..., max_length=1000)
+
+
+class TaskBatchResult(BaseModel):
+    index: int
+    op: str
+    success: bool
+    task_id: Optional[int] = None
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+
+class TaskBatchResponse(BaseModel):
+    results: List[TaskBatchResult]
+
+
+class TaskImportError(BaseModel):
+    row: int
+    error: str
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[TaskImportError]
+
+
+class JobProgress(BaseModel):
+    done: int
+    # 全体の件数が分からなければNone
+    total: Optional[int] = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    type: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    params: dict
+    progress: JobProgress
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobListResponse(BaseModel):
+    jobs: List[JobResponse]
+
+
+class ArchiveJobRequest(BaseModel):
+    older_than_days: Optional[int] = Field(None, ge=1)
+    batch_size: Optional[int] = Field(None, ge=1)
+    pause_seconds: Optional[float] = Field(None, ge=0)
+    max_batches: Optional[int] = Field(None, ge=1)
+    dry_run: bool = False
+
+
+class RebuildStatsJobRequest(BaseModel):
+    start: Optional[DateType] = None
+    end: Optional[DateType] = None
+    chunk_days: int = Field(31, ge=1)
@@ -0,0 +1,77 @@
+import os
+import time
+
+from fastapi import Request
+
+from app.infrastructure.database import REPLICA_DATABASE_URL, ReadSessionLocal, SessionLocal
+
+# 書き込み後、同じクライアントの読み取りをプライマリに固定する秒数（レプリカの遅延より長くする）
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+# 固定期限（UNIX時刻）を保持するクッキー（同一オリジンのクライアント用）
+PRIMARY_PIN_COOKIE = "db_primary_until"
+# 固定期限を返すレスポンスヘッダー。クッキーを送らないクライアント（オリジンの異なるElectronの
+# レンダラーなど）は、受け取った値を以降のリクエストに同じ名前のヘッダーで付ける
+PRIMARY_PIN_HEADER = "X-Primary-Until"
+
+# 書き込みとみなすHTTPメソッド
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """直前に書き込んだクライアントの読み取りか（ヘッダーまたはクッキーの期限内）"""
+    for value in (request.headers.get(PRIMARY_PIN_HEADER), request.cookies.get(PRIMARY_PIN_COOKIE)):
+        if not value:
+            continue
+        try:
+            if float(value) > time.time():
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def open_read_session(request: Request):
+    """読み取り用セッションを開く（書き込み直後のクライアントはプライマリ）"""
+    if REPLICA_DATABASE_URL and not is_pinned_to_primary(request):
+        return ReadSessionLocal()
+    return SessionLocal()
+
+
+def get_read_db(request: Request):
+    """読み取り用データベースセッションを取得"""
+    db = open_read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class PrimaryPinMiddleware:
+    """成功した書き込みのレスポンスに、以降の読み取りをプライマリに固定する期限（クッキーとヘッダー）を付けるASGIミドルウェア
+
+    レプリカ未設定時は何もしない。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not REPLICA_DATABASE_URL or scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                expires = time.time() + READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{PRIMARY_PIN_COOKIE}={expires:.3f}; Max-Age={int(READ_YOUR_WRITES_SECONDS) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"set-cookie", cookie.encode()),
+                    (PRIMARY_PIN_HEADER.lower().encode(), f"{expires:.3f}".encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,257 @@
+from typing import Callable, List, Optional, Tuple
+from datetime import date, datetime, time
+from app.domain.entities import Task
+from app.domain.events import (
+    EVENT_CREATE,
+    EVENT_DELETE,
+    EVENT_INVALIDATE,
+    EVENT_UPDATE,
+    TaskChangeEvent,
+    TaskEventPublisher,
+    publish_events,
+    reorder_event,
+)
+from app.domain.ordering import ORDER_MODE, is_gap_thin, order_step, rank_between
+from app.domain.repositories import AsyncTaskRepository
+
+
+async def resolve_gap_rank(
+    repository: AsyncTaskRepository,
+    task_date: date,
+    position: int,
+    exclude_id: Optional[int] = None,
+) -> Tuple[int, bool]:
+    """表示位置をgapモードの順序値に変換（task_usecases.resolve_gap_rankの非同期版）"""
+    before, after = await repository.get_order_neighbors(task_date, position, exclude_id)
+    rank = rank_between(before, after, order_step("gap"))
+    if rank is None:
+        await repository.rebalance_order(task_date, order_step("gap"))
+        before, after = await repository.get_order_neighbors(task_date, position, exclude_id)
+        rank = rank_between(before, after, order_step("gap"))
+    return rank, is_gap_thin(before, rank, after)
+
+
+class AsyncGetTasksUseCase:
+    """タスク一覧取得ユースケース（非同期）"""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        self.repository = repository
+
+    async def execute(self, task_date: date, show_completed: bool = True) -> List[Task]:
+        """タスク一覧を取得"""
+        return await self.repository.get_by_date(task_date, show_completed)
+
+
+class AsyncGetTaskListFingerprintUseCase:
+    """タスク一覧の変更検知用集計値取得ユースケース（非同期）"""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        self.repository = repository
+
+    async def execute(self, task_date: date, show_completed: bool = True) -> Tuple[int, Optional[datetime], int]:
+        """一覧の件数・最終更新日時・日付のリビジョンを取得（行の取得はしない）"""
+        return await self.repository.get_list_fingerprint(task_date, show_completed)
+
+
+class AsyncGetTaskUseCase:
+    """タスク取得ユースケース（非同期）"""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        self.repository = repository
+
+    async def execute(self, task_id: int) -> Optional[Task]:
+        """タスクを取得"""
+        return await self.repository.get_by_id(task_id)
+
+
+class AsyncCreateTaskUseCase:
+    """タスク作成ユースケース（非同期）"""
+
+    def __init__(
+        self,
+        repository: AsyncTaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
+
+    async def execute(
+        self,
+        date: date,
+        title: str,
+        memo: Optional[str] = None,
+        deadline: Optional[time] = None,
+        completed: bool = False,
+        order_index: Optional[int] = None,
+    ) -> Task:
+        """タスクを作成"""
+        if self.order_mode == "gap" and order_index is not None:
+            # order_indexは表示位置として扱い、前後の隙間から順序値を決める
+            order_index, gap_thin = await resolve_gap_rank(self.repository, date, order_index)
+            if gap_thin and self.on_gap_thin:
+                self.on_gap_thin(date)
+
+        task = Task(
+            id=0,
+            date=date,
+            title=title,
+            memo=memo,
+            deadline=deadline,
+            completed=completed,
+            order_index=order_index if order_index is not None else 0,  # 未指定時はリポジトリで採番
+            created_at=None,
+            updated_at=None,
+        )
+
+        if order_index is None:
+            # 末尾への追加は挿入と同じトランザクション内で採番する（並行作成でも重複しない）
+            created = await self.repository.append(task, order_step(self.order_mode))
+        else:
+            created = await self.repository.create(task)
+        publish_events(self.events, [TaskChangeEvent(EVENT_CREATE, created.date, task=created)])
+        return created
+
+
+class AsyncUpdateTaskUseCase:
+    """タスク更新ユースケース（非同期）"""
+
+    def __init__(
+        self,
+        repository: AsyncTaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
+
+    async def execute(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        memo: Optional[str] = None,
+        deadline: Optional[time] = None,
+        completed: Optional[bool] = None,
+        order_index: Optional[int] = None,
+    ) -> Task:
+        """タスクを更新"""
+        task = await self.repository.get_by_id(task_id)
+        if not task:
+            raise ValueError(f"Task with id {task_id} not found")
+
+        if title is not None:
+            task.title = title
+        if memo is not None:
+            task.memo = memo
+        if deadline is not None:
+            task.deadline = deadline
+        if completed is not None:
+            task.completed = completed
+        if order_index is not None:
+            if self.order_mode == "gap":
+                # 作成・順序更新と同じく表示位置として扱う
+                order_index, gap_thin = await resolve_gap_rank(
+                    self.repository, task.date, order_index, exclude_id=task_id
+                )
+                if gap_thin and self.on_gap_thin:
+                    self.on_gap_thin(task.date)
+            task.order_index = order_index
+
+        updated = await self.repository.update(task)
+        publish_events(self.events, [TaskChangeEvent(EVENT_UPDATE, updated.date, task=updated)])
+        return updated
+
+
+class AsyncDeleteTaskUseCase:
+    """タスク削除ユースケース（非同期）"""
+
+    def __init__(self, repository: AsyncTaskRepository, events: Optional[TaskEventPublisher] = None):
+        self.repository = repository
+        self.events = events
+
+    async def execute(self, task_id: int) -> None:
+        """タスクを削除"""
+        task = await self.repository.get_by_id(task_id)
+        if not task:
+            raise ValueError(f"Task with id {task_id} not found")
+        await self.repository.delete(task_id)
+        publish_events(self.events, [TaskChangeEvent(EVENT_DELETE, task.date, task_id=task_id)])
+
+
+class AsyncUpdateTaskOrderUseCase:
+    """タスク順序更新ユースケース（非同期）"""
+
+    def __init__(
+        self,
+        repository: AsyncTaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
+
+    async def execute(self, task_id: int, order_index: int) -> Task:
+        """タスクの順序を更新"""
+        task = await self.repository.get_by_id(task_id)
+        if not task:
+            raise ValueError(f"Task with id {task_id} not found")
+        if self.order_mode == "gap":
+            order_index, gap_thin = await resolve_gap_rank(
+                self.repository, task.date, order_index, exclude_id=task_id
+            )
+            if gap_thin and self.on_gap_thin:
+                self.on_gap_thin(task.date)
+        updated = await self.repository.update_order(task_id, order_index)
+        publish_events(self.events, [reorder_event(updated.date, [updated])])
+        return updated
+
+
+class AsyncRebalanceTaskOrderUseCase:
+    """タスク順序振り直しユースケース（非同期）"""
+
+    def __init__(
+        self,
+        repository: AsyncTaskRepository,
+        order_mode: str = ORDER_MODE,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.events = events
+
+    async def execute(self, task_date: date) -> None:
+        """現在の並び順を保ったまま順序値を振り直す"""
+        await self.repository.rebalance_order(task_date, order_step(self.order_mode))
+        # 並び順は変わらないが全タスクの順序値・バージョンが変わるため再取得を促す
+        publish_events(self.events, [TaskChangeEvent(EVENT_INVALIDATE, task_date)])
+
+
+class AsyncReorderTasksUseCase:
+    """日付内タスク一括並び替えユースケース（非同期）"""
+
+    def __init__(
+        self,
+        repository: AsyncTaskRepository,
+        order_mode: str = ORDER_MODE,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.events = events
+
+    async def execute(self, task_date: date, task_ids: List[int]) -> List[Task]:
+        """指定したID順で日付内のタスク順序を書き換え"""
+        if len(task_ids) != len(set(task_ids)):
+            raise ValueError("Task ids must not contain duplicates")
+        tasks = await self.repository.reorder(task_date, task_ids, order_step(self.order_mode))
+        publish_events(self.events, [reorder_event(task_date, tasks)])
+        return tasks
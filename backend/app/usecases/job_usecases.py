@@ -0,0 +1,227 @@
+import contextlib
+import csv
+import os
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from app.domain.exceptions import JobFinishedError, JobNotFoundError
+from app.domain.events import TaskEventPublisher
+from app.domain.jobs import JOB_CANCELLED, Job
+from app.domain.repositories import JobRepository, TaskRepository
+from app.usecases.task_usecases import (
+    ArchiveTasksUseCase,
+    CreateDummyTasksUseCase,
+    ImportTasksUseCase,
+    RebuildDailyStatsUseCase,
+)
+
+
+# 再実行しても結果が変わらないジョブの最大試行回数（再実行できないジョブは1回のみ）
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# ジョブ一覧で返す最大件数
+MAX_JOB_LIST_LIMIT = 100
+# インポートのジョブで1回に挿入する行数
+JOB_IMPORT_BATCH_SIZE = 1000
+
+# ジョブの種類
+JOB_IMPORT = "import"
+JOB_ARCHIVE = "archive"
+JOB_DUMMY_DATA = "dummy-data"
+JOB_REBUILD_STATS = "rebuild-stats"
+
+# 進捗の報告（処理済みの件数, 全体の件数）。キャンセルが要求されていればJobCancelledErrorを送出する
+ReportProgress = Callable[[int, Optional[int]], None]
+
+
+@dataclass
+class JobContext:
+    """ジョブの実行環境（ワーカーがジョブごとに別セッションで組み立てる）"""
+    repository: TaskRepository
+    report: ReportProgress
+    events: Optional[TaskEventPublisher] = None
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    """ジョブの種類ごとの処理
+
+    idempotentなジョブは途中で失敗しても最初から実行し直せるため、JOB_MAX_ATTEMPTS回まで再試行する。
+    """
+    run: Callable[[Dict[str, Any], JobContext], Dict[str, Any]]
+    idempotent: bool
+
+
+def _optional_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
+
+
+def iter_import_file(path: str, import_format: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """インポートファイルの各レコードを（行番号, 値, エラー）として返す"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if import_format == "csv":
+            reader = csv.DictReader(f)
+            row_number = 0
+            while True:
+                row_number += 1
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    # 大きすぎる値・閉じない引用符など。readerは次の行から読み続ける
+                    yield row_number, None, str(e)
+                    continue
+                yield row_number, {key.strip(): value for key, value in row.items() if key}, None
+        row_number = 0
+        for line in f:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                row = orjson.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("Row must be a JSON object")
+            except ValueError as e:
+                yield row_number, None, str(e)
+                continue
+            yield row_number, row, None
+
+
+def run_import(params: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """アップロード済みのファイル（params["path"]）をインポートし、終了後にファイルを削除する"""
+    usecase = ImportTasksUseCase(context.repository, events=context.events)
+    try:
+        batch: List[Tuple[int, dict]] = []
+        processed = 0
+        for row_number, row, error in iter_import_file(params["path"], params["format"]):
+            processed = row_number
+            if error is not None:
+                usecase.record_error(row_number, error)
+                continue
+            batch.append((row_number, row))
+            if len(batch) >= JOB_IMPORT_BATCH_SIZE:
+                usecase.import_batch(batch)
+                batch = []
+                context.report(processed, None)
+        if batch:
+            usecase.import_batch(batch)
+        context.report(processed, processed)
+    finally:
+        # 再試行しないジョブのため、中断・失敗時もファイルは残さない
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(params["path"])
+    return asdict(usecase.summary)
+
+
+def run_archive(params: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """古い完了済みタスクをアーカイブ（バッチごとに進捗を報告し、キャンセル時はバッチの間で止める）"""
+    summary = ArchiveTasksUseCase(context.repository).execute(
+        **params, on_batch=lambda summary: context.report(summary.tasks, None)
+    )
+    return orjson.loads(orjson.dumps(asdict(summary)))
+
+
+def run_dummy_data(params: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """日付のタスクをダミーに置き換える"""
+    count = CreateDummyTasksUseCase(context.repository, events=context.events).execute(
+        date.fromisoformat(params["date"])
+    )
+    context.report(count, count)
+    return {"date": params["date"], "count": count}
+
+
+def run_rebuild_stats(params: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """集計テーブルを作り直す（区切りごとに進捗を報告する）"""
+    rows = RebuildDailyStatsUseCase(context.repository).rebuild(
+        _optional_date(params.get("start")),
+        _optional_date(params.get("end")),
+        params.get("chunk_days", 31),
+        on_chunk=context.report,
+    )
+    return {"rows": rows}
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    # 再実行すると同じ行を重複して挿入するため再試行しない
+    JOB_IMPORT: JobHandler(run_import, idempotent=False),
+    JOB_ARCHIVE: JobHandler(run_archive, idempotent=True),
+    JOB_DUMMY_DATA: JobHandler(run_dummy_data, idempotent=True),
+    JOB_REBUILD_STATS: JobHandler(run_rebuild_stats, idempotent=True),
+}
+
+
+def run_job(job: Job, context: JobContext) -> Dict[str, Any]:
+    """ジョブの種類に応じた処理を実行して結果を返す（ワーカーから呼ばれる）"""
+    handler = JOB_HANDLERS.get(job.type)
+    if handler is None:
+        raise ValueError(f"Unknown job type: {job.type}")
+    return handler.run(job.params, context)
+
+
+class SubmitJobUseCase:
+    """ジョブ登録ユースケース（待機中として保存し、ワーカーに通知する）"""
+
+    def __init__(self, repository: JobRepository, notify: Optional[Callable[[], None]] = None):
+        self.repository = repository
+        self.notify = notify
+
+    def execute(self, job_type: str, params: Dict[str, Any]) -> Job:
+        """ジョブを登録（paramsはJSONに変換できる値のみ）"""
+        handler = JOB_HANDLERS.get(job_type)
+        if handler is None:
+            raise ValueError(f"Unknown job type: {job_type}")
+        job = self.repository.create(job_type, params, JOB_MAX_ATTEMPTS if handler.idempotent else 1)
+        if self.notify is not None:
+            self.notify()
+        return job
+
+
+class GetJobUseCase:
+    """ジョブ取得ユースケース（状態・進捗・結果）"""
+
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, job_id: str) -> Job:
+        job = self.repository.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job {job_id} not found")
+        return job
+
+
+class ListJobsUseCase:
+    """ジョブ一覧取得ユースケース（新しい順）"""
+
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, limit: int = 20, status: Optional[str] = None) -> List[Job]:
+        if not 1 <= limit <= MAX_JOB_LIST_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_JOB_LIST_LIMIT}")
+        return self.repository.list_recent(limit, status)
+
+
+class CancelJobUseCase:
+    """ジョブのキャンセルユースケース
+
+    待機中のジョブはその場でキャンセル済みになる。実行中のジョブは次の進捗の報告で中断され、
+    それまでにコミットした処理（アーカイブ済みのバッチなど）は残る。
+    """
+
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, job_id: str) -> Job:
+        job = self.repository.get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Job {job_id} not found")
+        if job.finished:
+            raise JobFinishedError(job_id, job.status)
+        job = self.repository.request_cancel(job_id)
+        # 要求と同時に終了した場合
+        if job.finished and job.status != JOB_CANCELLED:
+            raise JobFinishedError(job_id, job.status)
+        return job
@@ -1,9 +1,46 @@
-from typing import List, Optional
-from datetime import date, time
-from app.domain.entities import Task
+import os
+import random
+import time as time_module
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+from app.domain.entities import Task, parse_time, validate_title
+from app.domain.exceptions import ChangeCursorExpiredError, TaskNotFoundError, VersionConflictError
+from app.domain.events import (
+    EVENT_CREATE,
+    EVENT_DELETE,
+    EVENT_INVALIDATE,
+    EVENT_UPDATE,
+    TaskChangeEvent,
+    TaskEventPublisher,
+    publish_events,
+    reorder_event,
+)
+from app.domain.ordering import (
+    MAX_ORDER_INDEX, MIN_ORDER_INDEX, ORDER_MODE, is_gap_thin, order_step, rank_between,
+)
 from app.domain.repositories import TaskRepository
 
 
+def resolve_gap_rank(
+    repository: TaskRepository,
+    task_date: date,
+    position: int,
+    exclude_id: Optional[int] = None,
+) -> Tuple[int, bool]:
+    """表示位置をgapモードの順序値に変換（隙間が尽きていればその場で振り直す）
+
+    戻り値は（順序値, 隙間が少なくなり振り直しが望ましいか）
+    """
+    before, after = repository.get_order_neighbors(task_date, position, exclude_id)
+    rank = rank_between(before, after, order_step("gap"))
+    if rank is None:
+        repository.rebalance_order(task_date, order_step("gap"))
+        before, after = repository.get_order_neighbors(task_date, position, exclude_id)
+        rank = rank_between(before, after, order_step("gap"))
+    return rank, is_gap_thin(before, rank, after)
+
+
 class GetTasksUseCase:
     """タスク一覧取得ユースケース"""
 
@@ -14,6 +51,448 @@ class GetTasksUseCase:
         """タスク一覧を取得"""
         return self.repository.get_by_date(task_date, show_completed)
 
+    def execute_rows(
+        self, task_date: date, show_completed: bool = True, fingerprint: Optional[Hashable] = None
+    ) -> List[Dict[str, Any]]:
+        """タスク一覧を列の辞書として取得（レスポンスへ直接書き出す読み取り専用経路）
+
+        fingerprintはETagの元にした集計値（キャッシュがその集計値の行を返すようにする）。
+        """
+        return self.repository.get_rows_by_date(task_date, show_completed, fingerprint)
+
+
+# 期間指定の一覧取得で許可する最大日数（月表示＋前後の週を想定）
+MAX_RANGE_DAYS = 62
+
+
+class GetTasksByDateRangeUseCase:
+    """期間指定タスク一覧取得ユースケース"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def _empty_days(self, start_date: date, end_date: date) -> Dict[date, list]:
+        """期間を検証し、期間内の全日付を空リストで初期化"""
+        if end_date < start_date:
+            raise ValueError("end must be on or after start")
+        days = (end_date - start_date).days + 1
+        if days > MAX_RANGE_DAYS:
+            raise ValueError(f"Date range cannot exceed {MAX_RANGE_DAYS} days")
+        return {start_date + timedelta(days=offset): [] for offset in range(days)}
+
+    def execute(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> Dict[date, List[Task]]:
+        """期間内のタスクを日付ごとにまとめて取得（タスクのない日付は空リスト）"""
+        tasks_by_date = self._empty_days(start_date, end_date)
+        for task in self.repository.get_by_date_range(start_date, end_date, show_completed):
+            tasks_by_date[task.date].append(task)
+        return tasks_by_date
+
+    def execute_rows(
+        self, start_date: date, end_date: date, show_completed: bool = True
+    ) -> Dict[date, List[Dict[str, Any]]]:
+        """期間内のタスクを列の辞書として日付ごとにまとめて取得（読み取り専用経路）"""
+        rows_by_date = self._empty_days(start_date, end_date)
+        for row in self.repository.get_rows_by_date_range(start_date, end_date, show_completed):
+            rows_by_date[row["date"]].append(row)
+        return rows_by_date
+
+
+# 検索語の最大文字数・最大語数と、1ページの最大件数
+MAX_SEARCH_QUERY_LENGTH = 200
+MAX_SEARCH_TERMS = 10
+MAX_SEARCH_LIMIT = 100
+
+
+class SearchTasksUseCase:
+    """タスク検索ユースケース（タイトル・メモの全文検索）"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def execute_rows(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """空白区切りの全語を含むタスクを関連度順に取得（1ページ分の行, 次のページがあるか）"""
+        if len(query) > MAX_SEARCH_QUERY_LENGTH:
+            raise ValueError(f"Query cannot exceed {MAX_SEARCH_QUERY_LENGTH} characters")
+        # 大文字小文字の違いは全文索引側で吸収されるため、重複だけ除く
+        terms = list(dict.fromkeys(query.split()))
+        if not terms:
+            raise ValueError("Query must not be empty")
+        if len(terms) > MAX_SEARCH_TERMS:
+            raise ValueError(f"Query cannot contain more than {MAX_SEARCH_TERMS} terms")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        if start_date is not None and end_date is not None and end_date < start_date:
+            raise ValueError("end must be on or after start")
+
+        # 1件多く取得して次のページの有無を判定する
+        rows = self.repository.search_rows(terms, limit + 1, after, start_date, end_date, completed)
+        return rows[:limit], len(rows) > limit
+
+
+# 差分同期の1ページの最大件数
+MAX_CHANGES_LIMIT = 1000
+
+
+class GetTaskChangesUseCase:
+    """差分同期ユースケース（変更カーソル以降の作成・更新・削除を取得）
+
+    primaryは未採番の変更に変更カーソルを付ける書き込み用のリポジトリ（省略時はrepository）。
+    """
+
+    def __init__(self, repository: TaskRepository, primary: Optional[TaskRepository] = None):
+        self.repository = repository
+        self.primary = primary or repository
+
+    def execute_rows(
+        self,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 500,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Dict[str, Any]], Tuple[int, int], bool]:
+        """afterより後の変更を取得（1ページ分の変更, 次のカーソル, 次のページがあるか）
+
+        afterがNoneの場合は現存する全タスクを返す（初回同期）。
+        """
+        if not 1 <= limit <= MAX_CHANGES_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_CHANGES_LIMIT}")
+        if start_date is not None and end_date is not None and end_date < start_date:
+            raise ValueError("end must be on or after start")
+
+        # 書き込みは変更カーソルを採番しないため、読み取りの前にまとめて採番する
+        self.primary.stamp_changes()
+        current_seq, compacted_seq = self.repository.get_change_horizon()
+        if after is not None and after[0] < compacted_seq:
+            raise ChangeCursorExpiredError(after[0], compacted_seq)
+
+        # 読み取り中にコミットされた変更は次の呼び出しで返す（ページ間で変更カーソルが逆行しないようにする）
+        changes = self.repository.get_changes(after, current_seq, limit + 1, start_date, end_date)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_cursor = after or (0, 0)
+        if changes:
+            next_cursor = (changes[-1]["change_seq"], changes[-1]["id"])
+        if not has_more:
+            # 取得済みの範囲にこれ以上の変更はないため、カーソルを最新まで進める（圧縮の境界から遠ざける）
+            next_cursor = max(next_cursor, (current_seq, 0))
+        return changes, next_cursor, has_more
+
+
+class CompactTombstonesUseCase:
+    """削除記録の圧縮ユースケース（保持期間を過ぎた削除記録を削除する）"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def execute(self, retention_days: int, now: Optional[datetime] = None) -> int:
+        """retention_daysより前の削除記録を削除して件数を返す"""
+        if retention_days < 0:
+            raise ValueError("retention_days must be 0 or greater")
+        return self.repository.purge_tombstones((now or datetime.now()) - timedelta(days=retention_days))
+
+
+# 集計の最大日数と集計単位
+MAX_STATS_DAYS = 3660
+STATS_GROUPS = ("day", "week", "month")
+
+
+def period_start(task_date: date, group: str) -> date:
+    """日付が属する集計期間の初日（週は月曜始まり）"""
+    if group == "week":
+        return task_date - timedelta(days=task_date.weekday())
+    if group == "month":
+        return task_date.replace(day=1)
+    return task_date
+
+
+def summarize(total: int, completed: int, with_deadline: int) -> Dict[str, Any]:
+    """件数と完了率（タスクがなければNone）"""
+    return {
+        "total": total,
+        "completed": completed,
+        "with_deadline": with_deadline,
+        "completion_rate": completed / total if total else None,
+    }
+
+
+class GetTaskStatsUseCase:
+    """タスク集計ユースケース（日・週・月ごとの件数と完了率。集計テーブルのみを読む）"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def execute(self, start_date: date, end_date: date, group: str = "day") -> Dict[str, Any]:
+        """期間内の集計を期間ごとにまとめる（タスクのない期間も0件として含める）"""
+        if group not in STATS_GROUPS:
+            raise ValueError(f"group must be one of {', '.join(STATS_GROUPS)}")
+        if end_date < start_date:
+            raise ValueError("end must be on or after start")
+        if (end_date - start_date).days + 1 > MAX_STATS_DAYS:
+            raise ValueError(f"Date range cannot exceed {MAX_STATS_DAYS} days")
+
+        # 期間の初日 -> [total, completed, with_deadline]
+        periods: Dict[date, List[int]] = {}
+        task_date = start_date
+        while task_date <= end_date:
+            periods.setdefault(max(period_start(task_date, group), start_date), [0, 0, 0])
+            task_date += timedelta(days=1)
+        for row in self.repository.get_daily_stats(start_date, end_date):
+            counts = periods[max(period_start(row["date"], group), start_date)]
+            counts[0] += row["total"]
+            counts[1] += row["completed"]
+            counts[2] += row["with_deadline"]
+
+        starts = list(periods)
+        ends = [next_start - timedelta(days=1) for next_start in starts[1:]] + [end_date]
+        return {
+            "start": start_date,
+            "end": end_date,
+            "group": group,
+            "periods": [
+                {"start": first, "end": last, **summarize(*periods[first])}
+                for first, last in zip(starts, ends)
+            ],
+            "summary": summarize(*(sum(column) for column in zip(*periods.values()))),
+        }
+
+
+@dataclass
+class DailyStatsMismatch:
+    """集計テーブルとタスクから数えた値が一致しない日付"""
+    date: date
+    expected: Dict[str, int]
+    actual: Optional[Dict[str, int]]
+
+
+class RebuildDailyStatsUseCase:
+    """集計テーブルの作り直し・検証ユースケース"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def _chunks(
+        self, start_date: Optional[date], end_date: Optional[date], chunk_days: int
+    ) -> Iterator[Tuple[date, date]]:
+        """期間をchunk_days日ずつに分割（未指定の端はタスク・集計テーブルにある日付の範囲）"""
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be 1 or greater")
+        first, last = self.repository.get_stats_date_bounds()
+        start_date = start_date or first
+        end_date = end_date or last
+        if start_date is None or end_date is None:
+            return
+        if end_date < start_date:
+            raise ValueError("end must be on or after start")
+        while start_date <= end_date:
+            chunk_end = min(start_date + timedelta(days=chunk_days - 1), end_date)
+            yield start_date, chunk_end
+            start_date = chunk_end + timedelta(days=1)
+
+    def rebuild(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        chunk_days: int = 31,
+        on_chunk: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """期間の集計をchunk_days日ずつ別トランザクションで作り直す（作成した行数を返す）
+
+        on_chunkは区切りごとに（処理済みの区切りの数, 区切りの総数）で呼ばれる。
+        """
+        chunks = list(self._chunks(start_date, end_date, chunk_days))
+        inserted = 0
+        for index, (chunk_start, chunk_end) in enumerate(chunks, start=1):
+            inserted += self.repository.rebuild_daily_stats(chunk_start, chunk_end)
+            if on_chunk is not None:
+                on_chunk(index, len(chunks))
+        return inserted
+
+    def verify(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None, chunk_days: int = 31
+    ) -> List[DailyStatsMismatch]:
+        """集計テーブルをタスクから数えた値と比較し、一致しない日付を返す"""
+        mismatches = []
+        for chunk_start, chunk_end in self._chunks(start_date, end_date, chunk_days):
+            stored = {row.pop("date"): row for row in self.repository.get_daily_stats(chunk_start, chunk_end)}
+            counted = {row.pop("date"): row for row in self.repository.count_daily_stats(chunk_start, chunk_end)}
+            for task_date in sorted(stored.keys() | counted.keys()):
+                expected = counted.get(task_date, {"total": 0, "completed": 0, "with_deadline": 0})
+                actual = stored.get(task_date)
+                # 0件の日付は行がなくても一致とみなす
+                if actual != expected and not (actual is None and expected["total"] == 0):
+                    mismatches.append(DailyStatsMismatch(task_date, expected, actual))
+        return mismatches
+
+
+# この日数より前の日付の完了済みタスクをアーカイブする
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+# 1トランザクションで移す件数（行ロックを持つ時間の上限になる）
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+# バッチの間に待つ秒数
+ARCHIVE_BATCH_PAUSE_SECONDS = float(os.getenv("ARCHIVE_BATCH_PAUSE_SECONDS", "0.5"))
+# アーカイブの1トランザクションで移す最大件数
+MAX_ARCHIVE_BATCH_SIZE = 10000
+
+
+@dataclass
+class ArchiveSummary:
+    """アーカイブの結果（dry_runでは移す予定の件数とバッチ数）"""
+    before: date
+    dry_run: bool
+    tasks: int = 0
+    batches: int = 0
+    # dry_runでは対象の最初の日付、実行時はNone
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+
+
+class ArchiveTasksUseCase:
+    """古い完了済みタスクのアーカイブユースケース
+
+    batch_size件ずつ別トランザクションで移し、バッチの間にpause_seconds待つ（業務時間中に実行しても
+    書き込みが長く待たされないようにする）。
+    """
+
+    def __init__(self, repository: TaskRepository, sleep: Callable[[float], None] = time_module.sleep):
+        self.repository = repository
+        self.sleep = sleep
+
+    def execute(
+        self,
+        older_than_days: int = ARCHIVE_AFTER_DAYS,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+        pause_seconds: float = ARCHIVE_BATCH_PAUSE_SECONDS,
+        max_batches: Optional[int] = None,
+        dry_run: bool = False,
+        today: Optional[date] = None,
+        on_batch: Optional[Callable[[ArchiveSummary], None]] = None,
+    ) -> ArchiveSummary:
+        """older_than_daysより前の日付の完了済みタスクをアーカイブ（on_batchはバッチごとに呼ばれる）"""
+        if older_than_days < 1:
+            raise ValueError("older_than_days must be 1 or greater")
+        if not 1 <= batch_size <= MAX_ARCHIVE_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_ARCHIVE_BATCH_SIZE}")
+        if pause_seconds < 0:
+            raise ValueError("pause_seconds must be 0 or greater")
+        if max_batches is not None and max_batches < 1:
+            raise ValueError("max_batches must be 1 or greater")
+
+        summary = ArchiveSummary(before=(today or date.today()) - timedelta(days=older_than_days), dry_run=dry_run)
+        if dry_run:
+            summary.tasks, summary.first_date, summary.last_date = self.repository.count_archivable(summary.before)
+            summary.batches = -(-summary.tasks // batch_size)
+            if max_batches is not None and summary.batches > max_batches:
+                summary.batches = max_batches
+                summary.tasks = max_batches * batch_size
+            return summary
+
+        after: Optional[Tuple[date, int]] = None
+        while max_batches is None or summary.batches < max_batches:
+            if summary.batches:
+                self.sleep(pause_seconds)
+            moved, after = self.repository.archive_completed(summary.before, batch_size, after)
+            if not moved:
+                break
+            summary.tasks += moved
+            summary.batches += 1
+            summary.last_date = after[0]
+            if on_batch is not None:
+                on_batch(summary)
+            if moved < batch_size:
+                break
+        return summary
+
+
+# ダミーデータのタイトル
+DUMMY_TASK_TITLES = (
+    "プロジェクト計画を立てる",
+    "会議資料を作成する",
+    "コードレビューを行う",
+    "テストケースを書く",
+    "ドキュメントを更新する",
+    "バグ修正を行う",
+    "機能追加を実装する",
+    "パフォーマンス最適化",
+)
+
+
+class CreateDummyTasksUseCase:
+    """ダミーデータ作成ユースケース（テスト用。日付のタスクを5〜8件のダミーに置き換える）"""
+
+    def __init__(self, repository: TaskRepository, events: Optional[TaskEventPublisher] = None):
+        self.repository = repository
+        self.events = events
+
+    def execute(self, task_date: date) -> int:
+        """日付の既存のタスクの削除とダミーの作成を1トランザクションで行い、作成した件数を返す"""
+        creates = [
+            Task(
+                id=0,
+                date=task_date,
+                title=DUMMY_TASK_TITLES[index % len(DUMMY_TASK_TITLES)],
+                memo=None,
+                deadline=None,
+                completed=random.choice([True, False]),
+                order_index=index,
+                created_at=None,
+                updated_at=None,
+            )
+            for index in range(random.randint(5, 8))
+        ]
+        created, _ = self.repository.apply_batch(creates, [], [], delete_dates=[task_date])
+        publish_events(self.events, [TaskChangeEvent(EVENT_INVALIDATE, task_date)])
+        return len(created)
+
+
+class ExportTasksUseCase:
+    """タスクエクスポートユースケース"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def execute(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Iterator[Task]:
+        """条件に合う全タスクを日付・順序順に逐次取得"""
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("end must be on or after start")
+        return self.repository.iter_all(start_date, end_date, completed)
+
+    def execute_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        completed: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """条件に合う全タスクを列の辞書として逐次取得（読み取り専用経路）"""
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("end must be on or after start")
+        return self.repository.iter_all_rows(start_date, end_date, completed)
+
+
+class GetTaskListFingerprintUseCase:
+    """タスク一覧の変更検知用集計値取得ユースケース"""
+
+    def __init__(self, repository: TaskRepository):
+        self.repository = repository
+
+    def execute(self, task_date: date, show_completed: bool = True) -> Tuple[int, Optional[datetime], int]:
+        """一覧の件数・最終更新日時・日付のリビジョンを取得（行の取得はしない）"""
+        return self.repository.get_list_fingerprint(task_date, show_completed)
+
 
 class GetTaskUseCase:
     """タスク取得ユースケース"""
@@ -29,8 +508,17 @@ class GetTaskUseCase:
 class CreateTaskUseCase:
     """タスク作成ユースケース"""
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
         self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
 
     def execute(
         self,
@@ -42,10 +530,11 @@ class CreateTaskUseCase:
         order_index: Optional[int] = None,
     ) -> Task:
         """タスクを作成"""
-        # 同じ日付のタスク数を取得してorder_indexを設定
-        existing_tasks = self.repository.get_by_date(date, show_completed=True)
-        if order_index is None:
-            order_index = len(existing_tasks)
+        if self.order_mode == "gap" and order_index is not None:
+            # order_indexは表示位置として扱い、前後の隙間から順序値を決める
+            order_index, gap_thin = resolve_gap_rank(self.repository, date, order_index)
+            if gap_thin and self.on_gap_thin:
+                self.on_gap_thin(date)
 
         task = Task(
             id=0,  # 新規作成時は0（リポジトリでIDが割り当てられる）
@@ -54,19 +543,34 @@ class CreateTaskUseCase:
             memo=memo,
             deadline=deadline,
             completed=completed,
-            order_index=order_index,
+            order_index=order_index if order_index is not None else 0,  # 未指定時はリポジトリで採番
             created_at=None,  # リポジトリで設定
             updated_at=None,  # リポジトリで設定
         )
 
-        return self.repository.create(task)
+        if order_index is None:
+            # 末尾への追加は挿入と同じトランザクション内で採番する（並行作成でも重複しない）
+            created = self.repository.append(task, order_step(self.order_mode))
+        else:
+            created = self.repository.create(task)
+        publish_events(self.events, [TaskChangeEvent(EVENT_CREATE, created.date, task=created)])
+        return created
 
 
 class UpdateTaskUseCase:
     """タスク更新ユースケース"""
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
         self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
 
     def execute(
         self,
@@ -92,16 +596,87 @@ class UpdateTaskUseCase:
         if completed is not None:
             task.completed = completed
         if order_index is not None:
+            if self.order_mode == "gap":
+                # 作成・順序更新と同じく表示位置として扱う
+                order_index, gap_thin = resolve_gap_rank(
+                    self.repository, task.date, order_index, exclude_id=task_id
+                )
+                if gap_thin and self.on_gap_thin:
+                    self.on_gap_thin(task.date)
             task.order_index = order_index
 
-        return self.repository.update(task)
+        updated = self.repository.update(task)
+        publish_events(self.events, [TaskChangeEvent(EVENT_UPDATE, updated.date, task=updated)])
+        return updated
+
+
+class PatchTaskUseCase:
+    """タスク部分更新ユースケース（読み込みなしの1文UPDATE・楽観的排他制御）"""
+
+    PATCHABLE_FIELDS = ("title", "memo", "deadline", "completed", "order_index")
+    # NULLを許可しない列
+    REQUIRED_FIELDS = ("title", "completed", "order_index")
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
+
+    def execute(
+        self,
+        task_id: int,
+        changes: Dict[str, Any],
+        expected_version: Optional[int] = None,
+    ) -> Task:
+        """指定された列のみを更新（memo・deadlineはNoneでクリア）"""
+        unknown_fields = set(changes) - set(self.PATCHABLE_FIELDS)
+        if unknown_fields:
+            raise ValueError(f"Fields cannot be patched: {', '.join(sorted(unknown_fields))}")
+        for name in self.REQUIRED_FIELDS:
+            if name in changes and changes[name] is None:
+                raise ValueError(f"{name} cannot be null")
+        if "title" in changes:
+            validate_title(changes["title"])
+
+        if not changes:
+            # 変更なし: 更新せず現在の行を返す（バージョンの検証のみ行う）
+            task = self.repository.get_by_id(task_id)
+            if not task:
+                raise TaskNotFoundError(f"Task with id {task_id} not found")
+            if expected_version is not None and task.version != expected_version:
+                raise VersionConflictError(task_id, expected_version, task.version)
+            return task
+
+        if self.order_mode == "gap" and "order_index" in changes:
+            # 表示位置を順序値に変換するため、この場合のみタスクの日付を読み込む
+            task = self.repository.get_by_id(task_id)
+            if not task:
+                raise TaskNotFoundError(f"Task with id {task_id} not found")
+            order_index, gap_thin = resolve_gap_rank(
+                self.repository, task.date, changes["order_index"], exclude_id=task_id
+            )
+            changes = {**changes, "order_index": order_index}
+            if gap_thin and self.on_gap_thin:
+                self.on_gap_thin(task.date)
+
+        patched = self.repository.patch(task_id, changes, expected_version)
+        publish_events(self.events, [TaskChangeEvent(EVENT_UPDATE, patched.date, task=patched)])
+        return patched
 
 
 class DeleteTaskUseCase:
     """タスク削除ユースケース"""
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(self, repository: TaskRepository, events: Optional[TaskEventPublisher] = None):
         self.repository = repository
+        self.events = events
 
     def execute(self, task_id: int) -> None:
         """タスクを削除"""
@@ -109,17 +684,384 @@ class DeleteTaskUseCase:
         if not task:
             raise ValueError(f"Task with id {task_id} not found")
         self.repository.delete(task_id)
+        publish_events(self.events, [TaskChangeEvent(EVENT_DELETE, task.date, task_id=task_id)])
 
 
 class UpdateTaskOrderUseCase:
     """タスク順序更新ユースケース"""
 
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
         self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
 
     def execute(self, task_id: int, order_index: int) -> Task:
         """タスクの順序を更新"""
         task = self.repository.get_by_id(task_id)
         if not task:
             raise ValueError(f"Task with id {task_id} not found")
-        return self.repository.update_order(task_id, order_index)
+        if self.order_mode == "gap":
+            # 表示位置の前後の間に入れるため、書き換えるのは移動したタスクの1行のみ
+            order_index, gap_thin = resolve_gap_rank(
+                self.repository, task.date, order_index, exclude_id=task_id
+            )
+            if gap_thin and self.on_gap_thin:
+                self.on_gap_thin(task.date)
+        updated = self.repository.update_order(task_id, order_index)
+        publish_events(self.events, [reorder_event(updated.date, [updated])])
+        return updated
+
+
+class RebalanceTaskOrderUseCase:
+    """タスク順序振り直しユースケース（gapモードの隙間回復用）"""
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.events = events
+
+    def execute(self, task_date: date) -> None:
+        """現在の並び順を保ったまま順序値を振り直す"""
+        self.repository.rebalance_order(task_date, order_step(self.order_mode))
+        # 並び順は変わらないが全タスクの順序値・バージョンが変わるため再取得を促す
+        publish_events(self.events, [TaskChangeEvent(EVENT_INVALIDATE, task_date)])
+
+
+class ReorderTasksUseCase:
+    """日付内タスク一括並び替えユースケース"""
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.events = events
+
+    def execute(self, task_date: date, task_ids: List[int]) -> List[Task]:
+        """指定したID順で日付内のタスク順序を書き換え"""
+        if len(task_ids) != len(set(task_ids)):
+            raise ValueError("Task ids must not contain duplicates")
+        tasks = self.repository.reorder(task_date, task_ids, order_step(self.order_mode))
+        publish_events(self.events, [reorder_event(task_date, tasks)])
+        return tasks
+
+
+@dataclass
+class TaskOperation:
+    """一括処理の1操作（op: create / update / delete）"""
+    op: str
+    task_id: Optional[int] = None
+    date: Optional[date] = None
+    title: Optional[str] = None
+    memo: Optional[str] = None
+    # HH:MM / HH:MM:SS（不正な値はその操作だけをエラーにする）
+    deadline: Optional[str] = None
+    completed: Optional[bool] = None
+    order_index: Optional[int] = None
+
+
+@dataclass
+class TaskOperationResult:
+    """一括処理の1操作ごとの結果"""
+    index: int
+    op: str
+    success: bool
+    task: Optional[Task] = None
+    task_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchTaskUseCase:
+    """タスク一括処理ユースケース"""
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        on_gap_thin: Optional[Callable[[date], None]] = None,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.order_mode = order_mode
+        self.on_gap_thin = on_gap_thin
+        self.events = events
+
+    def _resolve_positions(self, operations: List[TaskOperation], existing: Dict[int, Task]) -> Dict[int, int]:
+        """gapモードで指定されたorder_index（表示位置）を順序値に変換（操作の番号 → 順序値）
+
+        位置は一括処理を適用する前の並びに対して解釈する。対象が不正な操作は本処理でエラーにする。
+        """
+        ranks: Dict[int, int] = {}
+        thin_dates = set()
+        for index, operation in enumerate(operations):
+            if operation.order_index is None:
+                continue
+            if operation.op == "create" and operation.date is not None:
+                task_date, exclude_id = operation.date, None
+            elif operation.op == "update" and operation.task_id in existing:
+                task_date, exclude_id = existing[operation.task_id].date, operation.task_id
+            else:
+                continue
+            ranks[index], gap_thin = resolve_gap_rank(self.repository, task_date, operation.order_index, exclude_id)
+            if gap_thin:
+                thin_dates.add(task_date)
+        if self.on_gap_thin:
+            for task_date in thin_dates:
+                self.on_gap_thin(task_date)
+        return ranks
+
+    def execute(self, operations: List[TaskOperation]) -> List[TaskOperationResult]:
+        """作成・更新・削除を検証し、有効な操作を1トランザクションで適用"""
+        results: List[Optional[TaskOperationResult]] = [None] * len(operations)
+
+        # 更新・削除対象を1クエリでまとめて取得
+        target_ids = [
+            operation.task_id
+            for operation in operations
+            if operation.op in ("update", "delete") and operation.task_id is not None
+        ]
+        existing = {task.id: task for task in self.repository.get_by_ids(target_ids)}
+
+        ranks: Dict[int, int] = {}
+        if self.order_mode == "gap":
+            ranks = self._resolve_positions(operations, existing)
+            if ranks:
+                # 変換中の振り直しで順序値が変わっている場合があるため読み直す
+                existing = {task.id: task for task in self.repository.get_by_ids(target_ids)}
+
+        # order_index未指定の作成は日付ごとの末尾に順番に追加
+        create_dates = [
+            operation.date
+            for operation in operations
+            if operation.op == "create" and operation.date is not None
+        ]
+        step = order_step(self.order_mode)
+        last_order: Dict[date, Optional[int]] = self.repository.get_max_order_indexes(
+            list(set(create_dates))
+        )
+
+        creates: List[Task] = []
+        create_indexes: List[int] = []
+        updates: List[Task] = []
+        update_indexes: List[int] = []
+        delete_ids: List[int] = []
+        delete_indexes: List[int] = []
+        touched_ids = set()
+
+        for index, operation in enumerate(operations):
+            try:
+                if operation.op == "create":
+                    if operation.date is None or operation.title is None:
+                        raise ValueError("date and title are required for create")
+                    deadline = parse_time(operation.deadline)
+                    order_index = ranks.get(index, operation.order_index)
+                    if order_index is None:
+                        order_index = rank_between(last_order[operation.date], None, step)
+                        last_order[operation.date] = order_index
+                    creates.append(Task(
+                        id=0,
+                        date=operation.date,
+                        title=operation.title,
+                        memo=operation.memo,
+                        deadline=deadline,
+                        completed=bool(operation.completed),
+                        order_index=order_index,
+                        created_at=None,
+                        updated_at=None,
+                    ))
+                    create_indexes.append(index)
+                elif operation.op in ("update", "delete"):
+                    if operation.task_id is None:
+                        raise ValueError(f"task_id is required for {operation.op}")
+                    task = existing.get(operation.task_id)
+                    if not task:
+                        raise ValueError(f"Task with id {operation.task_id} not found")
+                    if operation.task_id in touched_ids:
+                        raise ValueError(f"Task with id {operation.task_id} appears more than once")
+                    touched_ids.add(operation.task_id)
+
+                    if operation.op == "delete":
+                        delete_ids.append(operation.task_id)
+                        delete_indexes.append(index)
+                        continue
+
+                    deadline = parse_time(operation.deadline)
+                    order_index = ranks.get(index, operation.order_index)
+                    # 更新するフィールドのみ変更（エンティティのバリデーションを通す）
+                    updated = Task(
+                        id=task.id,
+                        date=task.date,
+                        title=operation.title if operation.title is not None else task.title,
+                        memo=operation.memo if operation.memo is not None else task.memo,
+                        deadline=deadline if deadline is not None else task.deadline,
+                        completed=operation.completed if operation.completed is not None else task.completed,
+                        order_index=order_index if order_index is not None else task.order_index,
+                        created_at=task.created_at,
+                        updated_at=task.updated_at,
+                    )
+                    updates.append(updated)
+                    update_indexes.append(index)
+                else:
+                    raise ValueError(f"Unknown operation: {operation.op}")
+            except ValueError as e:
+                results[index] = TaskOperationResult(
+                    index=index,
+                    op=operation.op,
+                    success=False,
+                    task_id=operation.task_id,
+                    error=str(e),
+                )
+
+        created, updated = self.repository.apply_batch(creates, updates, delete_ids)
+
+        for index, task in zip(create_indexes, created):
+            results[index] = TaskOperationResult(index=index, op="create", success=True, task=task, task_id=task.id)
+        for index, task in zip(update_indexes, updated):
+            results[index] = TaskOperationResult(index=index, op="update", success=True, task=task, task_id=task.id)
+        for index, task_id in zip(delete_indexes, delete_ids):
+            results[index] = TaskOperationResult(index=index, op="delete", success=True, task_id=task_id)
+
+        publish_events(
+            self.events,
+            [TaskChangeEvent(EVENT_CREATE, task.date, task=task) for task in created]
+            + [TaskChangeEvent(EVENT_UPDATE, task.date, task=task) for task in updated]
+            + [TaskChangeEvent(EVENT_DELETE, existing[task_id].date, task_id=task_id) for task_id in delete_ids],
+        )
+
+        return results
+
+
+@dataclass
+class ImportRowError:
+    """インポートで取り込めなかった行"""
+    row: int
+    error: str
+
+
+@dataclass
+class ImportSummary:
+    """インポート結果の集計"""
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+
+
+class ImportTasksUseCase:
+    """タスク一括インポートユースケース
+
+    行をバッチ単位で受け取り、検証してまとめて挿入する。order_indexが未指定の行は
+    日付ごとの末尾からメモリ上で採番する（日付ごとの最終値のみ保持）。
+    """
+
+    # 結果に含めるエラー行の上限（件数はfailedで全て数える）
+    MAX_ERRORS = 100
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        order_mode: str = ORDER_MODE,
+        events: Optional[TaskEventPublisher] = None,
+    ):
+        self.repository = repository
+        self.step = order_step(order_mode)
+        self.events = events
+        self.summary = ImportSummary()
+        self._last_order: Dict[date, Optional[int]] = {}
+
+    def _parse_row(self, row: dict) -> Task:
+        """1行分の値を検証してエンティティに変換"""
+        raw_date = row.get("date")
+        if not raw_date:
+            raise ValueError("date is required")
+        task_date = raw_date if isinstance(raw_date, date) else date.fromisoformat(str(raw_date))
+
+        deadline = row.get("deadline") or None
+        if deadline is not None and not isinstance(deadline, time):
+            deadline = time.fromisoformat(str(deadline))
+
+        completed = row.get("completed")
+        if isinstance(completed, str):
+            completed = completed.strip().lower() in ("1", "true", "yes")
+
+        order_index = row.get("order_index")
+        if order_index in ("", None):
+            order_index = None
+        elif isinstance(order_index, bool) or not isinstance(order_index, (int, str)):
+            raise ValueError("order_index must be an integer")
+        else:
+            order_index = int(order_index)
+            if not MIN_ORDER_INDEX <= order_index <= MAX_ORDER_INDEX:
+                raise ValueError(f"order_index must be between {MIN_ORDER_INDEX} and {MAX_ORDER_INDEX}")
+
+        # JSONの値は型を確かめる（数値・オブジェクトのまま挿入まで進めない）
+        title = row.get("title") or ""
+        if not isinstance(title, str):
+            raise ValueError("title must be a string")
+        memo = row.get("memo") or None
+        if memo is not None and not isinstance(memo, str):
+            raise ValueError("memo must be a string")
+
+        return Task(
+            id=0,
+            date=task_date,
+            title=title,
+            memo=memo,
+            deadline=deadline,
+            completed=bool(completed),
+            order_index=order_index,
+            created_at=None,
+            updated_at=None,
+        )
+
+    def record_error(self, row_number: int, error: str) -> None:
+        """取り込めなかった行を記録（解析エラーなど呼び出し側で検出したものを含む）"""
+        self.summary.failed += 1
+        if len(self.summary.errors) < self.MAX_ERRORS:
+            self.summary.errors.append(ImportRowError(row=row_number, error=error))
+
+    def import_batch(self, rows: List[Tuple[int, dict]]) -> None:
+        """（行番号, 値）のバッチを検証して一括挿入"""
+        tasks: List[Tuple[int, Task]] = []
+        for row_number, row in rows:
+            try:
+                tasks.append((row_number, self._parse_row(row)))
+            except (ValueError, TypeError) as e:
+                self.record_error(row_number, str(e))
+
+        # 初めて出てきた日付のみ現在の最終order_indexを問い合わせる
+        new_dates = list({task.date for _, task in tasks if task.date not in self._last_order})
+        self._last_order.update(self.repository.get_max_order_indexes(new_dates))
+        valid: List[Task] = []
+        for row_number, task in tasks:
+            if task.order_index is None:
+                task.order_index = rank_between(self._last_order[task.date], None, self.step)
+                # 末尾の順序値が列の上限を超える場合（gapモードで大きな値が続いたときなど）
+                if task.order_index > MAX_ORDER_INDEX:
+                    self.record_error(row_number, "order_index exceeds the maximum; rebalance the date first")
+                    continue
+            last = self._last_order[task.date]
+            self._last_order[task.date] = task.order_index if last is None else max(last, task.order_index)
+            valid.append(task)
+        tasks = valid
+
+        self.summary.imported += self.repository.insert_many(tasks)
+        # 件数が多いため差分は送らず、触れた日付の再取得を促す
+        publish_events(
+            self.events,
+            [TaskChangeEvent(EVENT_INVALIDATE, task_date) for task_date in sorted({task.date for task in tasks})],
+        )
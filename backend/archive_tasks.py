@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+古い完了済みタスクのアーカイブスクリプト
+
+一定期間より前の日付の完了済みタスクを tasks から tasks_archive に移し、tasks とその
+インデックスを最近の日付の分だけに保ちます。アーカイブ済みのタスクもAPIからは
+これまでどおり読み取れ、編集するとその日付のタスクが tasks に戻ります。
+件数を区切って別トランザクションで移し、バッチの間に待つため、業務時間中にも実行できます。
+
+使用方法:
+    python archive_tasks.py [オプション]
+
+例:
+    # 移す件数を確認するだけ（変更しない）
+    python archive_tasks.py --dry-run
+
+    # 90日（ARCHIVE_AFTER_DAYS）より前の完了済みタスクをアーカイブ
+    python archive_tasks.py
+
+    # 1年より前を、200件ずつ1秒おきに、最大50バッチまで
+    python archive_tasks.py --older-than-days 365 --batch-size 200 --pause 1 --max-batches 50
+"""
+
+import argparse
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 既定値（環境変数）はユースケースと共通。ユースケースはDBに接続しないため先に読み込める
+from app.usecases.task_usecases import (
+    ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_PAUSE_SECONDS, ARCHIVE_BATCH_SIZE, ArchiveTasksUseCase,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="古い完了済みタスクのアーカイブ")
+    parser.add_argument(
+        "--older-than-days", type=int, default=ARCHIVE_AFTER_DAYS,
+        help="この日数より前の日付をアーカイブ（未指定時はARCHIVE_AFTER_DAYS、既定90）",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=ARCHIVE_BATCH_SIZE,
+        help="1トランザクションで移す件数（未指定時はARCHIVE_BATCH_SIZE、既定500）",
+    )
+    parser.add_argument(
+        "--pause", type=float, default=ARCHIVE_BATCH_PAUSE_SECONDS,
+        help="バッチの間に待つ秒数（未指定時はARCHIVE_BATCH_PAUSE_SECONDS、既定0.5）",
+    )
+    parser.add_argument("--max-batches", type=int, help="実行するバッチ数の上限（残りは次回に移す）")
+    parser.add_argument("--dry-run", action="store_true", help="移す件数を表示するだけで変更しない")
+    parser.add_argument("--database-url", help="対象のデータベース（未指定時はDATABASE_URL）")
+    args = parser.parse_args()
+
+    # app をインポートする前に接続先を決める
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.infrastructure.database import Base, SessionLocal, engine
+    from app.infrastructure.task_repository import SQLAlchemyTaskRepository
+
+    def report(summary):
+        print(f"  batch {summary.batches}: {summary.tasks}件（{summary.last_date}まで）", flush=True)
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        summary = ArchiveTasksUseCase(SQLAlchemyTaskRepository(db)).execute(
+            args.older_than_days,
+            batch_size=args.batch_size,
+            pause_seconds=args.pause,
+            max_batches=args.max_batches,
+            dry_run=args.dry_run,
+            on_batch=report,
+        )
+    except ValueError as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if summary.dry_run:
+        print(
+            f"🔍 {summary.before}より前の完了済みタスク: {summary.tasks}件"
+            + (f"（{summary.first_date}〜{summary.last_date}）" if summary.tasks else "")
+            + f"、{summary.batches}バッチ（変更していません）"
+        )
+    else:
+        print(f"📦 {summary.before}より前の完了済みタスクをアーカイブしました: {summary.tasks}件、{summary.batches}バッチ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+タスク一覧の読み取り経路のマイクロベンチマーク
+
+ORMモデル → エンティティ → Pydanticスキーマ → JSON の従来経路と、
+列指定のselect → orjson の読み取り専用経路を比較します。
+
+使用方法:
+    python benchmarks/list_read_path.py [--tasks 200] [--repeat 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 未指定の場合はインメモリSQLiteで計測
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import orjson
+from sqlalchemy import insert
+
+from app.infrastructure.database import Base, SessionLocal, engine
+from app.infrastructure.models import TaskModel
+from app.infrastructure.task_repository import SQLAlchemyTaskRepository
+from app.presentation.controllers import task_to_response
+from app.presentation.schemas import TaskListResponse
+
+TARGET_DATE = date(2024, 1, 1)
+
+
+def seed(num_tasks: int) -> None:
+    """計測対象の日付にタスクを作成"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.query(TaskModel).filter(TaskModel.date == TARGET_DATE).delete()
+        now = datetime.now()
+        db.execute(insert(TaskModel), [
+            {
+                "date": TARGET_DATE,
+                "title": f"タスク{i}",
+                "memo": "メモ" * (i % 20),
+                "deadline": None,
+                "completed": i % 3 == 0,
+                "order_index": i,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(num_tasks)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def orm_path(repository: SQLAlchemyTaskRepository) -> bytes:
+    """従来経路: ORM → エンティティ → TaskResponse → JSON"""
+    tasks = repository.get_by_date(TARGET_DATE)
+    return TaskListResponse(tasks=[task_to_response(task) for task in tasks]).model_dump_json().encode()
+
+
+def row_path(repository: SQLAlchemyTaskRepository) -> bytes:
+    """読み取り専用経路: 列指定select → orjson"""
+    return orjson.dumps({"tasks": repository.get_rows_by_date(TARGET_DATE)})
+
+
+def measure(func, repeat: int) -> float:
+    """1回あたりの平均実行時間（ミリ秒）"""
+    db = SessionLocal()
+    try:
+        repository = SQLAlchemyTaskRepository(db)
+        func(repository)  # ウォームアップ
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(repository)
+            db.expunge_all()
+        return (time.perf_counter() - start) / repeat * 1000
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="タスク一覧の読み取り経路の比較")
+    parser.add_argument("--tasks", type=int, default=200, help="1日あたりのタスク数")
+    parser.add_argument("--repeat", type=int, default=500, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    seed(args.tasks)
+    orm_ms = measure(orm_path, args.repeat)
+    row_ms = measure(row_path, args.repeat)
+    print(f"tasks/day: {args.tasks}, repeat: {args.repeat}")
+    print(f"ORM → entity → Pydantic: {orm_ms:8.3f} ms")
+    print(f"select(columns) → orjson: {row_ms:8.3f} ms")
+    print(f"speedup: {orm_ms / row_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
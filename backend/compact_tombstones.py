@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+差分同期の削除記録（task_tombstones）の圧縮スクリプト
+
+保持期間を過ぎた削除記録を削除します。削除した範囲より古いカーソルで
+GET /api/v1/tasks/changes を呼んだクライアントには410が返り、全件を取得し直します。
+cronなどで定期的に実行してください。
+
+使用方法:
+    python compact_tombstones.py [オプション]
+
+例:
+    # 30日（TOMBSTONE_RETENTION_DAYS）より前の削除記録を削除
+    python compact_tombstones.py
+
+    # 7日より前の削除記録を削除
+    python compact_tombstones.py --retention-days 7
+"""
+
+import argparse
+import os
+import sys
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 削除記録の保持日数（クライアントがこれより長くオフラインだった場合は全件を再取得する）
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+
+def compact(retention_days: int) -> int:
+    """保持期間を過ぎた削除記録を削除して件数を返す"""
+    from app.infrastructure.database import SessionLocal
+    from app.infrastructure.task_repository import SQLAlchemyTaskRepository
+    from app.usecases.task_usecases import CompactTombstonesUseCase
+
+    db = SessionLocal()
+    try:
+        return CompactTombstonesUseCase(SQLAlchemyTaskRepository(db)).execute(retention_days)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="差分同期の削除記録の圧縮")
+    parser.add_argument(
+        "--retention-days", type=int, default=TOMBSTONE_RETENTION_DAYS,
+        help="削除記録の保持日数（未指定時はTOMBSTONE_RETENTION_DAYS、既定30）",
+    )
+    parser.add_argument("--database-url", help="対象のデータベース（未指定時はDATABASE_URL）")
+    args = parser.parse_args()
+
+    # app をインポートする前に接続先を決める
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    try:
+        purged = compact(args.retention_days)
+    except ValueError as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+    print(f"🗑  削除記録を圧縮しました: {purged}件")
+
+
+if __name__ == "__main__":
+    main()
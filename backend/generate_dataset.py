@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+負荷試験・スケーリング検証用の合成データ生成スクリプト
+
+APIを経由せず、リポジトリの一括挿入（executemany）で大量のタスクを書き込みます。
+同じ引数・同じシードであれば常に同じデータを生成します。
+
+使用方法:
+    python generate_dataset.py [オプション]
+
+例:
+    # 直近3年分、1日平均40件（約4万件）
+    python generate_dataset.py --start 2022-01-01 --end 2024-12-31 --tasks-per-day 40
+
+    # 約300万件、メモ多め、既存データを消してから生成
+    python generate_dataset.py --days 3650 --tasks-per-day 800 --memo-ratio 0.8 --memo-mean 500 --clear
+"""
+
+import argparse
+import os
+import random
+import sys
+import time as time_module
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List, Optional
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+TITLE_VERBS = ["資料作成", "レビュー", "打ち合わせ", "メール返信", "調査", "実装", "テスト", "見積もり", "報告", "準備"]
+TITLE_NOUNS = ["プロジェクトA", "週次定例", "顧客対応", "予算", "採用面接", "リリース", "請求書", "勉強会", "経費精算", "設計書"]
+MEMO_WORDS = ["確認する", "先方に連絡", "資料は共有フォルダ", "期限に注意", "前回の議事録を参照", "TODO", "要相談", "完了後に報告"]
+
+
+@dataclass
+class DatasetConfig:
+    """生成するデータの分布"""
+    start: date
+    end: date
+    tasks_per_day: float = 20.0
+    # 1日あたりの件数のばらつき（標準偏差 / 平均）
+    tasks_jitter: float = 0.5
+    # メモを持つタスクの割合と、メモの長さ（指数分布）の平均・上限
+    memo_ratio: float = 0.5
+    memo_mean: int = 120
+    memo_max: int = 10000
+    completed_ratio: float = 0.6
+    deadline_ratio: float = 0.3
+    seed: int = 42
+
+
+class TaskGenerator:
+    """設定とシードから決まった順序でタスクを生成する"""
+
+    def __init__(self, config: DatasetConfig, step: int = 1):
+        self.config = config
+        self.step = step
+        self.rng = random.Random(config.seed)
+        # メモ本文は長い元テキストの一部を切り出して作る（1文字ずつ乱数を使わない）
+        words = [self.rng.choice(MEMO_WORDS) for _ in range(config.memo_max // 2 + 1)]
+        self.memo_source = "。".join(words)[: config.memo_max * 2]
+
+    def count_for_day(self) -> int:
+        mean = self.config.tasks_per_day
+        return max(0, round(self.rng.gauss(mean, mean * self.config.tasks_jitter)))
+
+    def memo(self) -> Optional[str]:
+        if self.rng.random() >= self.config.memo_ratio:
+            return None
+        length = min(self.config.memo_max, max(1, int(self.rng.expovariate(1 / self.config.memo_mean))))
+        offset = self.rng.randrange(0, len(self.memo_source) - length + 1)
+        return self.memo_source[offset:offset + length]
+
+    def deadline(self) -> Optional[time]:
+        if self.rng.random() >= self.config.deadline_ratio:
+            return None
+        # 15分刻みの業務時間帯
+        minutes = self.rng.randrange(8 * 4, 22 * 4) * 15
+        return time(minutes // 60, minutes % 60)
+
+    def iter_tasks(self) -> Iterator["Task"]:
+        from app.domain.entities import Task
+
+        task_date = self.config.start
+        while task_date <= self.config.end:
+            for index in range(self.count_for_day()):
+                yield Task(
+                    id=0,
+                    date=task_date,
+                    title=f"{self.rng.choice(TITLE_NOUNS)}の{self.rng.choice(TITLE_VERBS)} #{index + 1}",
+                    memo=self.memo(),
+                    deadline=self.deadline(),
+                    completed=self.rng.random() < self.config.completed_ratio,
+                    order_index=index * self.step,
+                    created_at=None,
+                    updated_at=None,
+                )
+            task_date += timedelta(days=1)
+
+
+def generate(config: DatasetConfig, batch_size: int = 5000, clear: bool = False, verbose: bool = True) -> int:
+    """設定に従ってタスクを生成し、batch_size件ずつ一括挿入する（挿入件数を返す）"""
+    from sqlalchemy import and_
+    from app.domain.ordering import ORDER_MODE, order_step
+    from app.infrastructure.database import Base, SessionLocal, engine
+    from app.infrastructure.models import TaskArchiveModel, TaskModel
+    from app.infrastructure.task_repository import (
+        SQLAlchemyTaskRepository, bump_date_revisions, record_tombstones, refresh_daily_stats, restore_archived,
+    )
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if clear:
+            in_range = and_(TaskModel.date >= config.start, TaskModel.date <= config.end)
+            cleared_dates = [config.start + timedelta(days=i) for i in range((config.end - config.start).days + 1)]
+            bump_date_revisions(db, cleared_dates)
+            restore_archived(db, and_(TaskArchiveModel.date >= config.start, TaskArchiveModel.date <= config.end))
+            record_tombstones(db, in_range)
+            deleted = (
+                db.query(TaskModel)
+                .filter(in_range)
+                .delete(synchronize_session=False)
+            )
+            refresh_daily_stats(db, cleared_dates)
+            db.commit()
+            if verbose:
+                print(f"🗑  既存のタスクを削除しました: {deleted}件")
+
+        repository = SQLAlchemyTaskRepository(db)
+        generator = TaskGenerator(config, order_step(ORDER_MODE))
+        started = time_module.perf_counter()
+        inserted = 0
+        batch: List = []
+        for task in generator.iter_tasks():
+            batch.append(task)
+            if len(batch) >= batch_size:
+                inserted += repository.insert_many(batch)
+                batch = []
+                if verbose:
+                    elapsed = time_module.perf_counter() - started
+                    print(f"   {inserted:>10,}件 ({inserted / elapsed:,.0f}件/秒)", end="\r")
+        inserted += repository.insert_many(batch)
+    finally:
+        db.close()
+
+    if verbose:
+        elapsed = time_module.perf_counter() - started
+        print(f"✅ {inserted:,}件のタスクを作成しました: {config.start} 〜 {config.end} ({elapsed:.1f}秒)")
+    return inserted
+
+
+def parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError("日付はYYYY-MM-DD形式で指定してください")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="合成タスクデータの生成")
+    parser.add_argument("--start", type=parse_date, help="開始日（未指定時は終了日の--days日前）")
+    parser.add_argument("--end", type=parse_date, help="終了日（未指定時は今日）")
+    parser.add_argument("--days", type=int, default=365, help="--start未指定時の日数")
+    parser.add_argument("--tasks-per-day", type=float, default=20.0, help="1日あたりの平均タスク数")
+    parser.add_argument("--tasks-jitter", type=float, default=0.5, help="1日あたりの件数のばらつき（標準偏差/平均）")
+    parser.add_argument("--memo-ratio", type=float, default=0.5, help="メモを持つタスクの割合")
+    parser.add_argument("--memo-mean", type=int, default=120, help="メモの平均文字数")
+    parser.add_argument("--memo-max", type=int, default=10000, help="メモの最大文字数")
+    parser.add_argument("--completed-ratio", type=float, default=0.6, help="完了済みタスクの割合")
+    parser.add_argument("--deadline-ratio", type=float, default=0.3, help="期限時刻を持つタスクの割合")
+    parser.add_argument("--seed", type=int, default=42, help="乱数シード")
+    parser.add_argument("--batch-size", type=int, default=5000, help="1回のINSERTで挿入する件数")
+    parser.add_argument("--clear", action="store_true", help="期間内の既存タスクを削除してから生成")
+    parser.add_argument("--database-url", help="書き込み先（未指定時はDATABASE_URL）")
+    args = parser.parse_args()
+
+    # app をインポートする前に接続先を決める
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    end = args.end or date.today()
+    start = args.start or end - timedelta(days=args.days - 1)
+    if start > end:
+        print("❌ エラー: 開始日は終了日以前を指定してください")
+        sys.exit(1)
+
+    config = DatasetConfig(
+        start=start,
+        end=end,
+        tasks_per_day=args.tasks_per_day,
+        tasks_jitter=args.tasks_jitter,
+        memo_ratio=args.memo_ratio,
+        memo_mean=args.memo_mean,
+        memo_max=args.memo_max,
+        completed_ratio=args.completed_ratio,
+        deadline_ratio=args.deadline_ratio,
+        seed=args.seed,
+    )
+    generate(config, batch_size=args.batch_size, clear=args.clear)
+
+
+if __name__ == "__main__":
+    main()
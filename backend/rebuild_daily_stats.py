@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+日付ごとの集計（daily_task_stats）の作り直し・検証スクリプト
+
+集計テーブルはタスクの書き込みと同じトランザクションで更新されますが、
+テーブルの追加前のデータの取り込み（バックフィル）や、直接SQLで変更した後の修復に使います。
+
+使用方法:
+    python rebuild_daily_stats.py [オプション]
+
+例:
+    # 全期間を作り直す（31日ずつ別トランザクション）
+    python rebuild_daily_stats.py
+
+    # 集計テーブルとタスクを比較（不一致があれば終了コード1）
+    python rebuild_daily_stats.py --verify --start 2024-01-01 --end 2024-12-31
+"""
+
+import argparse
+import os
+import sys
+from datetime import date
+
+# プロジェクトのルートディレクトリをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日付ごとの集計の作り直し・検証")
+    parser.add_argument("--start", type=parse_date, help="開始日（未指定時はデータの最初の日付）")
+    parser.add_argument("--end", type=parse_date, help="終了日（未指定時はデータの最後の日付）")
+    parser.add_argument("--chunk-days", type=int, default=31, help="1トランザクションで処理する日数")
+    parser.add_argument("--verify", action="store_true", help="作り直さずにタスクと比較する")
+    parser.add_argument("--database-url", help="対象のデータベース（未指定時はDATABASE_URL）")
+    args = parser.parse_args()
+
+    # app をインポートする前に接続先を決める
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.infrastructure.database import Base, SessionLocal, engine
+    from app.infrastructure.task_repository import SQLAlchemyTaskRepository
+    from app.usecases.task_usecases import RebuildDailyStatsUseCase
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        usecase = RebuildDailyStatsUseCase(SQLAlchemyTaskRepository(db))
+        if args.verify:
+            mismatches = usecase.verify(args.start, args.end, args.chunk_days)
+            for mismatch in mismatches:
+                print(f"  {mismatch.date}: expected {mismatch.expected}, stored {mismatch.actual}")
+            if mismatches:
+                print(f"❌ 集計が一致しない日付: {len(mismatches)}件（--verifyなしで実行すると作り直します）")
+                sys.exit(1)
+            print("✅ 集計はタスクと一致しています")
+        else:
+            rows = usecase.rebuild(args.start, args.end, args.chunk_days)
+            print(f"✅ 集計を作り直しました: {rows}日分")
+    except ValueError as e:
+        print(f"❌ エラー: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
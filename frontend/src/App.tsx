@@ -46,7 +46,6 @@ function App() {
         title,
         memo: null,
         deadline: null,
-        order_index: tasks.length,
       };
 
       await taskApi.createTask(newTask);
@@ -0,0 +1,42 @@
+import { Task } from './entities';
+
+/**
+ * タスクの変更通知（バックエンドの /api/v1/tasks/events から届く差分）
+ */
+export type TaskEvent =
+  | { type: 'create' | 'update'; date: string; task: Task }
+  | { type: 'delete'; date: string; task_id: number }
+  | { type: 'reorder'; date: string; order: [number, number, number][] }
+  | { type: 'invalidate'; date: string }
+  | { type: 'resync'; dates: string[] };
+
+/**
+ * 差分を表示中のタスク一覧に適用する（invalidate / resync は呼び出し側で再取得する）
+ */
+export function applyTaskEvent(tasks: Task[], event: TaskEvent, showCompleted: boolean): Task[] {
+  let next = tasks;
+  switch (event.type) {
+    case 'create':
+    case 'update': {
+      // 再取得後に同じ差分が届くこともあるため、IDで置き換える
+      next = tasks.filter((task) => task.id !== event.task.id);
+      if (showCompleted || !event.task.completed) {
+        next = [...next, event.task];
+      }
+      break;
+    }
+    case 'delete':
+      next = tasks.filter((task) => task.id !== event.task_id);
+      break;
+    case 'reorder': {
+      const orders = new Map(event.order.map(([id, orderIndex]) => [id, orderIndex]));
+      next = tasks.map((task) =>
+        orders.has(task.id) ? { ...task, order_index: orders.get(task.id)! } : task
+      );
+      break;
+    }
+    default:
+      return tasks;
+  }
+  return [...next].sort((a, b) => a.order_index - b.order_index || a.id - b.id);
+}
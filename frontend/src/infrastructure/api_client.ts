@@ -1,6 +1,7 @@
 import axios, { AxiosInstance } from 'axios';
 import { Task } from '../domain/entities';
 import { TaskRepository } from '../domain/repositories';
+import { installPrimaryPin } from './primary_pin';
 
 /**
  * APIクライアント実装（Infrastructure層）
@@ -15,6 +16,7 @@ export class ApiTaskRepository implements TaskRepository {
         'Content-Type': 'application/json',
       },
     });
+    installPrimaryPin(this.api);
   }
 
   async getTasks(date: string, showCompleted: boolean = true): Promise<Task[]> {
@@ -0,0 +1,30 @@
+import { AxiosInstance } from 'axios';
+
+// 書き込みのレスポンスで受け取り、以降のリクエストで送り返すヘッダー（期限のUNIX時刻・秒）
+const PRIMARY_PIN_HEADER = 'x-primary-until';
+
+// 全てのAPIクライアントで共有する期限（同じバックエンドへの書き込みの後は、どのクライアントの読み取りも固定する）
+let primaryUntil = 0;
+
+/**
+ * 読み取りレプリカ利用時に、自分の書き込みをすぐ読めるようにする（Infrastructure層）
+ *
+ * レンダラー（localhost:5173 / file://）とAPIはオリジンが異なりクッキーが送られないため、
+ * 書き込みのレスポンスヘッダーの期限を保持し、期限内のリクエストにヘッダーで付けて
+ * バックエンドに読み取りをプライマリで行わせる。
+ */
+export function installPrimaryPin(api: AxiosInstance): void {
+  api.interceptors.request.use((config) => {
+    if (primaryUntil > Date.now() / 1000) {
+      config.headers.set(PRIMARY_PIN_HEADER, String(primaryUntil));
+    }
+    return config;
+  });
+  api.interceptors.response.use((response) => {
+    const until = Number(response.headers[PRIMARY_PIN_HEADER]);
+    if (until > primaryUntil) {
+      primaryUntil = until;
+    }
+    return response;
+  });
+}
@@ -0,0 +1,72 @@
+import { TaskEvent } from '../domain/events';
+
+/**
+ * タスクの変更通知を受け取るWebSocketクライアント（Infrastructure層）
+ *
+ * 切断時は間隔を伸ばしながら再接続し、再接続後は購読中の日付を送り直す。
+ */
+export class TaskEventClient {
+  private socket: WebSocket | null = null;
+  private dates: string[] = [];
+  private retryDelay = 500;
+  private reconnecting = false;
+  private closed = false;
+
+  constructor(
+    private onEvent: (event: TaskEvent) => void,
+    private onReconnect: () => void = () => {},
+    private url: string = 'ws://localhost:8000/api/v1/tasks/events'
+  ) {}
+
+  connect(): void {
+    this.closed = false;
+    const socket = new WebSocket(this.url);
+    socket.onopen = () => {
+      this.retryDelay = 500;
+      this.sendSubscription();
+      // 切断中の変更は届いていないため再取得する
+      if (this.reconnecting) {
+        this.reconnecting = false;
+        this.onReconnect();
+      }
+    };
+    socket.onmessage = (message) => {
+      const event = JSON.parse(message.data);
+      if (event.type === 'subscribed' || event.type === 'error') {
+        return;
+      }
+      this.onEvent(event as TaskEvent);
+    };
+    socket.onclose = () => {
+      this.socket = null;
+      if (this.closed) {
+        return;
+      }
+      this.reconnecting = true;
+      setTimeout(() => this.connect(), this.retryDelay);
+      this.retryDelay = Math.min(this.retryDelay * 2, 30000);
+    };
+    this.socket = socket;
+  }
+
+  close(): void {
+    this.closed = true;
+    this.socket?.close();
+  }
+
+  /** 接続中であれば差分が届くため、操作後の再取得を省略できる */
+  isConnected(): boolean {
+    return this.socket?.readyState === WebSocket.OPEN;
+  }
+
+  subscribe(dates: string[]): void {
+    this.dates = dates;
+    this.sendSubscription();
+  }
+
+  private sendSubscription(): void {
+    if (this.isConnected()) {
+      this.socket!.send(JSON.stringify({ dates: this.dates }));
+    }
+  }
+}
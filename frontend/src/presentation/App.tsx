@@ -1,8 +1,10 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { format, parseISO } from 'date-fns';
 import { FaChevronLeft, FaChevronRight } from 'react-icons/fa';
 import { Task } from '../domain/entities';
+import { applyTaskEvent, TaskEvent } from '../domain/events';
 import { ApiTaskRepository } from '../infrastructure/api_client';
+import { TaskEventClient } from '../infrastructure/task_event_client';
 import {
   GetTasksUseCase,
   CreateTaskUseCase,
@@ -53,6 +55,42 @@ function App() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [selectedDate, showCompleted]);
 
+  // 変更通知の購読（他のウィンドウでの変更も差分で反映し、操作後の再取得を省く）
+  const eventClientRef = useRef<TaskEventClient | null>(null);
+  const handleEventRef = useRef<(event: TaskEvent) => void>(() => {});
+  handleEventRef.current = (event: TaskEvent) => {
+    // 日付を切り替えた直後に前の日付の通知が届くことがある
+    if (event.type !== 'resync' && event.date !== selectedDate) {
+      return;
+    }
+    if (event.type === 'invalidate' || event.type === 'resync') {
+      fetchTasks();
+      return;
+    }
+    setTasks((current) => applyTaskEvent(current, event, showCompleted));
+  };
+
+  useEffect(() => {
+    const client = new TaskEventClient(
+      (event) => handleEventRef.current(event),
+      () => handleEventRef.current({ type: 'resync', dates: [] })
+    );
+    client.connect();
+    eventClientRef.current = client;
+    return () => client.close();
+  }, []);
+
+  useEffect(() => {
+    eventClientRef.current?.subscribe([selectedDate]);
+  }, [selectedDate]);
+
+  // 変更通知が届かない場合（未接続）のみ操作後に再取得する
+  const refreshIfDisconnected = () => {
+    if (!eventClientRef.current?.isConnected()) {
+      fetchTasks();
+    }
+  };
+
   // タスク作成
   const handleCreateTask = async (title: string) => {
     try {
@@ -61,10 +99,9 @@ function App() {
         title,
         memo: null,
         deadline: null,
-        order_index: tasks.length,
       });
       setShowForm(false);
-      fetchTasks();
+      refreshIfDisconnected();
     } catch (error) {
       console.error('Failed to create task:', error);
       alert('タスクの作成に失敗しました');
@@ -92,7 +129,7 @@ function App() {
         setScrollToNextIncomplete(null);
       }
 
-      fetchTasks();
+      refreshIfDisconnected();
     } catch (error) {
       console.error('Failed to update task:', error);
       alert('タスクの更新に失敗しました');
@@ -103,7 +140,7 @@ function App() {
   const handleDeleteTask = async (taskId: number) => {
     try {
       await deleteTaskUseCase.execute(taskId);
-      fetchTasks();
+      refreshIfDisconnected();
     } catch (error) {
       console.error('Failed to delete task:', error);
       alert('タスクの削除に失敗しました');
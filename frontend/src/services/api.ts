@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { Task, TaskCreate, TaskUpdate } from '../types/task';
+import { installPrimaryPin } from '../infrastructure/primary_pin';
 
 const API_BASE_URL = 'http://localhost:8000';
 
@@ -9,6 +10,7 @@ const api = axios.create({
     'Content-Type': 'application/json',
   },
 });
+installPrimaryPin(api);
 
 export const taskApi = {
   // 日付別タスク一覧取得